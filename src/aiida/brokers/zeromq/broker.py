@@ -16,7 +16,8 @@ from aiida.common.log import AIIDA_LOGGER
 
 from .communicator import ZeromqCommunicator
 from .defaults import BROKER_READY_TIMEOUT
-from .queue import PersistentQueue
+from .protocol import Payload
+from .queue import QUEUE_ENGINES, TaskQueue, open_task_queue
 from .service import PID_SENTINEL, ZeromqBrokerService
 
 if t.TYPE_CHECKING:
@@ -49,6 +50,17 @@ class ZeromqBroker(Broker):
             # which set this to ``False`` and manage the service lifecycle themselves.
             expose_cli=False,
         ),
+        BrokerConfigField(
+            name='queue_engine',
+            prompt='Task queue engine',
+            help=(
+                'Storage engine of the persistent task queue: `folder` stores one file per task, `segment_log` appends '
+                'tasks to a segment log which scales better to large numbers of queued tasks.'
+            ),
+            default=QUEUE_ENGINES[0],
+            param_type='choice',
+            choices=QUEUE_ENGINES,
+        ),
     )
 
     def __init__(self, profile: Profile) -> None:
@@ -184,19 +196,35 @@ class ZeromqBroker(Broker):
             self._communicator = ZeromqCommunicator(
                 router_endpoint=router_endpoint,
                 task_timeout=get_config_option('broker.task_timeout'),
+                task_prefetch_count=get_config_option('daemon.worker_process_slots'),
             )
             self._communicator.start()
 
         return self._communicator
 
+    @property
+    def queue_engine(self) -> str:
+        """Return the name of the task queue engine configured for the profile."""
+        return self._profile.process_control_config.get('queue_engine', QUEUE_ENGINES[0])
+
+    def open_task_queue(self) -> TaskQueue:
+        """Open the persistent task queue of the broker service directly on disk.
+
+        This bypasses the broker service and must only be used while the service is not running.
+        """
+        return open_task_queue(self._storage_path / 'tasks', self.queue_engine)
+
     def iterate_tasks(self) -> t.Iterator[t.Any]:
         queue_path = self._storage_path / 'tasks'
         if not queue_path.exists():
             return
 
-        queue = PersistentQueue(queue_path)
-        for task_id, task_data in queue.get_all_pending():
-            yield ZeromqIncomingTask(task_id, task_data, queue)
+        queue = self.open_task_queue()
+        try:
+            for task_id, task_data in queue.get_all_pending():
+                yield ZeromqIncomingTask(task_id, task_data, queue)
+        finally:
+            queue.close()
 
     def close(self) -> None:
         if self._communicator is not None:
@@ -213,12 +241,13 @@ class ZeromqBroker(Broker):
 class ZeromqIncomingTask:
     """Wrapper providing an interface compatible with RabbitMQ incoming tasks."""
 
-    def __init__(self, task_id: str, task_data: dict[str, t.Any], queue: PersistentQueue) -> None:
+    def __init__(self, task_id: str, task_data: dict[str, t.Any], queue: TaskQueue) -> None:
         self._task_id = task_id
         self._task_data = task_data
         self._queue = queue
 
-        self.body = task_data.get('body')
+        payload = task_data.get('payload')
+        self.body = Payload.from_dict(payload).decode() if payload else task_data.get('body')
 
     @contextmanager
     def processing(self) -> t.Iterator[t.Any]:
@@ -17,7 +17,9 @@ pattern as kiwipy's ``RmqThreadCommunicator``.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
 import threading
 import uuid
 from collections.abc import Callable
@@ -32,8 +34,9 @@ import zmq.asyncio
 from .defaults import LOOP_JOIN_TIMEOUT, LOOP_TIMEOUT
 from .protocol import (
     MessageType,
-    decode_message,
-    encode_message,
+    decode_frames,
+    encode_frames,
+    get_codec,
     make_broadcast_message,
     make_rpc_message,
     make_rpc_response,
@@ -48,6 +51,63 @@ _LOGGER = logging.getLogger(__name__)
 _T = TypeVar('_T')
 
 
+def _find_broadcast_filter(subscriber: Any, depth: int = 3) -> kiwipy.BroadcastFilter | None:
+    """Return the :class:`kiwipy.BroadcastFilter` that ``subscriber`` is or wraps, if any.
+
+    ``plumpy.LoopCommunicator`` wraps subscribers in closures that schedule them on its event loop, so the closures
+    and partials around the subscriber are searched up to ``depth`` levels deep.
+    """
+    if isinstance(subscriber, kiwipy.BroadcastFilter):
+        return subscriber
+    if depth == 0:
+        return None
+    if isinstance(subscriber, functools.partial):
+        return _find_broadcast_filter(subscriber.func, depth - 1)
+    for cell in getattr(subscriber, '__closure__', None) or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            continue
+        if callable(contents) and (found := _find_broadcast_filter(contents, depth - 1)) is not None:
+            return found
+    return None
+
+
+def get_broadcast_filter_spec(subscriber: Any) -> dict[str, list[dict[str, Any]]] | None:
+    """Return the filter specification of a broadcast subscriber, to let the broker filter broadcasts on its side.
+
+    Patterns of a :class:`kiwipy.BroadcastFilter` are either compiled regular expressions or values compared by
+    equality. Anything that cannot be expressed in the specification makes the subscriber receive all broadcasts, which
+    is always correct since the subscriber applies its own filter again when called.
+
+    :return: The specification as accepted by :func:`~aiida.brokers.zeromq.protocol.compile_broadcast_filter`, or
+        ``None`` if the subscriber should receive all broadcasts.
+    """
+    broadcast_filter = _find_broadcast_filter(subscriber)
+    if broadcast_filter is None:
+        return None
+
+    spec: dict[str, list[dict[str, Any]]] = {}
+
+    for field, checks in (('subject', broadcast_filter._subject_filters), ('sender', broadcast_filter._sender_filters)):
+        patterns = []
+        for check in checks:
+            pattern = getattr(check, '__self__', None)
+            if isinstance(pattern, re.Pattern) and isinstance(pattern.pattern, str):
+                patterns.append({'regex': pattern.pattern, 'flags': int(pattern.flags)})
+                continue
+            cells = getattr(check, '__closure__', None) or ()
+            value = cells[0].cell_contents if len(cells) == 1 else None
+            if isinstance(value, (str, int, float)):
+                patterns.append({'value': value})
+                continue
+            return None
+        if patterns:
+            spec[field] = patterns
+
+    return spec
+
+
 class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
     """ZeroMQ client implementing kiwipy Communicator interface.
 
@@ -69,10 +129,24 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
         router_endpoint: str,
         client_id: str | None = None,
         task_timeout: float | None = None,
+        task_prefetch_count: int | None = None,
+        codec: str | None = None,
     ):
+        """Construct a new communicator.
+
+        :param router_endpoint: Endpoint of the broker ROUTER socket.
+        :param client_id: Identity of the client, a random one is generated if not specified.
+        :param task_timeout: Timeout in seconds for tasks and RPCs that expect a reply.
+        :param task_prefetch_count: Maximum number of unacknowledged tasks the broker dispatches to this client at once.
+            ``None`` means no limit.
+        :param codec: Name of the codec used to encode messages, see :data:`~aiida.brokers.zeromq.protocol.CODECS`.
+            Defaults to the preferred available codec.
+        """
         self._router_endpoint = router_endpoint
         self._client_id = client_id or f'client-{uuid.uuid4().hex[:8]}'
         self._task_timeout = task_timeout
+        self._task_prefetch_count = task_prefetch_count
+        self._codec = get_codec(codec)
 
         # ZeroMQ sockets (created on the event loop thread)
         self._context: zmq.asyncio.Context | None = None
@@ -244,6 +318,14 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
                 pass
         self._rpc_subscribers.clear()
 
+        for identifier in list(self._broadcast_subscribers):
+            try:
+                msg = make_subscribe_message(MessageType.UNSUBSCRIBE_BROADCAST, self._client_id, identifier)
+                self._send(msg)
+            except Exception:
+                pass
+        self._broadcast_subscribers.clear()
+
         # Cancel pending futures and their timeouts
         for handle in self._timeout_handles.values():
             handle.cancel()
@@ -343,7 +425,9 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
         def _do() -> str:
             ident = identifier or f'task-{uuid.uuid4().hex[:8]}'
             self._task_subscribers[ident] = subscriber
-            msg = make_subscribe_message(MessageType.SUBSCRIBE_TASK, self._client_id, ident)
+            msg = make_subscribe_message(
+                MessageType.SUBSCRIBE_TASK, self._client_id, ident, prefetch=self._task_prefetch_count
+            )
             self._send(msg)
             _LOGGER.info('Added task subscriber: %s', ident)
             return ident
@@ -432,9 +516,23 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
         subscriber: Callable[..., Any],
         identifier: str | None = None,
     ) -> str:
+        """Add a broadcast subscriber.
+
+        If the subscriber is a :class:`kiwipy.BroadcastFilter`, its subject and sender filters are registered with the
+        broker, which then only forwards the broadcasts that match them.
+        """
+        self._ensure_open()
+
         def _do() -> str:
             ident = identifier or f'broadcast-{uuid.uuid4().hex[:8]}'
             self._broadcast_subscribers[ident] = subscriber
+            msg = make_subscribe_message(
+                MessageType.SUBSCRIBE_BROADCAST,
+                self._client_id,
+                ident,
+                broadcast_filter=get_broadcast_filter_spec(subscriber),
+            )
+            self._send(msg)
             _LOGGER.info('Added broadcast subscriber: %s', ident)
             return ident
 
@@ -444,6 +542,9 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
         def _do() -> None:
             if identifier in self._broadcast_subscribers:
                 del self._broadcast_subscribers[identifier]
+                if not self._closed:
+                    msg = make_subscribe_message(MessageType.UNSUBSCRIBE_BROADCAST, self._client_id, identifier)
+                    self._send(msg)
                 _LOGGER.info('Removed broadcast subscriber: %s', identifier)
 
         self._run_on_loop(_do)
@@ -461,8 +562,7 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
         if not self._dealer:
             raise RuntimeError('Communicator not connected')
 
-        encoded = encode_message(msg)
-        self._dealer.send_multipart([b'', encoded], zmq.NOBLOCK)
+        self._dealer.send_multipart([b'', *encode_frames(msg, self._codec)], zmq.NOBLOCK)
 
     # ------------------------------------------------------------------
     # Internal — polling coroutines
@@ -474,8 +574,8 @@ class ZeromqCommunicator(kiwipy.Communicator):  # type: ignore[misc]
         while not self._closed:
             try:
                 frames = await self._dealer.recv_multipart()
-                msg_frame = frames[1] if len(frames) > 1 and frames[0] == b'' else frames[0]
-                msg = decode_message(msg_frame)
+                msg_frames = frames[1:] if len(frames) > 1 and frames[0] == b'' else frames
+                msg, _ = decode_frames(msg_frames)
                 self._dispatch_dealer_message(msg)
             except zmq.ZMQError:
                 if not self._closed:
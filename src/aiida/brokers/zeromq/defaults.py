@@ -25,6 +25,10 @@ LOOP_TIMEOUT: float = 5.0
 # Timeout (seconds) for joining the loop thread during shutdown.
 LOOP_JOIN_TIMEOUT: float = 3.0
 
+# Codecs for message frames in order of preference.  The first one that is
+# available (``msgpack`` requires the optional package) is used by clients.
+PREFERRED_CODECS: tuple[str, ...] = ('msgpack', 'json')
+
 # -- Broker startup ------------------------------------------------------------
 
 # How long (seconds) ``get_communicator()`` polls for the broker to write its
@@ -43,6 +47,22 @@ HEARTBEAT_IVL: float = 2.0
 # ZMTP heartbeat timeout (seconds) — peer considered dead after this without a pong.
 HEARTBEAT_TIMEOUT: float = 6.0
 
+# -- Segment log queue engine ------------------------------------------------
+
+# Size (bytes) after which the active segment of the ``segment_log`` queue
+# engine is sealed and a new segment is started.
+SEGMENT_MAX_BYTES: int = 16 * 1024 * 1024
+
+# Number of appended records after which the active segment is fsynced.
+SEGMENT_SYNC_RECORDS: int = 128
+
+# Maximum time (seconds) an appended record may remain without fsync.
+SEGMENT_SYNC_INTERVAL: float = 0.1
+
+# Fraction of live bytes below which the oldest sealed segment is compacted
+# by copying its remaining live records forward.
+SEGMENT_COMPACTION_RATIO: float = 0.5
+
 # -- Service -------------------------------------------------------------------
 
 # How often (seconds) the broker service writes its status to disk.
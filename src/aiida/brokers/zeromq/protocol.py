@@ -25,11 +25,22 @@ What ZeroMQ provides (transport layer):
     - ZMTP heartbeats for dead peer detection
     - IPC transport for same-machine communication
 
+Wire format:
+    Every message is sent as one envelope frame, optionally followed by one payload frame. The envelope holds the
+    routing metadata (type, ids, sender, subject, ...) and the payload frame holds the ``body`` or ``result`` of the
+    message, encoded separately. The broker only ever decodes envelopes: payload frames are forwarded as received,
+    without copying, and are only transcoded when sender and recipient use different codecs.
+
+    Two codecs are supported: JSON, which is always available, and msgpack, which is preferred if the ``msgpack``
+    package is installed. The codec of a frame is detected from its first byte (a JSON envelope always starts with
+    ``{``), so the codec is negotiated implicitly: the broker replies to each client in the codec it last received from
+    it. Single-frame JSON messages with an inline payload remain valid.
+
 What ZeroMQ does NOT provide (requiring this protocol):
     - Request-reply correlation (matching responses to requests)
     - Task acknowledgment and redelivery on worker death
     - Persistent/durable queues
-    - Server-side subscription awareness
+    - Server-side subscription awareness and broadcast filtering
     - Directed RPC routing to a named recipient
     - Message serialization
 
@@ -39,11 +50,12 @@ AMQP concepts mapped to message types:
     ========================  ================================
     ``basic.ack``             ``TASK_ACK``
     ``basic.nack``            ``TASK_NACK``
-    consumer with prefetch    ``TASK`` dispatch to workers
-    fanout exchange           ``BROADCAST`` via ROUTER fan-out
+    consumer with prefetch    ``TASK`` dispatch with per-worker credits
+    topic exchange            ``BROADCAST`` via filtered ROUTER fan-out
     direct exchange           ``RPC`` to specific recipient
     durable queue             ``PersistentQueue`` (file-based)
     ``basic.consume``         ``SUBSCRIBE_TASK`` / ``SUBSCRIBE_RPC``
+    ``queue.bind``            ``SUBSCRIBE_BROADCAST``
     ========================  ================================
 
 Why not use an AMQP library directly: the goal is to eliminate the RabbitMQ
@@ -53,11 +65,29 @@ only the AMQP-like semantics that ``kiwipy.Communicator`` requires.
 
 from __future__ import annotations
 
+import abc
+import base64
 import json
+import re
 import uuid
+from collections.abc import Callable, Sequence
 from enum import Enum
 from typing import Any
 
+import zmq
+
+from .defaults import PREFERRED_CODECS
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+Frame = bytes | memoryview | zmq.Frame
+
+PAYLOAD_FIELDS = ('body', 'result')
+"""Message fields that are sent in a separate payload frame."""
+
 
 class MessageType(str, Enum):
     """Message types for the ZeroMQ broker protocol."""
@@ -79,6 +109,8 @@ class MessageType(str, Enum):
     SUBSCRIBE_RPC = 'subscribe_rpc'
     UNSUBSCRIBE_TASK = 'unsubscribe_task'
     UNSUBSCRIBE_RPC = 'unsubscribe_rpc'
+    SUBSCRIBE_BROADCAST = 'subscribe_broadcast'
+    UNSUBSCRIBE_BROADCAST = 'unsubscribe_broadcast'
 
     # Health check
     PING = 'ping'
@@ -103,6 +135,168 @@ def decode_message(data: bytes) -> dict[str, Any]:
     return json.loads(data.decode('utf-8'))  # type: ignore[no-any-return]
 
 
+def _msgpack_default(obj: Any) -> Any:
+    """Convert objects that msgpack cannot serialize natively."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not msgpack serializable')
+
+
+class Codec(metaclass=abc.ABCMeta):
+    """Serialization format for the envelope and payload frames of a message."""
+
+    name: str
+
+    @abc.abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Encode an object to bytes."""
+
+    @abc.abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes to an object."""
+
+
+class JsonCodec(Codec):
+    """JSON codec, always available and used as fallback."""
+
+    name = 'json'
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, cls=_UUIDEncoder).encode('utf-8')
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """Compact binary codec based on the optional ``msgpack`` package, installed with ``aiida-core[msgpack]``."""
+
+    name = 'msgpack'
+
+    def encode(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)  # type: ignore[no-any-return]
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+CODECS: dict[str, Codec] = {JsonCodec.name: JsonCodec()}
+if msgpack is not None:
+    CODECS[MsgpackCodec.name] = MsgpackCodec()
+
+
+def get_codec(name: str | None = None) -> Codec:
+    """Return the codec with the given name, or the preferred available codec if no name is given.
+
+    :raises ValueError: If the codec is unknown or its dependencies are not installed.
+    """
+    if name is None:
+        name = next(codec for codec in PREFERRED_CODECS if codec in CODECS)
+    try:
+        return CODECS[name]
+    except KeyError:
+        if name == MsgpackCodec.name:
+            raise ValueError(
+                f'codec `{name}` requires the `msgpack` package, install it with `pip install aiida-core[msgpack]`'
+            ) from None
+        raise ValueError(f'codec `{name}` is not available, available codecs: {tuple(CODECS)}') from None
+
+
+def detect_codec(data: bytes) -> Codec:
+    """Return the codec of an envelope frame, detected from its first byte.
+
+    :raises ValueError: If the frame uses a codec that is not available.
+    """
+    return CODECS[JsonCodec.name] if data[:1] == b'{' else get_codec(MsgpackCodec.name)
+
+
+def _frame_bytes(frame: Frame) -> bytes:
+    return frame.bytes if isinstance(frame, zmq.Frame) else bytes(frame)
+
+
+class Payload:
+    """Encoded message payload that the broker forwards without decoding it."""
+
+    __slots__ = ('codec', 'frame')
+
+    def __init__(self, codec: str, frame: Frame):
+        """Construct a new instance.
+
+        :param codec: Name of the codec the payload is encoded with.
+        :param frame: The encoded payload frame, as received from the socket.
+        """
+        self.codec = codec
+        self.frame = frame
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Payload) and (self.codec, self.data) == (other.codec, other.data)
+
+    @property
+    def data(self) -> bytes:
+        """Return the encoded payload."""
+        return _frame_bytes(self.frame)
+
+    def decode(self) -> Any:
+        """Decode and return the payload."""
+        return get_codec(self.codec).decode(self.data)
+
+    def to_dict(self) -> dict[str, str]:
+        """Return a JSON-serializable representation, e.g. to persist the payload in the task queue."""
+        if self.codec == JsonCodec.name:
+            return {'codec': self.codec, 'text': self.data.decode('utf-8')}
+        return {'codec': self.codec, 'base64': base64.b64encode(self.data).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, value: dict[str, str]) -> Payload:
+        """Construct an instance from the representation returned by :meth:`to_dict`."""
+        if 'text' in value:
+            return cls(value['codec'], value['text'].encode('utf-8'))
+        return cls(value['codec'], base64.b64decode(value['base64']))
+
+
+def encode_frames(msg: dict[str, Any], codec: Codec) -> list[Frame]:
+    """Encode a message dictionary into an envelope frame and an optional payload frame.
+
+    A :class:`Payload` value is reused as-is if it is already encoded with ``codec`` and transcoded otherwise.
+    """
+    envelope: dict[str, Any] = {}
+    payload: Frame | None = None
+
+    for key, value in msg.items():
+        if payload is None and key in PAYLOAD_FIELDS and value is not None:
+            envelope['payload_field'] = key
+            if isinstance(value, Payload):
+                payload = value.frame if value.codec == codec.name else codec.encode(value.decode())
+            else:
+                payload = codec.encode(value)
+        else:
+            envelope[key] = value
+
+    frames: list[Frame] = [codec.encode(envelope)]
+    if payload is not None:
+        frames.append(payload)
+    return frames
+
+
+def decode_frames(frames: Sequence[Frame], decode_payload: bool = True) -> tuple[dict[str, Any], Codec]:
+    """Decode the envelope frame and optional payload frame of a message.
+
+    :param frames: The message frames, without routing identity and empty delimiter.
+    :param decode_payload: If ``False``, the payload is returned as an opaque :class:`Payload`.
+    :return: Tuple of the message dictionary and the codec of the envelope.
+    """
+    data = _frame_bytes(frames[0])
+    codec = detect_codec(data)
+    msg = codec.decode(data)
+    field = msg.pop('payload_field', None)
+
+    if field is not None and len(frames) > 1:
+        payload = Payload(codec.name, frames[1])
+        msg[field] = payload.decode() if decode_payload else payload
+
+    return msg, codec
+
+
 def make_task_message(body: Any, sender: str, no_reply: bool = False) -> dict[str, Any]:
     """Create a task message dictionary."""
     return {
@@ -192,11 +386,59 @@ def make_broadcast_message(
     }
 
 
-def make_subscribe_message(msg_type: MessageType, sender: str, identifier: str | None = None) -> dict[str, Any]:
-    """Create a subscription message dictionary."""
-    return {
+def make_subscribe_message(
+    msg_type: MessageType,
+    sender: str,
+    identifier: str | None = None,
+    prefetch: int | None = None,
+    broadcast_filter: dict[str, list[dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
+    """Create a subscription message dictionary.
+
+    :param prefetch: For ``SUBSCRIBE_TASK``, the maximum number of unacknowledged tasks the broker may dispatch to the
+        sender at once. ``None`` or ``0`` means no limit.
+    :param broadcast_filter: For ``SUBSCRIBE_BROADCAST``, the filter specification of the subscriber, see
+        :func:`compile_broadcast_filter`. ``None`` means the subscriber receives all broadcasts.
+    """
+    msg: dict[str, Any] = {
         'type': msg_type.value,
         'id': uuid.uuid4().hex,
         'sender': sender,
         'identifier': identifier,
     }
+    if prefetch:
+        msg['prefetch'] = prefetch
+    if broadcast_filter is not None:
+        msg['filter'] = broadcast_filter
+    return msg
+
+
+def compile_broadcast_filter(spec: dict[str, list[dict[str, Any]]] | None) -> Callable[[Any, Any], bool]:
+    """Compile a broadcast filter specification into a predicate taking the sender and subject of a broadcast.
+
+    The specification maps ``sender`` and ``subject`` onto a list of patterns, each of which is either
+    ``{'regex': pattern, 'flags': flags}``, matched with :func:`re.match`, or ``{'value': value}``, matched by equality.
+    As for :class:`kiwipy.BroadcastFilter`, a broadcast passes if each of its fields is ``None``, has no patterns, or
+    matches any of the patterns.
+    """
+    if not spec:
+        return lambda sender, subject: True
+
+    def _compile(pattern: dict[str, Any]) -> Callable[[Any], bool]:
+        if 'regex' in pattern:
+            regex = re.compile(pattern['regex'], pattern.get('flags', 0))
+            return lambda value: isinstance(value, str) and regex.match(value) is not None
+        expected = pattern['value']
+        return lambda value: value == expected
+
+    senders = [_compile(pattern) for pattern in spec.get('sender', [])]
+    subjects = [_compile(pattern) for pattern in spec.get('subject', [])]
+
+    def _matches(sender: Any, subject: Any) -> bool:
+        if subject is not None and subjects and not any(check(subject) for check in subjects):
+            return False
+        if sender is not None and senders and not any(check(sender) for check in senders):
+            return False
+        return True
+
+    return _matches
@@ -15,10 +15,36 @@ import logging
 import time
 from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    from .segment_queue import SegmentLogQueue
 
 _LOGGER = logging.getLogger(__name__)
 
+QUEUE_ENGINES = ('folder', 'segment_log')
+"""Names of the available persistent task queue engines, the first being the default."""
+
+TaskQueue = Union['PersistentQueue', 'SegmentLogQueue']
+
+
+def open_task_queue(storage_path: Path | str, engine: str = QUEUE_ENGINES[0]) -> TaskQueue:
+    """Open the persistent task queue stored at ``storage_path`` with the given engine.
+
+    :param storage_path: Path to the queue storage directory.
+    :param engine: Name of the queue engine, one of :data:`QUEUE_ENGINES`.
+    :raises ValueError: If the engine is not known.
+    """
+    if engine == 'folder':
+        return PersistentQueue(storage_path)
+
+    if engine == 'segment_log':
+        from .segment_queue import SegmentLogQueue
+
+        return SegmentLogQueue(storage_path)
+
+    raise ValueError(f'unknown queue engine `{engine}`, valid engines: {QUEUE_ENGINES}')
+
 
 class PersistentQueue:
     """Folder-based persistent task queue.
@@ -270,3 +296,15 @@ class PersistentQueue:
             except (FileNotFoundError, json.JSONDecodeError):
                 continue
         return tasks
+
+    def sync(self) -> None:
+        """Flush buffered writes to disk.
+
+        Every task is written to its own file immediately, so there is nothing to flush.
+        """
+
+    def close(self) -> None:
+        """Release resources held by the queue.
+
+        The folder layout holds no open files, so this is a no-op.
+        """
@@ -0,0 +1,583 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Append-only segment log queue engine for the ZeroMQ broker.
+
+The folder-based :class:`~aiida.brokers.zeromq.queue.PersistentQueue` creates, renames and unlinks one file per task,
+which becomes the bottleneck once hundreds of thousands of tasks are queued. This engine keeps the same
+``push/pop/ack/nack`` contract but appends records to a small number of segment files instead:
+
+* ``PUSH`` records carry the full task and a monotonically increasing sequence number that defines the FIFO order.
+* ``REMOVE`` records are tombstones written when a task is acknowledged, discarded or removed.
+
+Popping and negative acknowledgement with requeue only change the in-memory state. After a crash all tasks without a
+tombstone are pending again, in their original order, which matches the recovery semantics of the folder layout.
+
+Storage structure:
+    {storage_path}/
+    ├── segments/
+    │   ├── 00000000000000000001.log
+    │   └── 00000000000000000002.log    # Active segment, records are appended here
+    └── index.json                      # Snapshot of live record locations
+
+Each record is framed as ``<length:uint32><crc32:uint32><op:uint8><payload>`` so a torn write at the end of the active
+segment is detected and truncated on recovery. Writes are flushed to the OS immediately, but ``fsync`` is batched by
+record count and time. The index is rewritten whenever a segment is sealed and on :meth:`SegmentLogQueue.close`, so a
+restart only has to replay the records appended after the last snapshot rather than every segment.
+
+Segments are only ever deleted from the front of the log, which guarantees that a tombstone can never outlive the
+record it refers to. Live records of the oldest segment are copied forward when most of it is garbage, for example
+when a long-running process keeps its task unacknowledged for days.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from .defaults import (
+    SEGMENT_COMPACTION_RATIO,
+    SEGMENT_MAX_BYTES,
+    SEGMENT_SYNC_INTERVAL,
+    SEGMENT_SYNC_RECORDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_HEADER = struct.Struct('<IIB')
+_OP_PUSH = 1
+_OP_REMOVE = 2
+_INDEX_VERSION = 1
+
+
+class _Segment:
+    """Bookkeeping for a single segment file."""
+
+    __slots__ = ('live', 'live_bytes', 'number', 'path', 'size')
+
+    def __init__(self, number: int, path: Path, size: int = 0):
+        self.number = number
+        self.path = path
+        self.size = size
+        self.live = 0
+        self.live_bytes = 0
+
+
+class SegmentLogQueue:
+    """Persistent task queue backed by an append-only, fsync-batched segment log.
+
+    The public interface is identical to :class:`~aiida.brokers.zeromq.queue.PersistentQueue`. The queue assumes it is
+    the only writer of its storage directory, which holds for the broker service and for offline tools such as
+    ``verdi process repair`` that only run while the daemon is stopped.
+    """
+
+    def __init__(
+        self,
+        storage_path: Path | str,
+        max_segment_bytes: int = SEGMENT_MAX_BYTES,
+        sync_records: int = SEGMENT_SYNC_RECORDS,
+        sync_interval: float = SEGMENT_SYNC_INTERVAL,
+        compaction_ratio: float = SEGMENT_COMPACTION_RATIO,
+    ):
+        """Initialize the queue.
+
+        :param storage_path: Path to the queue storage directory.
+        :param max_segment_bytes: Size after which the active segment is sealed and a new one is started.
+        :param sync_records: Number of unsynced records after which the active segment is fsynced.
+        :param sync_interval: Maximum time in seconds an appended record may remain unsynced.
+        :param compaction_ratio: Fraction of live bytes below which the oldest segment is compacted.
+        """
+        self._storage_path = Path(storage_path)
+        self._segments_path = self._storage_path / 'segments'
+        self._index_path = self._storage_path / 'index.json'
+
+        self._max_segment_bytes = max_segment_bytes
+        self._sync_records = sync_records
+        self._sync_interval = sync_interval
+        self._compaction_ratio = compaction_ratio
+
+        # In-memory tracking
+        self._pending: deque[str] = deque()  # Task IDs in FIFO order
+        self._processing: dict[str, None] = {}  # Task IDs in dispatch order
+        # task_id -> (sequence, segment number, record offset, record length)
+        self._locations: dict[str, tuple[int, int, int, int]] = {}
+        self._segments: dict[int, _Segment] = {}
+        self._next_seq = 0
+
+        # Active segment writer state
+        self._active: _Segment | None = None
+        self._fd: int | None = None
+        self._read_fds: dict[int, int] = {}
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self._segments_path.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    # === Recovery ===
+
+    def _load(self) -> None:
+        """Restore the queue state from the index snapshot and replay the records appended after it.
+
+        All unacknowledged tasks are considered pending again (crash recovery).
+        """
+        numbers = sorted(int(path.stem) for path in self._segments_path.glob('*.log') if path.stem.isdigit())
+        for number in numbers:
+            path = self._segment_path(number)
+            self._segments[number] = _Segment(number, path, path.stat().st_size)
+
+        live: dict[str, tuple[int, int, int, int]] = {}
+        replay_from = (numbers[0], 0) if numbers else None
+        index = self._read_index(numbers)
+
+        if index is not None:
+            self._next_seq = index['next_seq']
+            for task_id, seq, number, offset, length in index['live']:
+                live[task_id] = (seq, number, offset, length)
+            replay_from = tuple(index['checkpoint'])
+
+        if replay_from is not None:
+            for number in numbers:
+                if number < replay_from[0]:
+                    continue
+                start = replay_from[1] if number == replay_from[0] else 0
+                self._replay_segment(self._segments[number], start, live, is_last=number == numbers[-1])
+
+        for task_id, (_, number, _, length) in live.items():
+            segment = self._segments[number]
+            segment.live += 1
+            segment.live_bytes += length
+
+        self._locations = live
+        self._pending = deque(sorted(live, key=lambda task_id: live[task_id][0]))
+
+        self._open_active_segment(numbers[-1] if numbers else 1)
+        self._legacy_import()
+        self._compact()
+
+        _LOGGER.info('Loaded %d pending tasks from %d segments', len(self._pending), len(self._segments))
+
+    def _read_index(self, numbers: list[int]) -> dict[str, Any] | None:
+        """Read the index snapshot, returning ``None`` if it is missing, corrupt or inconsistent with the segments."""
+        try:
+            index = json.loads(self._index_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            _LOGGER.warning('Ignoring unreadable queue index %s: %s', self._index_path, exc)
+            return None
+
+        if not isinstance(index, dict) or index.get('version') != _INDEX_VERSION:
+            _LOGGER.warning('Ignoring queue index with unsupported version')
+            return None
+
+        checkpoint_number, checkpoint_offset = index['checkpoint']
+        referenced = {entry[2] for entry in index['live']} | {checkpoint_number}
+        if not referenced.issubset(numbers) or self._segments[checkpoint_number].size < checkpoint_offset:
+            _LOGGER.warning('Queue index references missing or truncated segments, replaying the full log')
+            return None
+
+        return index
+
+    def _replay_segment(
+        self, segment: _Segment, start: int, live: dict[str, tuple[int, int, int, int]], is_last: bool
+    ) -> None:
+        """Apply the records of a segment, starting at ``start``, to the ``live`` mapping.
+
+        A torn or corrupt record at the end of the last segment is truncated so new records can be appended.
+        """
+        with segment.path.open('rb') as handle:
+            handle.seek(start)
+            data = handle.read()
+
+        position = 0
+        while position < len(data):
+            record = self._parse_record(data, position)
+            if record is None:
+                offset = start + position
+                if is_last:
+                    _LOGGER.warning('Truncating torn record at offset %d of %s', offset, segment.path.name)
+                    os.truncate(segment.path, offset)
+                    segment.size = offset
+                else:
+                    _LOGGER.error(
+                        'Corrupt record at offset %d of %s, skipping rest of segment', offset, segment.path.name
+                    )
+                return
+
+            op, payload, length = record
+            if op == _OP_PUSH:
+                seq, task_id, _ = json.loads(payload)
+                # A task may have been copied forward by compaction; the earliest record of the task wins.
+                if task_id not in live:
+                    live[task_id] = (seq, segment.number, start + position, length)
+                self._next_seq = max(self._next_seq, seq + 1)
+            elif op == _OP_REMOVE:
+                live.pop(payload.decode('utf-8'), None)
+            position += length
+
+    @staticmethod
+    def _parse_record(data: bytes, position: int) -> tuple[int, bytes, int] | None:
+        """Parse the record at ``position``, returning ``(op, payload, total length)`` or ``None`` if invalid."""
+        if len(data) - position < _HEADER.size:
+            return None
+        length, crc, op = _HEADER.unpack_from(data, position)
+        end = position + _HEADER.size + length
+        if end > len(data):
+            return None
+        payload = data[position + _HEADER.size : end]
+        if zlib.crc32(payload) != crc or op not in (_OP_PUSH, _OP_REMOVE):
+            return None
+        return op, payload, _HEADER.size + length
+
+    def _legacy_import(self) -> None:
+        """Import tasks left behind by the folder-based queue engine in the same storage directory."""
+        legacy_files: list[Path] = []
+        for directory in ('processing', 'pending'):
+            legacy_files.extend((self._storage_path / directory).glob('*.json'))
+
+        if not legacy_files:
+            return
+
+        for task_file in sorted(legacy_files, key=lambda path: path.name):
+            task_id = task_file.name.rsplit('.', 1)[0].split('_', 1)[1]
+            try:
+                task = json.loads(task_file.read_text())
+            except (OSError, json.JSONDecodeError) as exc:
+                _LOGGER.error('Failed to import legacy task %s: %s', task_file.name, exc)
+                continue
+            if task_id not in self._locations:
+                self.push(task_id, task)
+
+        self.sync()
+        for task_file in legacy_files:
+            task_file.unlink(missing_ok=True)
+        _LOGGER.info('Imported %d tasks from the folder-based queue layout', len(legacy_files))
+
+    # === Segment management ===
+
+    def _segment_path(self, number: int) -> Path:
+        return self._segments_path / f'{number:020d}.log'
+
+    def _open_active_segment(self, number: int) -> None:
+        """Open segment ``number`` for appending, creating it if necessary."""
+        segment = self._segments.get(number)
+        if segment is None:
+            segment = _Segment(number, self._segment_path(number))
+            self._segments[number] = segment
+        self._fd = os.open(segment.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._read_fds[number] = self._fd
+        self._active = segment
+
+    def _roll_segment(self) -> None:
+        """Seal the active segment, start a new one and snapshot the index."""
+        assert self._active is not None
+        self.sync()
+        self._open_active_segment(self._active.number + 1)
+        self._write_index()
+        self._compact()
+
+    def _compact(self) -> None:
+        """Delete or compact sealed segments from the front of the log."""
+        assert self._active is not None
+        changed = False
+
+        while True:
+            oldest = min(self._segments)
+            if oldest == self._active.number:
+                break
+            segment = self._segments[oldest]
+
+            if segment.live and segment.live_bytes >= self._compaction_ratio * segment.size:
+                break
+
+            if segment.live:
+                # Copy the remaining live records forward so the segment can be dropped
+                moved = [task_id for task_id, location in self._locations.items() if location[1] == oldest]
+                for task_id in moved:
+                    seq, _, offset, length = self._locations[task_id]
+                    record = self._read_record(oldest, offset, length)
+                    self._locations[task_id] = (seq, *self._append(record))
+                    self._active.live += 1
+                    self._active.live_bytes += length
+                self.sync()
+                _LOGGER.debug('Compacted %d live tasks out of segment %d', len(moved), oldest)
+
+            # Persist the new state before the segment disappears so the index never references it
+            del self._segments[oldest]
+            self._write_index()
+            fd = self._read_fds.pop(oldest, None)
+            if fd is not None:
+                os.close(fd)
+            segment.path.unlink(missing_ok=True)
+            changed = True
+
+        if changed:
+            _LOGGER.debug('%d segments remain after compaction', len(self._segments))
+
+    def _write_index(self) -> None:
+        """Atomically write the index snapshot of all live records."""
+        assert self._active is not None
+        index = {
+            'version': _INDEX_VERSION,
+            'next_seq': self._next_seq,
+            'checkpoint': [self._active.number, self._active.size],
+            'live': [[task_id, *location] for task_id, location in self._locations.items()],
+        }
+        temp_file = self._index_path.with_suffix('.tmp')
+        temp_file.write_text(json.dumps(index, separators=(',', ':')))
+        temp_file.rename(self._index_path)
+
+    # === Record I/O ===
+
+    @staticmethod
+    def _encode_record(op: int, payload: bytes) -> bytes:
+        return _HEADER.pack(len(payload), zlib.crc32(payload), op) + payload
+
+    def _append(self, record: bytes) -> tuple[int, int, int]:
+        """Append an encoded record to the active segment.
+
+        :return: Tuple of (segment number, offset, length) of the written record.
+        """
+        assert self._active is not None
+        if self._fd is None:
+            self._open_active_segment(self._active.number)
+        assert self._fd is not None
+        offset = self._active.size
+        os.write(self._fd, record)
+        self._active.size += len(record)
+        self._unsynced += 1
+
+        if self._unsynced >= self._sync_records or time.monotonic() - self._last_sync >= self._sync_interval:
+            self.sync()
+
+        return self._active.number, offset, len(record)
+
+    def _read_record(self, number: int, offset: int, length: int) -> bytes:
+        fd = self._read_fds.get(number)
+        if fd is None:
+            fd = os.open(self._segments[number].path, os.O_RDONLY)
+            self._read_fds[number] = fd
+        return os.pread(fd, length, offset)
+
+    def _read_task(self, task_id: str) -> dict[str, Any] | None:
+        location = self._locations.get(task_id)
+        if location is None:
+            return None
+        _, number, offset, length = location
+        try:
+            record = self._read_record(number, offset, length)
+            _, _, task = json.loads(record[_HEADER.size :])
+        except (OSError, ValueError) as exc:
+            _LOGGER.error('Failed to read task %s: %s', task_id, exc)
+            return None
+        return task  # type: ignore[no-any-return]
+
+    def _remove(self, task_id: str) -> None:
+        """Write a tombstone for the task and drop it from the live set."""
+        location = self._locations.pop(task_id, None)
+        if location is None:
+            return
+        self._append(self._encode_record(_OP_REMOVE, task_id.encode('utf-8')))
+        segment = self._segments.get(location[1])
+        if segment is not None:
+            segment.live -= 1
+            segment.live_bytes -= location[3]
+
+        assert self._active is not None
+        if self._active.size >= self._max_segment_bytes:
+            self._roll_segment()
+        elif segment is not None and segment.live == 0 and segment.number == min(self._segments):
+            self._compact()
+
+    def sync(self) -> None:
+        """Flush appended records of the active segment to stable storage."""
+        if self._unsynced and self._fd is not None:
+            os.fsync(self._fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync outstanding records, snapshot the index and release all file descriptors.
+
+        The queue remains usable afterwards; files are reopened on the next access.
+        """
+        if self._fd is None:
+            return
+        self.sync()
+        self._write_index()
+        for fd in self._read_fds.values():
+            os.close(fd)
+        self._read_fds.clear()
+        self._fd = None
+
+    # === Queue interface ===
+
+    def push(self, task_id: str, task: dict[str, Any]) -> None:
+        """Add a task to the queue.
+
+        The record is written to the OS immediately and fsynced in batches.
+
+        :param task_id: Unique identifier for the task
+        :param task: Task data dictionary
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        payload = json.dumps([seq, task_id, task], separators=(',', ':')).encode('utf-8')
+        number, offset, length = self._append(self._encode_record(_OP_PUSH, payload))
+
+        self._locations[task_id] = (seq, number, offset, length)
+        self._segments[number].live += 1
+        self._segments[number].live_bytes += length
+        self._pending.append(task_id)
+        _LOGGER.debug('Queued task %s', task_id)
+
+        if self._segments[number].size >= self._max_segment_bytes:
+            self._roll_segment()
+
+    def pop(self) -> tuple[str, dict[str, Any]] | None:
+        """Get the next task from the queue.
+
+        The task is moved to the processing state until acked or nacked.
+
+        :return: Tuple of (task_id, task_data) or None if queue is empty
+        """
+        while self._pending:
+            task_id = self._pending.popleft()
+            task = self._read_task(task_id)
+            if task is None:
+                _LOGGER.warning('Task record not readable: %s, removing', task_id)
+                self._remove(task_id)
+                continue
+            self._processing[task_id] = None
+            _LOGGER.debug('Dequeued task %s', task_id)
+            return task_id, task
+
+        return None
+
+    def peek(self) -> tuple[str, dict[str, Any]] | None:
+        """Peek at the next task without removing it.
+
+        :return: Tuple of (task_id, task_data) or None if queue is empty
+        """
+        if not self._pending:
+            return None
+
+        task_id = self._pending[0]
+        task = self._read_task(task_id)
+        return None if task is None else (task_id, task)
+
+    def ack(self, task_id: str) -> bool:
+        """Acknowledge successful processing of a task.
+
+        :param task_id: ID of the task to acknowledge
+        :return: True if task was acknowledged, False if not found
+        """
+        if task_id not in self._processing:
+            _LOGGER.warning('Cannot ack unknown task: %s', task_id)
+            return False
+
+        del self._processing[task_id]
+        self._remove(task_id)
+        _LOGGER.debug('Acked task %s', task_id)
+        return True
+
+    def nack(self, task_id: str, requeue: bool = True) -> bool:
+        """Negative acknowledgment - task processing failed.
+
+        :param task_id: ID of the task
+        :param requeue: If True, put task back in queue; if False, discard it
+        :return: True if task was nacked, False if not found
+        """
+        if task_id not in self._processing:
+            _LOGGER.warning('Cannot nack unknown task: %s', task_id)
+            return False
+
+        del self._processing[task_id]
+
+        if requeue:
+            self._pending.appendleft(task_id)
+            _LOGGER.debug('Nacked and requeued task %s', task_id)
+        else:
+            self._remove(task_id)
+            _LOGGER.debug('Nacked and discarded task %s', task_id)
+
+        return True
+
+    def size(self) -> int:
+        """Return the number of pending tasks."""
+        return len(self._pending)
+
+    def processing_count(self) -> int:
+        """Return the number of tasks currently being processed."""
+        return len(self._processing)
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return len(self._pending) == 0
+
+    def clear(self) -> int:
+        """Remove all pending tasks from the queue.
+
+        Does not affect tasks currently being processed.
+
+        :return: Number of tasks removed
+        """
+        count = len(self._pending)
+        pending, self._pending = self._pending, deque()
+        for task_id in pending:
+            self._remove(task_id)
+        self.sync()
+        _LOGGER.info('Cleared %d pending tasks', count)
+        return count
+
+    def remove_pending(self, task_id: str) -> bool:
+        """Remove a pending task by its ID without processing it.
+
+        :param task_id: ID of the task to remove
+        :return: True if the task was removed, False if not found
+        """
+        try:
+            self._pending.remove(task_id)
+        except ValueError:
+            return False
+        self._remove(task_id)
+        self.sync()
+        _LOGGER.debug('Removed pending task %s', task_id)
+        return True
+
+    def get_all_pending(self) -> list[tuple[str, dict[str, Any]]]:
+        """Get all pending tasks without removing them.
+
+        :return: List of (task_id, task_data) tuples
+        """
+        tasks = []
+        for task_id in self._pending:
+            task = self._read_task(task_id)
+            if task is not None:
+                tasks.append((task_id, task))
+        return tasks
+
+    def get_all_processing(self) -> list[tuple[str, dict[str, Any]]]:
+        """Get all tasks currently being processed.
+
+        :return: List of (task_id, task_data) tuples
+        """
+        tasks = []
+        for task_id in self._processing:
+            task = self._read_task(task_id)
+            if task is not None:
+                tasks.append((task_id, task))
+        return tasks
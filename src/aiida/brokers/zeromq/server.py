@@ -17,6 +17,7 @@ Can be started as a standalone message broker process. It handles:
 from __future__ import annotations
 
 import logging
+import re
 import time
 from collections import deque
 from collections.abc import Callable
@@ -26,8 +27,16 @@ from typing import Any
 import zmq
 
 from .defaults import HEARTBEAT_IVL, HEARTBEAT_TIMEOUT, POLL_TIMEOUT
-from .protocol import MessageType, decode_message, encode_message
-from .queue import PersistentQueue
+from .protocol import (
+    JsonCodec,
+    MessageType,
+    Payload,
+    compile_broadcast_filter,
+    decode_frames,
+    encode_frames,
+    get_codec,
+)
+from .queue import QUEUE_ENGINES, open_task_queue
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +50,7 @@ class ZeromqBrokerServer:
     - A persistent task queue for reliable task delivery
     - RPC subscriber registry for routing RPC calls
     - Task subscriber registry for distributing tasks
+    - Broadcast subscriptions with subject and sender filters
 
     Socket architecture:
         ROUTER - Receives all client messages, routes replies and broadcasts
@@ -50,14 +60,17 @@ class ZeromqBrokerServer:
         self,
         storage_path: Path | str,
         sockets_path: Path | str,
+        queue_engine: str = QUEUE_ENGINES[0],
     ):
         """Initialize the broker server.
 
         :param storage_path: Path for task queue persistence
         :param sockets_path: Path for IPC socket files
+        :param queue_engine: Name of the persistent task queue engine, see
+            :data:`~aiida.brokers.zeromq.queue.QUEUE_ENGINES`.
 
-        Note: The server uses JSON for the message envelope. Payload fields (body, result)
-        are pre-encoded as YAML strings by the sender and remain opaque to the server.
+        Note: The server only decodes the message envelope. Payload fields (body, result) are received in a separate
+        frame that is kept as an opaque :class:`~aiida.brokers.zeromq.protocol.Payload` and forwarded as-is.
         """
         self._storage_path = Path(storage_path)
         self._sockets_path = Path(sockets_path)
@@ -76,15 +89,20 @@ class ZeromqBrokerServer:
         self._monitor: zmq.Socket | None = None  # type: ignore[type-arg]
 
         # Task queue with persistence
-        self._task_queue = PersistentQueue(self._storage_path / 'tasks')
+        self._task_queue = open_task_queue(self._storage_path / 'tasks', queue_engine)
 
         # Subscriber registries
         # task_subscribers: identifier -> client_identity (bytes)
         self._task_subscribers: dict[str, bytes] = {}
-        # Available task workers (ready to receive tasks)
+        # Available task workers (subscribed and with spare prefetch credit)
         self._available_workers: deque[bytes] = deque()
+        # Per-worker prefetch limit (0 means unlimited) and number of unacknowledged tasks
+        self._worker_prefetch: dict[bytes, int] = {}
+        self._worker_load: dict[bytes, int] = {}
         # rpc_subscribers: identifier -> client_identity (bytes)
         self._rpc_subscribers: dict[str, bytes] = {}
+        # broadcast_subscribers: client_identity -> identifier -> predicate on (sender, subject)
+        self._broadcast_subscribers: dict[bytes, dict[str, Callable[[Any, Any], bool]]] = {}
 
         # Pending RPC responses: correlation_id -> (client_identity, timestamp)
         self._pending_rpc_responses: dict[str, tuple[bytes, float]] = {}
@@ -93,6 +111,9 @@ class ZeromqBrokerServer:
         # Used to requeue tasks when a worker dies
         self._task_worker_assignments: dict[str, bytes] = {}
 
+        # Codec of the last message received from each client, used to encode the messages sent to it
+        self._client_codecs: dict[bytes, str] = {}
+
         # Server state
         self._running = False
 
@@ -109,6 +130,8 @@ class ZeromqBrokerServer:
             MessageType.SUBSCRIBE_RPC.value: self._handle_subscribe_rpc,
             MessageType.UNSUBSCRIBE_TASK.value: self._handle_unsubscribe_task,
             MessageType.UNSUBSCRIBE_RPC.value: self._handle_unsubscribe_rpc,
+            MessageType.SUBSCRIBE_BROADCAST.value: self._handle_subscribe_broadcast,
+            MessageType.UNSUBSCRIBE_BROADCAST.value: self._handle_unsubscribe_broadcast,
         }
 
     @property
@@ -195,6 +218,8 @@ class ZeromqBrokerServer:
             self._context.term()
             self._context = None
 
+        self._task_queue.close()
+
         _LOGGER.info('ZeroMQ Broker Server stopped')
 
     def run_forever(self, poll_timeout: float = POLL_TIMEOUT) -> None:
@@ -243,6 +268,10 @@ class ZeromqBrokerServer:
 
         # Try to dispatch pending tasks to available workers
         self._dispatch_pending_tasks()
+
+        # Queue engines may batch their disk syncs under load, flush them once the broker is idle
+        if not socks:
+            self._task_queue.sync()
         return handled
 
     def _handle_router_message(self) -> None:
@@ -252,16 +281,18 @@ class ZeromqBrokerServer:
 
         try:
             # ROUTER socket prepends identity frame
-            frames = self._router.recv_multipart()
+            frames = self._router.recv_multipart(copy=False)
             if len(frames) < 2:
                 _LOGGER.warning('Invalid message: insufficient frames')
                 return
 
-            identity = frames[0]
+            identity = frames[0].bytes
             # Skip empty delimiter frame if present
-            msg_frame = frames[2] if len(frames) > 2 and frames[1] == b'' else frames[1]
+            msg_frames = frames[2:] if len(frames) > 2 and not frames[1].buffer.nbytes else frames[1:]
 
-            msg = decode_message(msg_frame)
+            # Only the envelope is decoded, the payload frame is kept as an opaque ``Payload``
+            msg, codec = decode_frames(msg_frames, decode_payload=False)
+            self._client_codecs[identity] = codec.name
             msg_type: str | None = msg.get('type')
 
             _LOGGER.debug('Received %s from %s', msg_type, identity.hex()[:8])
@@ -296,15 +327,19 @@ class ZeromqBrokerServer:
         sender = msg.get('sender', '')
         no_reply = msg.get('no_reply', False)
 
-        # Store task in persistent queue
+        # Store task in persistent queue, an encoded payload is stored without decoding it
+        body = msg.get('body')
         task_data = {
             'id': task_id,
             'sender': sender,
             'sender_identity': identity.hex(),
-            'body': msg.get('body'),
             'no_reply': no_reply,
             'timestamp': time.time(),
         }
+        if isinstance(body, Payload):
+            task_data['payload'] = body.to_dict()
+        else:
+            task_data['body'] = body
         self._task_queue.push(task_id, task_data)
 
         # Send an immediate acknowledgment to the sender so its Future
@@ -334,10 +369,10 @@ class ZeromqBrokerServer:
         task_id = msg.get('task_id')
         if task_id:
             self._task_queue.ack(task_id)
-            self._task_worker_assignments.pop(task_id, None)
+            self._release_task(task_id)
             _LOGGER.debug('Task acknowledged: %s', task_id)
 
-        # Worker is available for more tasks
+        # The acknowledgement returned a prefetch credit to the worker
         self._mark_worker_available(identity)
 
     def _handle_task_nack(self, identity: bytes, msg: dict[str, Any]) -> None:
@@ -345,9 +380,10 @@ class ZeromqBrokerServer:
         task_id = msg.get('task_id')
         if task_id:
             self._task_queue.nack(task_id, requeue=True)
+            self._release_task(task_id)
             _LOGGER.debug('Task nacked and requeued: %s', task_id)
 
-        # Worker is available for more tasks
+        # The negative acknowledgement returned a prefetch credit to the worker
         self._mark_worker_available(identity)
 
     def _handle_rpc(self, identity: bytes, msg: dict[str, Any]) -> None:
@@ -408,17 +444,25 @@ class ZeromqBrokerServer:
     def _handle_broadcast(self, identity: bytes, msg: dict[str, Any]) -> None:
         """Handle broadcast message.
 
-        Forward to all connected clients via ROUTER socket.
-        Connected clients are derived from the task and RPC subscriber registries.
+        Forward to the clients with at least one broadcast subscriber whose filters match the sender and subject of the
+        broadcast, so that clients are not sent broadcasts they would discard.
         """
-        # Collect unique client identities from all subscriber registries
-        client_identities = set(self._task_subscribers.values()) | set(self._rpc_subscribers.values())
+        sender = msg.get('sender')
+        subject = msg.get('subject')
+        client_identities = [
+            client_identity
+            for client_identity, subscribers in self._broadcast_subscribers.items()
+            if any(matches(sender, subject) for matches in subscribers.values())
+        ]
+        # The message is encoded once per codec rather than once per client
+        encoded: dict[str, list[Any]] = {}
 
         for client_identity in client_identities:
             try:
-                self._send_to_client(client_identity, msg)
+                self._send_to_client(client_identity, msg, encoded)
             except zmq.ZMQError:
-                _LOGGER.warning('Failed to send broadcast to %s', client_identity.hex()[:8])
+                _LOGGER.warning('Failed to send broadcast to %s, removing it', client_identity.hex()[:8])
+                self._remove_dead_worker(client_identity)
 
         _LOGGER.debug('Broadcast sent to %d clients: %s', len(client_identities), msg.get('subject', 'no subject'))
 
@@ -430,8 +474,9 @@ class ZeromqBrokerServer:
             return
 
         self._task_subscribers[identifier] = identity
+        self._worker_prefetch[identity] = msg.get('prefetch') or 0
         self._mark_worker_available(identity)
-        _LOGGER.info('Task subscriber registered: %s', identifier)
+        _LOGGER.info('Task subscriber registered: %s (prefetch=%s)', identifier, self._worker_prefetch[identity])
 
         # Try to dispatch any pending tasks
         self._dispatch_pending_tasks()
@@ -446,6 +491,34 @@ class ZeromqBrokerServer:
         self._rpc_subscribers[identifier] = identity
         _LOGGER.info('RPC subscriber registered: %s', identifier)
 
+    def _handle_subscribe_broadcast(self, identity: bytes, msg: dict[str, Any]) -> None:
+        """Handle broadcast subscriber registration."""
+        identifier = msg.get('identifier') or msg.get('sender')
+        if not identifier:
+            _LOGGER.warning('Broadcast subscription missing identifier')
+            return
+
+        try:
+            matches = compile_broadcast_filter(msg.get('filter'))
+        except (KeyError, TypeError, re.error) as exc:
+            _LOGGER.warning(
+                'Invalid filter for broadcast subscriber %s, forwarding all broadcasts: %s', identifier, exc
+            )
+            matches = compile_broadcast_filter(None)
+
+        self._broadcast_subscribers.setdefault(identity, {})[identifier] = matches
+        _LOGGER.info('Broadcast subscriber registered: %s', identifier)
+
+    def _handle_unsubscribe_broadcast(self, identity: bytes, msg: dict[str, Any]) -> None:
+        """Handle broadcast subscriber removal."""
+        identifier = msg.get('identifier') or msg.get('sender')
+        subscribers = self._broadcast_subscribers.get(identity, {})
+        if identifier and identifier in subscribers:
+            del subscribers[identifier]
+            if not subscribers:
+                del self._broadcast_subscribers[identity]
+            _LOGGER.info('Broadcast subscriber removed: %s', identifier)
+
     def _handle_unsubscribe_task(self, identity: bytes, msg: dict[str, Any]) -> None:
         """Handle task subscriber removal."""
         identifier = msg.get('identifier') or msg.get('sender')
@@ -461,12 +534,21 @@ class ZeromqBrokerServer:
             _LOGGER.info('RPC subscriber removed: %s', identifier)
 
     def _dispatch_pending_tasks(self) -> None:
-        """Dispatch pending tasks to available workers."""
+        """Dispatch pending tasks to available workers.
+
+        Each task goes to the least-loaded available worker, i.e. the one with the fewest unacknowledged tasks, so a
+        large submission is spread evenly over all workers. Ties are broken in the order in which workers became
+        available. A worker leaves the pool once its number of unacknowledged tasks reaches its prefetch limit and
+        rejoins when it acknowledges a task, which mirrors the per-consumer prefetch of RabbitMQ.
+        """
+        subscribed = set(self._task_subscribers.values())
+
         while self._available_workers and not self._task_queue.is_empty():
-            worker_identity = self._available_workers.popleft()
+            worker_identity = min(self._available_workers, key=lambda worker: self._worker_load.get(worker, 0))
+            self._available_workers.remove(worker_identity)
 
             # Verify worker is still subscribed
-            if worker_identity not in self._task_subscribers.values():
+            if worker_identity not in subscribed:
                 continue
 
             # Get next task
@@ -478,10 +560,11 @@ class ZeromqBrokerServer:
             task_id, task_data = result
 
             # Send task to worker
+            payload = task_data.get('payload')
             task_msg = {
                 'type': MessageType.TASK.value,
                 'id': task_id,
-                'body': task_data.get('body'),
+                'body': Payload.from_dict(payload) if payload else task_data.get('body'),
                 'no_reply': task_data.get('no_reply', False),
             }
             try:
@@ -492,14 +575,26 @@ class ZeromqBrokerServer:
                 _LOGGER.warning('Worker %s disconnected, requeuing task %s', worker_identity.hex()[:8], task_id)
                 self._task_queue.nack(task_id, requeue=True)
                 self._remove_dead_worker(worker_identity)
+                subscribed.discard(worker_identity)
                 continue
             self._task_worker_assignments[task_id] = worker_identity
-            # Re-add worker so it can receive more tasks concurrently
-            # (matching RMQ's multi-prefetch behaviour).  The ACK only
-            # affects the PersistentQueue, not worker availability.
+            self._worker_load[worker_identity] = self._worker_load.get(worker_identity, 0) + 1
+            # Re-add the worker if it has prefetch credit left, so it can receive more tasks concurrently
             self._mark_worker_available(worker_identity)
             _LOGGER.debug('Dispatched task %s to worker', task_id)
 
+    def _release_task(self, task_id: str) -> None:
+        """Remove a task assignment and return the prefetch credit to its worker."""
+        worker_identity = self._task_worker_assignments.pop(task_id, None)
+        if worker_identity is None:
+            return
+
+        load = self._worker_load.get(worker_identity, 0) - 1
+        if load > 0:
+            self._worker_load[worker_identity] = load
+        else:
+            self._worker_load.pop(worker_identity, None)
+
     def _remove_dead_worker(self, identity: bytes) -> None:
         """Remove a disconnected worker from all registries and requeue its tasks."""
         # Requeue all tasks assigned to this worker
@@ -521,8 +616,13 @@ class ZeromqBrokerServer:
             del self._rpc_subscribers[key]
             _LOGGER.info('Removed dead RPC subscriber: %s', key)
 
+        self._broadcast_subscribers.pop(identity, None)
+
         # Remove from available workers
         self._available_workers = deque(w for w in self._available_workers if w != identity)
+        self._worker_prefetch.pop(identity, None)
+        self._worker_load.pop(identity, None)
+        self._client_codecs.pop(identity, None)
 
     def _handle_disconnect_event(self) -> None:
         """Handle a disconnect event from the socket monitor.
@@ -569,20 +669,38 @@ class ZeromqBrokerServer:
                 self._remove_dead_worker(identity)
 
     def _mark_worker_available(self, identity: bytes) -> None:
-        """Mark a worker as available for tasks."""
+        """Mark a worker as available for tasks, unless it has reached its prefetch limit."""
+        prefetch = self._worker_prefetch.get(identity, 0)
+        if prefetch and self._worker_load.get(identity, 0) >= prefetch:
+            return
         if identity not in self._available_workers:
             self._available_workers.append(identity)
 
-    def _send_to_client(self, identity: bytes, msg: dict[str, Any]) -> None:
+    def _send_to_client(
+        self, identity: bytes, msg: dict[str, Any], encoded: dict[str, list[Any]] | None = None
+    ) -> None:
         """Send a message to a specific client.
 
+        The message is encoded with the codec the client last used. A payload that is already encoded with that codec
+        is forwarded without copying it.
+
+        :param encoded: Optional cache of the encoded frames of ``msg`` keyed on codec name, to encode a message that is
+            sent to many clients only once per codec.
         :raises zmq.ZMQError: If the client is disconnected (ROUTER_MANDATORY).
         """
         if not self._router:
             return
 
-        encoded = encode_message(msg)
-        self._router.send_multipart([identity, b'', encoded])
+        codec = self._client_codecs.get(identity, JsonCodec.name)
+
+        if encoded is None:
+            frames = encode_frames(msg, get_codec(codec))
+        else:
+            if codec not in encoded:
+                encoded[codec] = encode_frames(msg, get_codec(codec))
+            frames = encoded[codec]
+
+        self._router.send_multipart([identity, b'', *frames], copy=False)
 
     def _send_rpc_error(self, identity: bytes, rpc_id: str, error: str) -> None:
         """Send an RPC error response."""
@@ -603,7 +721,9 @@ class ZeromqBrokerServer:
             'processing_tasks': self._task_queue.processing_count(),
             'task_subscribers': len(self._task_subscribers),
             'rpc_subscribers': len(self._rpc_subscribers),
+            'broadcast_subscribers': sum(len(subscribers) for subscribers in self._broadcast_subscribers.values()),
             'available_workers': len(self._available_workers),
+            'worker_loads': {identity.hex()[:8]: load for identity, load in self._worker_load.items()},
             'pending_rpc_responses': len(self._pending_rpc_responses),
         }
 
@@ -19,6 +19,7 @@ from pathlib import Path
 from aiida.common.log import configure_logging
 
 from .defaults import POLL_TIMEOUT, STATUS_INTERVAL
+from .queue import QUEUE_ENGINES
 from .server import ZeromqBrokerServer
 
 _LOGGER = logging.getLogger(__name__)
@@ -73,8 +74,14 @@ class ZeromqBrokerService:
             """Return the file containing the temporary sockets directory path."""
             return self.service_dir / 'broker.sockets'
 
-    def __init__(self, service_dir: Path | str, log_file_path: Path | str | None = None):
+    def __init__(
+        self,
+        service_dir: Path | str,
+        log_file_path: Path | str | None = None,
+        queue_engine: str = QUEUE_ENGINES[0],
+    ):
         self._layout = self.FilepathLayout(service_dir, log_file_path=log_file_path)
+        self._queue_engine = queue_engine
         self._service_dir = self._layout.service_dir
         self._storage_path = self._layout.storage_path
         self._sockets_path: Path | None = None
@@ -123,6 +130,7 @@ class ZeromqBrokerService:
         self._server = ZeromqBrokerServer(
             storage_path=self._storage_path,
             sockets_path=self._sockets_path,
+            queue_engine=self._queue_engine,
         )
 
         self._pid_file.write_text(f'{PID_SENTINEL} {os.getpid()}')
@@ -174,9 +182,11 @@ class ZeromqBrokerService:
         temp_file.rename(self._status_file)
 
 
-def run_broker_service(service_dir: str | Path, log_file_path: Path | str | None = None) -> None:
+def run_broker_service(
+    service_dir: str | Path, log_file_path: Path | str | None = None, queue_engine: str = QUEUE_ENGINES[0]
+) -> None:
     """Run the ZeroMQ broker service."""
-    service = ZeromqBrokerService(service_dir=service_dir, log_file_path=log_file_path)
+    service = ZeromqBrokerService(service_dir=service_dir, log_file_path=log_file_path, queue_engine=queue_engine)
     service.service_dir.mkdir(parents=True, exist_ok=True)
     configure_logging(daemon=True, daemon_log_file=service.log_file)
     service.run_forever()
@@ -188,5 +198,6 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--service-dir', '-s', required=True)
     parser.add_argument('--log-file-path', '-l', required=False)
+    parser.add_argument('--queue-engine', '-q', choices=QUEUE_ENGINES, default=QUEUE_ENGINES[0])
     args = parser.parse_args()
-    run_broker_service(service_dir=args.service_dir, log_file_path=args.log_file_path)
+    run_broker_service(service_dir=args.service_dir, log_file_path=args.log_file_path, queue_engine=args.queue_engine)
@@ -359,4 +359,4 @@ def broker(service_dir, log_file_path):
         msg = f'Only ZeromqBroker can be started through verdi but got broker of type {type(broker)}.'
         raise TypeError(msg)
 
-    run_broker_service(service_dir=service_dir, log_file_path=log_file_path)
+    run_broker_service(service_dir=service_dir, log_file_path=log_file_path, queue_engine=broker.queue_engine)
@@ -53,12 +53,13 @@ def structure_list(elements, raw, formula_mode, past_days, groups, all_users):
     """List StructureData objects."""
     from tabulate import tabulate
 
+    from aiida.orm import load_node
     from aiida.orm.nodes.data.structure import StructureData, get_formula, get_symbols_string
 
     elements_only = False
     lst = data_list(
         StructureData,
-        ['Id', 'Label', 'Kinds', 'Sites'],
+        ['Id', 'Label', 'Kinds', 'Sites', 'NumSites'],
         elements,
         elements_only,
         formula_mode,
@@ -68,7 +69,7 @@ def structure_list(elements, raw, formula_mode, past_days, groups, all_users):
     )
 
     entry_list = []
-    for [pid, label, akinds, asites] in lst:
+    for [pid, label, akinds, asites, num_sites] in lst:
         # If symbols are defined there is a filtering of the structures
         # based on the element
         # When QueryBuilder will support this (attribute)s filtering,
@@ -81,8 +82,14 @@ def structure_list(elements, raw, formula_mode, past_days, groups, all_users):
             if elements_only:
                 echo.echo_critical('Not implemented elements-only search')
 
+        # The sites of compact structures are stored in the repository, see ``StructureData.set_site_arrays``
+        if asites is None and num_sites is not None:
+            sites = [{'kind_name': kind_name} for kind_name in load_node(pid).get_site_kindnames()]
+        else:
+            sites = asites
+
         # We want only the StructureData that have attributes
-        if akinds is None or asites is None:
+        if akinds is None or sites is None:
             continue
 
         symbol_dict = {}
@@ -93,7 +100,7 @@ def structure_list(elements, raw, formula_mode, past_days, groups, all_users):
 
         try:
             symbol_list = []
-            for site in asites:
+            for site in sites:
                 symbol_list.append(symbol_dict[site['kind_name']])
             formula = get_formula(symbol_list, mode=formula_mode)
         # If for some reason there is no kind with the name
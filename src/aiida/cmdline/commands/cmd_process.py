@@ -613,15 +613,13 @@ def process_repair(manager, broker, dry_run, force):
 
             from plumpy.process_comms import create_continue_body
 
-            from aiida.brokers.zeromq.queue import PersistentQueue
-
-            queue_path = broker._storage_path / 'tasks'
-            queue = PersistentQueue(queue_path)
+            queue = broker.open_task_queue()
             for pid in zombies:
                 task_id = uuid.uuid4().hex
                 body = create_continue_body(pid=pid, nowait=True)
                 queue.push(task_id, {'body': body, 'no_reply': True})
                 echo.echo_report(f'Revived process `{pid}`')
+            queue.close()
         else:
             process_controller = manager.get_process_controller()
             for pid in zombies:
@@ -90,6 +90,9 @@ CLI_ACTIVE: bool | None = None
 CLI_LOG_LEVEL: str | None = None
 """Set if ``verdi`` is called with ``--verbosity`` flag specified, and is set to corresponding log level."""
 
+BUFFER_DATABASE_LOGS: bool = False
+"""Flag that is set to ``True`` by daemon workers, such that log records are written to the database in batches."""
+
 
 # The default logging dictionary for AiiDA that can be used in conjunction
 # with the config.dictConfig method of python's logging module
@@ -340,6 +343,10 @@ def configure_logging(with_orm: bool = False, daemon: bool = False, daemon_log_f
             'level': get_config_option('logging.database_handler'),
             'class': 'aiida.orm.utils.log.DBLogHandler',
         }
+
+        # Daemon workers write the log records in batches from a background thread, not to block their event loop
+        if BUFFER_DATABASE_LOGS:
+            config['handlers']['database']['class'] = 'aiida.orm.utils.log.BufferedDBLogHandler'
         config['loggers']['aiida']['handlers'].append('database')
 
     dictConfig(config)
@@ -39,6 +39,9 @@ __all__ = (
     'InterruptableFuture',
     'JobManager',
     'JobsList',
+    'JobsPollCache',
+    'JobsSnapshot',
+    'JobsSubmitter',
     'ObjectLoader',
     'OutputPort',
     'PastException',
@@ -50,6 +53,7 @@ __all__ = (
     'ProcessHandlerReport',
     'ProcessSpec',
     'ProcessState',
+    'RemoteObjectCache',
     'Runner',
     'ToContext',
     'WithNonDb',
@@ -13,9 +13,11 @@
 # fmt: off
 
 from .client import *
+from .object_cache import *
 
 __all__ = (
     'DaemonClient',
+    'RemoteObjectCache',
     'get_daemon_client',
 )
 
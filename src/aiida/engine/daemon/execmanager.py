@@ -14,13 +14,16 @@ plugin-specific operations.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import shutil
-from collections.abc import Mapping
+import tarfile
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from logging import LoggerAdapter
 from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import TYPE_CHECKING, Any
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any, cast
 
 # typing.assert_never available since 3.11
 from typing_extensions import assert_never
@@ -32,16 +35,27 @@ from aiida.common.links import LinkType
 from aiida.common.typing import FilePath
 from aiida.engine.processes.exit_code import ExitCode
 from aiida.manage.configuration import get_config_option
+from aiida.manage.configuration.settings import AiiDAConfigPathResolver
 from aiida.orm import CalcJobNode, Code, FolderData, Node, PortableCode, RemoteData, load_node
+from aiida.orm.entities import EntityTypes
 from aiida.orm.utils.log import get_dblogger_extra
 from aiida.repository.common import FileType
 from aiida.schedulers.datastructures import JobState
 from aiida.transports.transport import has_magic
 
+from .object_cache import RemoteObjectCache
+
 if TYPE_CHECKING:
     from aiida.transports import Transport
 
 REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
+REMOTE_WORK_DIRECTORY_OBJECT_CACHE = 'object_cache'
+
+UPLOAD_ARCHIVE_FILENAME = '.aiida_upload.tar'
+"""Name of the archive in the remote working directory in which the sandbox files are uploaded, if packed."""
+
+RETRIEVE_ARCHIVE_FILENAME = '.aiida_retrieve.tar.gz'
+"""Name of the archive in the remote working directory in which the files to retrieve are packed, if packed."""
 
 EXEC_LOGGER = AIIDA_LOGGER.getChild('execmanager')
 
@@ -93,7 +107,14 @@ async def upload_calculation(
     computer = node.computer
 
     codes_info = calc_info.codes_info
-    input_codes = [load_node(_.code_uuid, sub_classes=(Code,)) for _ in codes_info]
+    input_codes = [
+        node.backend.entity_cache.get(
+            ('upload_code', code_info.code_uuid),
+            functools.partial(load_node, code_info.code_uuid, sub_classes=(Code,)),
+            (EntityTypes.NODE,),
+        )
+        for code_info in codes_info
+    ]
 
     logger_extra = get_dblogger_extra(node)
     transport.set_logger_extra(logger_extra)
@@ -105,6 +126,8 @@ async def upload_calculation(
             'set `metadata.dry_run` to True in the inputs.'
         )
 
+    object_cache = None
+
     # If we are performing a dry-run, the working directory should actually be a local folder that should already exist
     if dry_run:
         workdir = Path(folder.abspath)
@@ -165,6 +188,7 @@ async def upload_calculation(
             workdir = workdir.joinpath(calc_info.uuid[4:])
 
         node.set_remote_workdir(str(workdir))
+        object_cache = _get_remote_object_cache(node, remote_working_directory)
 
     # I first create the code files, so that the code can put
     # default files to be overwritten by the plugin itself.
@@ -173,23 +197,26 @@ async def upload_calculation(
     for code in input_codes:
         if isinstance(code, PortableCode):
             # Note: this will possibly overwrite files
-            for root, dirnames, filenames in code.base.repository.walk():
-                # mkdir of root
-                await transport.makedirs_async(workdir.joinpath(root), ignore_existing=True)
-
-                # remotely mkdir first
-                for dirname in dirnames:
-                    await transport.makedirs_async(workdir.joinpath(root, dirname), ignore_existing=True)
-
-                # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-                # combination with the new `Transport.put_object_from_filelike`
-                # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
-                for filename in filenames:
-                    with NamedTemporaryFile(mode='wb+') as handle:
-                        content = code.base.repository.get_object_content(Path(root) / filename, mode='rb')
-                        handle.write(content)
-                        handle.flush()
-                        await transport.put_async(handle.name, workdir.joinpath(root, filename))
+            with TemporaryDirectory() as tmpdir:
+                transfers = []
+                for root, dirnames, filenames in code.base.repository.walk():
+                    # mkdir of root
+                    await transport.makedirs_async(workdir.joinpath(root), ignore_existing=True)
+
+                    # remotely mkdir first
+                    for dirname in dirnames:
+                        await transport.makedirs_async(workdir.joinpath(root, dirname), ignore_existing=True)
+
+                    # Note, once #2579 is implemented, use the `node.open` method instead of the temporary file in
+                    # combination with the new `Transport.put_object_from_filelike`
+                    # Since the content of the node could potentially be binary, we read the raw bytes
+                    for filename in filenames:
+                        filepath = Path(tmpdir) / root / filename
+                        filepath.parent.mkdir(parents=True, exist_ok=True)
+                        filepath.write_bytes(code.base.repository.get_object_content(Path(root) / filename, mode='rb'))
+                        transfers.append((filepath, workdir.joinpath(root, filename)))
+
+                await _put_concurrently(transport, transfers)
             if code.filepath_executable.is_absolute():
                 await transport.chmod_async(code.filepath_executable, 0o755)  # rwxr-xr-x
             else:
@@ -210,7 +237,9 @@ async def upload_calculation(
 
     for file_copy_operation in file_copy_operation_order:
         if file_copy_operation is FileCopyOperation.LOCAL:
-            await _copy_local_files(logger, node, transport, inputs, local_copy_list, workdir=workdir)
+            await _copy_local_files(
+                logger, node, transport, inputs, local_copy_list, workdir=workdir, object_cache=object_cache
+            )
         elif file_copy_operation is FileCopyOperation.REMOTE:
             if not dry_run:
                 await _copy_remote_files(
@@ -332,8 +361,36 @@ async def _copy_remote_files(logger, node, computer, transport, remote_copy_list
             )
 
 
-async def _copy_local_files(logger, node, transport, inputs, local_copy_list, workdir: Path):
-    """Perform the copy instructions of the ``local_copy_list``."""
+def _get_remote_object_cache(node: CalcJobNode, remote_working_directory: str) -> RemoteObjectCache | None:
+    """Return the cache of repository files on the remote of the calculation, or ``None`` if it is disabled.
+
+    The cache is enabled by setting the ``transport.local_copy_cache_size`` option. Its directory on the remote is in
+    the working directory of the computer, such that it is specific to the remote user, just like the local index.
+    """
+    max_size = get_config_option('transport.local_copy_cache_size')
+
+    if max_size <= 0 or not RemoteObjectCache.is_supported():
+        return None
+
+    filepath_index = (
+        AiiDAConfigPathResolver().aiida_path
+        / 'remote_objects'
+        / node.backend.profile.name
+        / f'authinfo-{node.get_authinfo().pk}.json'
+    )
+    dirpath_remote = os.path.join(remote_working_directory, REMOTE_WORK_DIRECTORY_OBJECT_CACHE)
+
+    return RemoteObjectCache(dirpath_remote, filepath_index, max_size * 1024**2)
+
+
+async def _copy_local_files(
+    logger, node, transport, inputs, local_copy_list, workdir: Path, object_cache: RemoteObjectCache | None = None
+):
+    """Perform the copy instructions of the ``local_copy_list``.
+
+    If an ``object_cache`` is specified, files of stored nodes are copied from it on the remote if they are cached and
+    are added to it when they are uploaded, such that files used by many calculations are only uploaded once.
+    """
     for uuid, filename, target in local_copy_list:
         logger.debug(f'[submission of calculation {node.uuid}] copying local file/folder to {target}')
 
@@ -382,49 +439,193 @@ async def _copy_local_files(logger, node, transport, inputs, local_copy_list, wo
                     overwrite=True,
                 )
             else:
-                # Otherwise, simply copy the file
+                # Otherwise, simply copy the file, unless it can be copied from the cache on the remote
+                await transport.makedirs_async(workdir.joinpath(Path(target).parent), ignore_existing=True)
+                key = _get_object_cache_key(data_node, filename_source) if object_cache is not None else None
+
+                if (
+                    object_cache is not None
+                    and key is not None
+                    and await object_cache.copy(transport, key, workdir.joinpath(target))
+                ):
+                    logger.debug(f'[submission of calculation {node.uuid}] copied {target} from the object cache')
+                    continue
+
                 with filepath_target.open('wb') as handle:
                     with data_node.base.repository.open(filename_source, 'rb') as source:
                         shutil.copyfileobj(source, handle)
-                await transport.makedirs_async(workdir.joinpath(Path(target).parent), ignore_existing=True)
-                await transport.put_async(filepath_target, workdir.joinpath(target))
+
+                if object_cache is not None and key is not None:
+                    await object_cache.put(transport, key, filepath_target, workdir.joinpath(target))
+                else:
+                    await transport.put_async(filepath_target, workdir.joinpath(target))
+
+
+def _get_object_cache_key(node: Node, path: str) -> str | None:
+    """Return the key under which the file of a node can be cached on the remote, or ``None`` if it cannot be cached.
+
+    Only files of stored nodes in a repository whose keys are content hashes can be cached.
+    """
+    if not node.is_stored or node.backend.get_repository().key_format != 'sha256':
+        return None
+
+    return node.base.repository.get_object(path).key
 
 
 async def _copy_sandbox_files(logger, node, transport, folder, workdir: Path):
-    """Copy the contents of the sandbox folder to the working directory."""
-    for filename in folder.get_content_list():
+    """Copy the contents of the sandbox folder to the working directory.
+
+    The top-level files and folders are uploaded concurrently, see ``_put_concurrently``. If the sandbox folder
+    contains at least ``transport.upload_pack_threshold`` files, they are instead packed in a single tar archive that
+    is uploaded and extracted in the working directory, to save a round trip per file.
+    """
+    filenames = folder.get_content_list()
+    pack_threshold = get_config_option('transport.upload_pack_threshold')
+
+    if pack_threshold > 0 and sum(len(files) for _, _, files in os.walk(folder.abspath)) >= pack_threshold:
+        logger.debug(f'[submission of calculation {node.pk}] copying sandbox folder as tar archive...')
+        with TemporaryDirectory() as tmpdir:
+            filepath_archive = Path(tmpdir) / UPLOAD_ARCHIVE_FILENAME
+            with tarfile.open(filepath_archive, 'w') as archive:
+                for filename in filenames:
+                    archive.add(folder.get_abs_path(filename), arcname=filename)
+            await transport.put_async(filepath_archive, workdir.joinpath(UPLOAD_ARCHIVE_FILENAME))
+        await transport.extract_async(workdir.joinpath(UPLOAD_ARCHIVE_FILENAME), workdir)
+        await transport.remove_async(workdir.joinpath(UPLOAD_ARCHIVE_FILENAME))
+        return
+
+    for filename in filenames:
         logger.debug(f'[submission of calculation {node.pk}] copying file/folder {filename}...')
-        await transport.put_async(folder.get_abs_path(filename), workdir.joinpath(filename))
 
+    await _put_concurrently(
+        transport, [(folder.get_abs_path(filename), workdir.joinpath(filename)) for filename in filenames]
+    )
+
+
+async def _put_concurrently(transport: Transport, transfers: Sequence[tuple[FilePath, FilePath]]) -> None:
+    """Put local files or folders on the remote, concurrently as far as the transport allows.
+
+    The number of concurrent operations is bounded by the ``max_io_allowed`` of the transport, if it defines one, such
+    that blocking transports, which cannot perform operations concurrently anyway, upload one file after the other.
+    If a transfer fails, the remaining ones are cancelled and the exception is raised.
+
+    :param transport: an already opened transport.
+    :param transfers: sequence of tuples of the local path and the remote path of each transfer. The remote paths
+        should be independent of each other, as the order in which the transfers are performed is not guaranteed.
+    """
+    await _transfer_concurrently(transport.put_async, transfers, getattr(transport, 'max_io_allowed', 1))
+
+
+async def _get_concurrently(transport: Transport, transfers: Sequence[tuple[FilePath, FilePath]]) -> None:
+    """Get remote files or folders, concurrently as far as the transport allows, ignoring those that do not exist.
+
+    This is the counterpart of :func:`_put_concurrently`. Since the local paths of retrieved items may overlap, for
+    example when several items are retrieved into the same local folder, the transfers are only performed concurrently
+    if none of the local paths is equal to or nested in another. Otherwise they are performed one after the other in
+    the order given, such that later items overwrite earlier ones, as before.
+
+    :param transport: an already opened transport.
+    :param transfers: sequence of tuples of the remote path and the local path of each transfer.
+    """
+    localpaths = [Path(os.path.normpath(localpath)) for _, localpath in transfers]
+    unique = set(localpaths)
+    independent = len(unique) == len(localpaths) and not any(
+        parent in unique for localpath in localpaths for parent in localpath.parents
+    )
+    max_concurrency = getattr(transport, 'max_io_allowed', 1) if independent else 1
+
+    await _transfer_concurrently(
+        functools.partial(transport.get_async, ignore_nonexisting=True), transfers, max_concurrency
+    )
+
+
+async def _transfer_concurrently(
+    operation: Callable[[FilePath, FilePath], Awaitable[Any]],
+    transfers: Sequence[tuple[FilePath, FilePath]],
+    max_concurrency: int,
+) -> None:
+    """Perform the transfers with at most ``max_concurrency`` of them running at the same time.
+
+    With a ``max_concurrency`` of one, the transfers are performed in the order given. If a transfer fails, the
+    remaining ones are cancelled and the exception is raised.
+
+    :param operation: the coroutine function performing a single transfer from the first to the second path.
+    :param transfers: sequence of tuples of the source and the destination of each transfer.
+    :param max_concurrency: the maximum number of transfers to run at the same time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def transfer(source: FilePath, destination: FilePath) -> None:
+        async with semaphore:
+            await operation(source, destination)
+
+    tasks = [asyncio.ensure_future(transfer(source, destination)) for source, destination in transfers]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
-def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str | ExitCode:
+
+async def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str | ExitCode:
     """Submit a previously uploaded `CalcJob` to the scheduler.
 
     :param calculation: the instance of CalcJobNode to submit.
     :param transport: an already opened transport to use to submit the calculation.
     :return: the job id as returned by the scheduler `submit_job` call
     """
-    job_id = calculation.get_job_id()
+    [result] = await submit_calculations([calculation], transport)
 
-    # If the `job_id` attribute is already set, that means this function was already executed once and the scheduler
-    # submit command was successful as the job id it returned was set on the node. This scenario can happen when the
-    # daemon runner gets shutdown right after accomplishing the submission task, but before it gets the chance to
-    # finalize the state transition of the `CalcJob` to the `UPDATE` transport task. Since the job is already submitted
-    # we do not want to submit it a second time, so we simply return the existing job id here.
-    if job_id is not None:
-        return job_id
+    if isinstance(result, Exception):
+        raise result
 
-    scheduler = calculation.computer.get_scheduler()
-    scheduler.set_transport(transport)
+    return result
 
-    submit_script_filename = calculation.get_option('submit_script_filename')
-    workdir = calculation.get_remote_workdir()
-    result = scheduler.submit_job(workdir, submit_script_filename)
 
-    if isinstance(result, str):
-        calculation.set_job_id(result)
+async def submit_calculations(
+    calculations: Sequence[CalcJobNode], transport: Transport
+) -> list[str | ExitCode | Exception]:
+    """Submit previously uploaded `CalcJob`s, which should share the same `AuthInfo`, to the scheduler.
 
-    return result
+    Scheduler plugins that support it submit all jobs with a single command, see ``Scheduler.submit_jobs_async``.
+
+    :param calculations: the instances of CalcJobNode to submit.
+    :param transport: an already opened transport to use to submit the calculations.
+    :return: for each calculation, in the same order, the job id as returned by the scheduler `submit_job` call, or the
+        exception raised when submitting it.
+    """
+    results: list[str | ExitCode | Exception | None] = []
+    unsubmitted: list[int] = []
+
+    for index, calculation in enumerate(calculations):
+        # If the `job_id` attribute is already set, that means this function was already executed once and the
+        # scheduler submit command was successful as the job id it returned was set on the node. This scenario can
+        # happen when the daemon runner gets shutdown right after accomplishing the submission task, but before it
+        # gets the chance to finalize the state transition of the `CalcJob` to the `UPDATE` transport task. Since the
+        # job is already submitted we do not want to submit it a second time, so we simply return the existing job id.
+        job_id = calculation.get_job_id()
+        results.append(job_id)
+        if job_id is None:
+            unsubmitted.append(index)
+
+    if unsubmitted:
+        scheduler = calculations[unsubmitted[0]].computer.get_scheduler()
+        scheduler.set_transport(transport)
+
+        jobs = [
+            (calculations[index].get_remote_workdir(), calculations[index].get_option('submit_script_filename'))
+            for index in unsubmitted
+        ]
+
+        for index, result in zip(unsubmitted, await scheduler.submit_jobs_async(jobs)):
+            if isinstance(result, str):
+                calculations[index].set_job_id(result)
+            results[index] = result
+
+    return cast(list[str | ExitCode | Exception], results)
 
 
 async def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
@@ -558,7 +759,7 @@ async def stash_calculation(calculation: CalcJobNode, transport: Transport) -> N
         compression_format = stash_mode
         file_name = uuid
         authinfo = calculation.get_authinfo()
-        aiida_remote_base = authinfo.get_workdir().format(username=transport.whoami())
+        aiida_remote_base = authinfo.get_workdir().format(username=await transport.whoami_async())
 
         target_destination = str(target_base / file_name) + '.' + compression_format
 
@@ -790,7 +991,7 @@ async def retrieve_calculation(
     return retrieved_files
 
 
-def kill_calculation(calculation: CalcJobNode, transport: Transport) -> None:
+async def kill_calculation(calculation: CalcJobNode, transport: Transport) -> None:
     """Kill the calculation through the scheduler
 
     :param calculation: the instance of CalcJobNode to kill.
@@ -807,11 +1008,11 @@ def kill_calculation(calculation: CalcJobNode, transport: Transport) -> None:
     scheduler.set_transport(transport)
 
     # Call the proper kill method for the job ID of this calculation
-    result = scheduler.kill_job(job_id)
+    result = await scheduler.kill_job_async(job_id)
 
     if result is not True:
         # Failed to kill because the job might have already been completed
-        running_jobs = scheduler.get_jobs(jobs=[job_id], as_dict=True)
+        running_jobs = await scheduler.get_jobs_async(jobs=[job_id], as_dict=True)
         job = running_jobs.get(job_id, None)
 
         # If the job is returned it is still running and the kill really failed, so we raise
@@ -847,11 +1048,17 @@ async def retrieve_files_from_list(
     treated as the work directory of the folder and the depth integer determines
     upto what level of the original remotepath nesting the files will be copied.
 
+    If the number of items to retrieve reaches the ``transport.retrieve_archive_threshold`` option, they are packed in
+    a single archive on the remote that is retrieved and unpacked locally. Otherwise, or if the archive cannot be
+    created, the items are retrieved individually, concurrently as far as the transport allows.
+
     :param transport: the Transport instance.
     :param folder: an absolute path to a folder that contains the files to retrieve.
     :param retrieve_list: the list of files to retrieve.
     """
     workdir = Path(calculation.get_remote_workdir())
+    transfers: list[tuple[str, str]] = []
+
     for item in retrieve_list:
         if isinstance(item, (list, tuple)):
             tmp_rname, tmp_lname, depth = item
@@ -888,10 +1095,88 @@ async def retrieve_files_from_list(
 
         for rem, loc in zip(remote_names, local_names):
             transport.logger.debug(f"[retrieval of calc {calculation.pk}] Trying to retrieve remote item '{rem}'")
+            transfers.append((str(workdir.joinpath(rem)), loc))
 
-            if rem.startswith('/'):
-                to_get = rem
+    pack_threshold = get_config_option('transport.retrieve_archive_threshold')
+
+    if pack_threshold > 0 and len(transfers) >= pack_threshold:
+        if await _retrieve_as_archive(calculation, transport, folder, transfers):
+            return
+
+    await _get_concurrently(
+        transport, [(remotepath, os.path.join(folder, localpath)) for remotepath, localpath in transfers]
+    )
+
+
+async def _retrieve_as_archive(
+    calculation: CalcJobNode, transport: Transport, folder: str, transfers: Sequence[tuple[str, str]]
+) -> bool:
+    """Retrieve the remote paths as a single archive that is created on the remote and unpacked locally.
+
+    The archive is created by a single ``tar`` invocation in the remote working directory, which skips the paths that
+    do not exist, just like the file by file retrieval ignores them. The transport's ``compress_async`` is not used,
+    because it raises when any of the sources does not exist. Once unpacked, the items are copied from the local copy
+    of the working directory to their local path, with the same semantics as if they were retrieved with ``get``.
+
+    :param calculation: the calculation job whose files to retrieve.
+    :param transport: an already opened transport.
+    :param folder: an absolute path to the folder into which to retrieve the files.
+    :param transfers: sequence of tuples of the absolute remote path and the path relative to ``folder`` of each item.
+    :return: ``True`` if the files were retrieved, ``False`` if the archive could not be created, for example because
+        not all remote paths are within the working directory or because the transport does not have a remote shell,
+        in which case the files should be retrieved individually.
+    """
+    from aiida.common.escaping import escape_for_bash
+    from aiida.transports.plugins.local import LocalTransport
+
+    workdir = calculation.get_remote_workdir()
+    relpaths = [os.path.relpath(remotepath, workdir) for remotepath, _ in transfers]
+
+    if any(relpath == os.curdir or relpath.startswith(os.pardir) for relpath in relpaths):
+        return False
+
+    archive_remote = os.path.join(workdir, RETRIEVE_ARCHIVE_FILENAME)
+    archive_name = escape_for_bash(RETRIEVE_ARCHIVE_FILENAME)
+    candidates = ' '.join(escape_for_bash(relpath) for relpath in sorted(set(relpaths)))
+    command = (
+        f'for f in {candidates}; do if [ -e "$f" ] || [ -L "$f" ]; then printf "%s\\0" "$f"; fi; done '
+        f'| tar -czf {archive_name} --null -T - || {{ retval=$?; rm -f {archive_name}; exit $retval; }}'
+    )
+
+    try:
+        retval, _, stderr = await transport.exec_command_wait_async(command, workdir=workdir)
+    except NotImplementedError:
+        return False
+
+    if retval != 0:
+        logger_extra = get_dblogger_extra(calculation)
+        EXEC_LOGGER.warning(
+            f'creating the retrieval archive failed with exit code {retval}, retrieving files individually: {stderr}',
+            extra=logger_extra,
+        )
+        return False
+
+    with TemporaryDirectory() as tmpdir:
+        archive_local = os.path.join(tmpdir, RETRIEVE_ARCHIVE_FILENAME)
+        unpacked = os.path.join(tmpdir, 'workdir')
+
+        try:
+            await transport.get_async(archive_remote, archive_local)
+        finally:
+            await transport.remove_async(archive_remote)
+
+        with tarfile.open(archive_local, 'r:gz') as archive:
+            if hasattr(tarfile, 'tar_filter'):
+                # The `filter` parameter was introduced in Python 3.12,
+                # and not specifying it triggers a deprecation warning.
+                archive.extractall(unpacked, filter='tar')
             else:
-                to_get = workdir.joinpath(rem)
+                archive.extractall(unpacked)
+
+        with LocalTransport() as local_transport:
+            for relpath, (_, localpath) in zip(relpaths, transfers):
+                local_transport.get(
+                    os.path.join(unpacked, relpath), os.path.join(folder, localpath), ignore_nonexisting=True
+                )
 
-            await transport.get_async(to_get, os.path.join(folder, loc), ignore_nonexisting=True)
+    return True
@@ -0,0 +1,193 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Content-addressed cache of repository files on a remote computer, to avoid uploading the same file repeatedly."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from aiida.common.typing import FilePath
+    from aiida.transports import Transport
+
+__all__ = ('RemoteObjectCache',)
+
+
+class RemoteObjectCache:
+    """Directory on a remote that stores files under the key of the object in the repository from which they came.
+
+    Since the keys of the disk-objectstore are hashes of the content, a file that is already in the cache can be copied
+    into the working directory of a calculation on the remote itself, instead of being uploaded again. The files are
+    copied rather than linked, such that a calculation that modifies its input files cannot corrupt the cache and that
+    evicting an object does not affect the working directories it was copied to.
+
+    Which objects are in the cache, together with their size and the time they were last used, is tracked in a local
+    index file that is shared between the processes, e.g. daemon workers, of a profile. When the total size of the
+    cached objects exceeds ``max_size``, the least recently used ones are removed. The index can get out of sync with
+    the remote, for example if the cache directory is deleted there, in which case the objects are simply uploaded
+    again.
+    """
+
+    def __init__(self, dirpath_remote: FilePath, filepath_index: FilePath, max_size: int):
+        """Construct a new instance.
+
+        :param dirpath_remote: the absolute path of the cache directory on the remote.
+        :param filepath_index: the path of the local index file, which should be unique for the remote directory.
+        :param max_size: the maximum total size in bytes of the cached objects.
+        """
+        self._dirpath_remote = PurePosixPath(dirpath_remote)
+        self._filepath_index = Path(filepath_index)
+        self._filepath_lock = self._filepath_index.with_name(f'{self._filepath_index.name}.lock')
+        self._max_size = max_size
+        self._filepath_index.parent.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Return whether the cache is supported on this platform, which requires ``fcntl`` for file locking."""
+        return fcntl is not None
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum total size in bytes of the cached objects."""
+        return self._max_size
+
+    def get_remote_path(self, key: str) -> PurePosixPath:
+        """Return the path on the remote of the cached object with the given key."""
+        return self._dirpath_remote / key
+
+    def get_keys(self) -> set[str]:
+        """Return the keys of the objects that are in the cache according to the index."""
+        return set(self._read_index())
+
+    async def copy(self, transport: Transport, key: str, remotepath: FilePath) -> bool:
+        """Copy the object with the given key from the cache to the given path on the remote, if it is in the cache.
+
+        :param transport: an already opened transport to the remote.
+        :param key: the key of the object.
+        :param remotepath: the absolute path on the remote to copy the object to.
+        :return: whether the object was in the cache and was copied.
+        """
+        with self._lock():
+            index = self._read_index()
+            if key not in index:
+                return False
+            index[key][1] = time.time()
+            self._write_index(index)
+
+        try:
+            await transport.copy_async(self.get_remote_path(key), remotepath)
+        except OSError:
+            # The object was removed from the remote behind the back of the index, so it should be uploaded again.
+            self.discard(key)
+            return False
+
+        return True
+
+    async def put(self, transport: Transport, key: str, localpath: FilePath, remotepath: FilePath) -> None:
+        """Upload a file to the given path on the remote, adding it to the cache under the given key along the way.
+
+        If the file is larger than ``max_size``, it is uploaded without being added to the cache. Otherwise, the least
+        recently used objects are removed from the cache as needed to make room for it.
+
+        :param transport: an already opened transport to the remote.
+        :param key: the key of the object in the repository that the file contains.
+        :param localpath: the absolute local path of the file.
+        :param remotepath: the absolute path on the remote to upload the file to.
+        """
+        # The transport only accepts concrete local paths and POSIX remote paths, so convert them explicitly
+        localpath = Path(localpath)
+        size = os.path.getsize(localpath)
+
+        if size > self._max_size:
+            await transport.put_async(localpath, str(remotepath))
+            return
+
+        # Upload to a temporary path that is then renamed, such that the cache never contains partially written files,
+        # even if multiple processes upload the same object at the same time.
+        path_cached = self.get_remote_path(key)
+        path_partial = path_cached.with_name(f'.{key}.{uuid.uuid4().hex}')
+        await transport.makedirs_async(self._dirpath_remote, ignore_existing=True)
+        await transport.put_async(localpath, path_partial)
+
+        try:
+            await transport.rename_async(path_partial, path_cached)
+        except OSError:
+            # Another process added the object in the meantime
+            await transport.remove_async(path_partial)
+
+        await transport.copy_async(path_cached, remotepath)
+
+        with self._lock():
+            index = self._read_index()
+            index[key] = [size, time.time()]
+            evicted = self._evict(index)
+            self._write_index(index)
+
+        for evicted_key in evicted:
+            with contextlib.suppress(OSError):
+                await transport.remove_async(self.get_remote_path(evicted_key))
+
+    def discard(self, key: str) -> None:
+        """Remove the object with the given key from the index, if it is there."""
+        with self._lock():
+            index = self._read_index()
+            if index.pop(key, None) is not None:
+                self._write_index(index)
+
+    def _evict(self, index: dict[str, list]) -> list[str]:
+        """Remove the least recently used objects from the index until their total size no longer exceeds the maximum.
+
+        :return: the keys of the removed objects.
+        """
+        total = sum(size for size, _ in index.values())
+        evicted = []
+
+        for key, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self._max_size:
+                break
+            del index[key]
+            total -= size
+            evicted.append(key)
+
+        return evicted
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Take the lock of the index, blocking until it is available."""
+        with self._filepath_lock.open('a') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _read_index(self) -> dict[str, list]:
+        """Return the index as a mapping of keys to lists of the size and the time of last use of the object."""
+        try:
+            return json.loads(self._filepath_index.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: dict[str, list]) -> None:
+        """Write the index to a temporary file and move it into place, so readers never see a partial file."""
+        filepath_tmp = self._filepath_index.with_name(f'.{self._filepath_index.name}.{os.getpid()}.tmp')
+        filepath_tmp.write_text(json.dumps(index))
+        os.replace(filepath_tmp, self._filepath_index)
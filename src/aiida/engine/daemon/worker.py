@@ -13,6 +13,7 @@ import logging
 import signal
 import sys
 
+from aiida.common import log
 from aiida.common.log import configure_logging
 from aiida.engine.daemon.client import get_daemon_client
 from aiida.engine.runners import Runner
@@ -25,6 +26,8 @@ async def shutdown_worker(runner: Runner) -> None:
     """Cleanup tasks tied to the service's shutdown."""
     from asyncio import all_tasks, current_task
 
+    from aiida.orm.utils.log import flush_database_log_handlers
+
     LOGGER.info('Received signal to shut down the daemon worker')
     tasks = [task for task in all_tasks() if task is not current_task()]
 
@@ -33,6 +36,9 @@ async def shutdown_worker(runner: Runner) -> None:
 
     await asyncio.gather(*tasks, return_exceptions=True)
 
+    # Write the buffered log records before the storage is closed
+    flush_database_log_handlers()
+
     # Close every open connection
     get_manager().reset_profile()
 
@@ -49,6 +55,7 @@ def start_daemon_worker(foreground: bool = False, profile_name: str | None = Non
     profile = manager.load_profile(profile_name)
 
     daemon_client = get_daemon_client(profile_name)
+    log.BUFFER_DATABASE_LOGS = True
     configure_logging(with_orm=True, daemon=not foreground, daemon_log_file=daemon_client.daemon_log_file)
 
     LOGGER.debug('Loaded profile %s', profile.name)
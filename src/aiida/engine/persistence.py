@@ -88,7 +88,7 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f"Failed to create a bundle for '{process}': {traceback.format_exc()}")
 
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            process.node.set_checkpoint(serialize.serialize(bundle), compress=True)
         except Exception:
             raise PersistenceError(f"Failed to store a checkpoint for '{process}': {traceback.format_exc()}")
 
@@ -38,6 +38,9 @@ __all__ = (
     'InputPort',
     'JobManager',
     'JobsList',
+    'JobsPollCache',
+    'JobsSnapshot',
+    'JobsSubmitter',
     'OutputPort',
     'PortNamespace',
     'Process',
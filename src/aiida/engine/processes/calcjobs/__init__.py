@@ -15,12 +15,16 @@
 from .calcjob import *
 from .importer import *
 from .manager import *
+from .poll_cache import *
 
 __all__ = (
     'CalcJob',
     'CalcJobImporter',
     'JobManager',
     'JobsList',
+    'JobsPollCache',
+    'JobsSnapshot',
+    'JobsSubmitter',
 )
 
 # fmt: on
@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import io
 import json
 import os
@@ -1039,7 +1040,11 @@ class CalcJob(Process):
             if code_info.code_uuid is None:
                 raise PluginInternalError('CalcInfo should have the information of the code to be launched')
 
-            code = load_code(code_info.code_uuid)
+            code = self.node.backend.entity_cache.get(
+                ('code', code_info.code_uuid),
+                functools.partial(load_code, code_info.code_uuid),
+                (orm.EntityTypes.NODE,),
+            )
 
             # Here are the three values that will determine whether the code is to be run with MPI _if_ they are not
             # ``None``. If any of them are explicitly defined but are not equivalent, an exception is raised. We use the
@@ -16,16 +16,21 @@ import contextvars
 import logging
 import time
 from collections.abc import Hashable, Iterator
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from aiida.common import lang
 from aiida.orm import AuthInfo
 
+from .poll_cache import JobsPollCache, JobsSnapshot
+
 if TYPE_CHECKING:
+    from aiida.engine.processes.exit_code import ExitCode
     from aiida.engine.transports import TransportQueue
+    from aiida.orm import CalcJobNode
     from aiida.schedulers.datastructures import JobInfo
 
-__all__ = ('JobManager', 'JobsList')
+__all__ = ('JobManager', 'JobsList', 'JobsSubmitter')
 
 
 class JobsList:
@@ -43,14 +48,28 @@ class JobsList:
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
     these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+
+    If a :py:class:`~aiida.engine.processes.calcjobs.poll_cache.JobsPollCache` is provided, the guarantees extend to all
+    ``JobsList`` instances using the same cache, even across processes. The daemon workers of a profile share a cache,
+    so the scheduler is queried once per polling interval for all workers together, instead of once per worker.
     """
 
-    def __init__(self, authinfo: AuthInfo, transport_queue: TransportQueue, last_updated: float | None = None):
+    _POLL_CACHE_WAIT_INTERVAL = 1.0
+    """Interval in seconds at which to check the poll cache while another instance is polling the scheduler."""
+
+    def __init__(
+        self,
+        authinfo: AuthInfo,
+        transport_queue: TransportQueue,
+        last_updated: float | None = None,
+        poll_cache: JobsPollCache | None = None,
+    ):
         """Construct an instance for the given authinfo and transport queue.
 
         :param authinfo: The authinfo used to check the jobs list
         :param transport_queue: A transport queue
         :param last_updated: initialize the last updated timestamp
+        :param poll_cache: optional cache of the jobs list shared with other instances for the same authinfo
 
         """
         lang.type_check(last_updated, float, allow_none=True)
@@ -65,6 +84,7 @@ class JobsList:
         self._last_updated = last_updated
         self._update_handle: asyncio.TimerHandle | None = None
         self._polling_jobs: frozenset[str] = frozenset()
+        self._poll_cache = poll_cache
 
     @property
     def logger(self) -> logging.Logger:
@@ -96,6 +116,21 @@ class JobsList:
 
         :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
 
+        """
+        if self._poll_cache is None:
+            snapshot = await self._poll_scheduler()
+        else:
+            snapshot = await self._get_jobs_from_poll_cache(self._poll_cache)
+
+        return dict(snapshot.jobs)
+
+    async def _poll_scheduler(self, poll_cache: JobsPollCache | None = None) -> JobsSnapshot:
+        """Query the scheduler for the jobs in this list.
+
+        :param poll_cache: if specified, also query the jobs registered with this cache by other instances, in case the
+            scheduler cannot query all jobs of the user at once
+        :return: a snapshot of the jobs list
+
         """
         async with self._transport_queue.request_transport(self._authinfo) as request:
             self.logger.info('waiting for transport')
@@ -105,11 +140,14 @@ class JobsList:
             scheduler.set_transport(transport)
 
             self._polling_jobs = frozenset([str(job_id) for job_id in self._job_update_requests.keys()])
+            timestamp = time.time()
 
             if scheduler.get_feature('can_query_by_user'):
-                scheduler_response = scheduler.get_jobs(user='$USER', as_dict=True)
+                queried = None
+                scheduler_response = await scheduler.get_jobs_async(user='$USER', as_dict=True)
             else:
-                scheduler_response = scheduler.get_jobs(jobs=list(self._polling_jobs), as_dict=True)
+                queried = self._polling_jobs.union(poll_cache.get_requested_job_ids() if poll_cache else ())
+                scheduler_response = await scheduler.get_jobs_async(jobs=list(queried), as_dict=True)
 
             # Update the last update time and clear the jobs cache
             self._last_updated = time.time()
@@ -119,7 +157,48 @@ class JobsList:
             for job_id, job_info in scheduler_response.items():
                 jobs_cache[job_id] = job_info
 
-            return jobs_cache
+            return JobsSnapshot(timestamp, jobs_cache, queried)
+
+    async def _get_jobs_from_poll_cache(self, poll_cache: JobsPollCache) -> JobsSnapshot:
+        """Get the current jobs list from the shared poll cache, polling the scheduler if no other process does.
+
+        The job ids of this list are registered with the cache, so that whichever instance polls the scheduler next also
+        queries them. If no other instance is polling, this instance takes the lock and polls the scheduler itself, once
+        the minimum polling interval has elapsed since the last snapshot, which thereby holds across all instances.
+
+        :return: a snapshot that covers all the jobs in this list
+
+        """
+        self._polling_jobs = frozenset(self._job_update_requests.keys())
+        requested_at = time.time()
+        poll_cache.register(self._polling_jobs)
+
+        while True:
+            delay = self._POLL_CACHE_WAIT_INTERVAL
+            snapshot = poll_cache.get_snapshot()
+
+            if snapshot is not None and snapshot.covers(self._polling_jobs, requested_at):
+                break
+
+            with poll_cache.lock() as acquired:
+                if acquired:
+                    # Check again in case another instance wrote a snapshot while we were acquiring the lock
+                    snapshot = poll_cache.get_snapshot()
+                    if snapshot is not None and snapshot.covers(self._polling_jobs, requested_at):
+                        break
+
+                    if snapshot is not None:
+                        delay = snapshot.timestamp + self.get_minimum_update_interval() - time.time()
+
+                    if snapshot is None or delay <= 0:
+                        snapshot = await self._poll_scheduler(poll_cache)
+                        poll_cache.set_snapshot(snapshot)
+                        break
+
+            await asyncio.sleep(delay)
+
+        self._last_updated = snapshot.timestamp
+        return snapshot
 
     async def _update_job_info(self) -> None:
         """Update job information and resolve pending requests.
@@ -205,6 +284,8 @@ class JobsList:
                 )
             else:
                 self._update_handle = None
+                if self._poll_cache is not None:
+                    self._poll_cache.unregister()
 
         # Check if we're already updating
         if self._update_handle is None:
@@ -252,6 +333,102 @@ class JobsList:
         return any(not request.done() for request in self._job_update_requests.values())
 
 
+class JobsSubmitter:
+    """Submitter of calculation jobs with a specific ``AuthInfo``, i.e. computer configured for a specific user.
+
+    Jobs that are submitted within a short window of each other are coalesced and submitted with a single call to the
+    scheduler, see :py:meth:`~aiida.schedulers.scheduler.Scheduler.submit_jobs_async`. This way, when many calculation
+    jobs are launched at the same time, the submission latency is not dominated by the overhead of executing a remote
+    command for each job individually. Jobs that are submitted while a batch is being submitted are collected in the
+    next batch.
+    """
+
+    _SUBMISSION_WINDOW = 0.1
+    """Time in seconds to wait after the first submission request, for other requests to join the batch."""
+
+    _MAX_BATCH_SIZE = 100
+    """Maximum number of jobs submitted with a single call to the scheduler."""
+
+    def __init__(self, authinfo: AuthInfo, transport_queue: TransportQueue):
+        """Construct an instance for the given authinfo and transport queue.
+
+        :param authinfo: The authinfo used to submit the jobs
+        :param transport_queue: A transport queue
+        """
+        self._authinfo = authinfo
+        self._transport_queue = transport_queue
+        self._loop = transport_queue.loop
+        self._logger = logging.getLogger(__name__)
+
+        self._submission_requests: list[tuple[CalcJobNode, asyncio.Future]] = []
+        self._submitting: asyncio.Future | None = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Return the logger configured for this instance.
+
+        :return: the logger
+        """
+        return self._logger
+
+    async def submit_calculation(self, node: CalcJobNode) -> str | ExitCode:
+        """Submit a previously uploaded calculation job to the scheduler, together with other pending requests.
+
+        :param node: the node of the calculation job
+        :return: the job id as returned by the scheduler `submit_job` call
+        """
+        request: asyncio.Future = self._loop.create_future()
+        self._submission_requests.append((node, request))
+
+        if self._submitting is None or self._submitting.done():
+            self._submitting = asyncio.ensure_future(self._submit_pending(), loop=self._loop)
+
+        return await request
+
+    async def _submit_pending(self) -> None:
+        """Submit all pending requests in batches, until there are no more requests left."""
+        from aiida.engine.daemon import execmanager
+
+        await asyncio.sleep(self._SUBMISSION_WINDOW)
+
+        try:
+            async with self._transport_queue.request_transport(self._authinfo) as request:
+                transport = await request
+
+                while self._submission_requests:
+                    batch = self._submission_requests[: self._MAX_BATCH_SIZE]
+                    del self._submission_requests[: self._MAX_BATCH_SIZE]
+
+                    # Requests may have been cancelled while waiting, e.g. because the process was killed
+                    batch = [(node, future) for node, future in batch if not future.done()]
+                    if not batch:
+                        continue
+
+                    self.logger.info(f'AuthInfo<{self._authinfo.pk}>: submitting batch of {len(batch)} jobs')
+                    try:
+                        results = await execmanager.submit_calculations([node for node, _ in batch], transport)
+                    except Exception as exception:
+                        results = [exception] * len(batch)
+
+                    for (_, future), result in zip(batch, results):
+                        if future.done():
+                            continue
+                        if isinstance(result, Exception):
+                            future.set_exception(result)
+                        else:
+                            future.set_result(result)
+        except Exception as exception:
+            # Set the exception on all requests, e.g. if the transport could not be opened
+            requests, self._submission_requests = self._submission_requests, []
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(exception)
+
+        # Requests that came in while the transport was being released are submitted in a new round
+        if self._submission_requests:
+            self._submitting = asyncio.ensure_future(self._submit_pending(), loop=self._loop)
+
+
 class JobManager:
     """A manager for :py:class:`~aiida.engine.processes.calcjobs.calcjob.CalcJob` submitted to ``Computer`` instances.
 
@@ -260,16 +437,26 @@ class JobManager:
     The ``JobManager`` maintains a mapping of :py:class:`~aiida.engine.processes.calcjobs.manager.JobsList` instances
     for each authinfo that has active calculation jobs. These jobslist instances are then responsible for bundling
     scheduler updates for all the jobs they maintain (i.e. that all share the same authinfo) and update their status.
+    Likewise, it maintains a :py:class:`~aiida.engine.processes.calcjobs.manager.JobsSubmitter` for each authinfo, that
+    bundles the submission of jobs launched at the same time.
 
     As long as a :py:class:`~aiida.engine.runners.Runner` will create a single ``JobManager`` instance and use that for
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
-    only hold per runner.
+    only hold per runner, unless the job managers share a ``poll_cache_dirpath``, as those of the daemon workers do.
     """
 
-    def __init__(self, transport_queue: TransportQueue) -> None:
+    def __init__(self, transport_queue: TransportQueue, poll_cache_dirpath: Path | None = None) -> None:
+        """Construct a new instance.
+
+        :param transport_queue: the transport queue used to poll the schedulers
+        :param poll_cache_dirpath: optional directory for the job list caches shared with other processes, see
+            :py:class:`~aiida.engine.processes.calcjobs.poll_cache.JobsPollCache`. It should be unique for the profile.
+        """
         self._transport_queue = transport_queue
         self._job_lists: dict[int, JobsList] = {}
+        self._jobs_submitters: dict[int, JobsSubmitter] = {}
+        self._poll_cache_dirpath = poll_cache_dirpath if JobsPollCache.is_supported() else None
 
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
         """Get or create a new `JobLists` instance for the given authinfo.
@@ -284,10 +471,33 @@ class JobManager:
         # assert authinfo.pk is not None
         pk = cast(int, authinfo.pk)
         if pk not in self._job_lists:
-            self._job_lists[pk] = JobsList(authinfo, self._transport_queue)
+            poll_cache = None
+            if self._poll_cache_dirpath is not None:
+                poll_cache = JobsPollCache(self._poll_cache_dirpath / f'authinfo-{pk}')
+            self._job_lists[pk] = JobsList(authinfo, self._transport_queue, poll_cache=poll_cache)
 
         return self._job_lists[pk]
 
+    def get_jobs_submitter(self, authinfo: AuthInfo) -> JobsSubmitter:
+        """Get or create a new `JobsSubmitter` instance for the given authinfo.
+
+        :param authinfo: the `AuthInfo`
+        :return: a `JobsSubmitter` instance
+        """
+        pk = cast(int, authinfo.pk)
+        if pk not in self._jobs_submitters:
+            self._jobs_submitters[pk] = JobsSubmitter(authinfo, self._transport_queue)
+
+        return self._jobs_submitters[pk]
+
+    async def submit_calculation(self, node: CalcJobNode) -> str | ExitCode:
+        """Submit a previously uploaded calculation job, coalesced with other jobs submitted with the same authinfo.
+
+        :param node: the node of the calculation job
+        :return: the job id as returned by the scheduler `submit_job` call
+        """
+        return await self.get_jobs_submitter(node.get_authinfo()).submit_calculation(node)
+
     @contextlib.contextmanager
     def request_job_info_update(self, authinfo: AuthInfo, job_id: Hashable) -> Iterator[asyncio.Future[JobInfo]]:
         """Get a future that will resolve to information about a given job.
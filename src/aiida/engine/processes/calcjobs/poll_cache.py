@@ -0,0 +1,163 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""File-based cache of scheduler job lists that is shared between the processes, e.g. daemon workers, of a profile."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import uuid
+from collections.abc import Collection, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+import psutil
+
+from aiida.schedulers.datastructures import JobInfo
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = ('JobsPollCache', 'JobsSnapshot')
+
+
+class JobsSnapshot(NamedTuple):
+    """Job list retrieved from a scheduler at a given time."""
+
+    timestamp: float
+    """Time at which the scheduler was queried, as produced by ``time.time()``."""
+
+    jobs: dict[str, JobInfo]
+    """Mapping of job ids to the job info returned by the scheduler."""
+
+    queried: frozenset[str] | None
+    """The job ids the scheduler was queried for, or ``None`` if it was queried for all jobs of the user."""
+
+    def covers(self, job_ids: Collection[str], since: float) -> bool:
+        """Return whether this snapshot contains up to date information for all ``job_ids``.
+
+        A job that is missing from the scheduler output is considered to be finished, so a snapshot can only be used for
+        jobs it was queried for and that were already submitted when it was taken.
+
+        :param job_ids: the job ids for which information is requested.
+        :param since: time after which all of ``job_ids`` were submitted.
+        """
+        if self.timestamp < since:
+            return False
+        return self.queried is None or self.queried.issuperset(job_ids)
+
+
+class JobsPollCache:
+    """Store of the last job list retrieved for an ``AuthInfo``, shared between processes through the file system.
+
+    Each :class:`~aiida.engine.processes.calcjobs.manager.JobsList` using the cache registers the job ids it is waiting
+    for. The first one that needs an update takes the lock, queries the scheduler for the jobs of all registered lists
+    and writes the result as a snapshot, which the other lists then use instead of querying the scheduler themselves.
+    This way, the scheduler is queried once per polling interval for the whole profile instead of once per process.
+
+    The files in ``dirpath`` are:
+
+    * ``snapshot.json``: the last :class:`JobsSnapshot`.
+    * ``snapshot.lock``: locked by the process that is currently querying the scheduler.
+    * ``requests/{pid}-{id}.json``: the job ids a jobs list is waiting for.
+    """
+
+    def __init__(self, dirpath: Path | str):
+        """Construct a new instance.
+
+        :param dirpath: the directory of the cache, which should be unique for the profile and ``AuthInfo``.
+        """
+        self._dirpath = Path(dirpath)
+        self._dirpath_requests = self._dirpath / 'requests'
+        self._filepath_snapshot = self._dirpath / 'snapshot.json'
+        self._filepath_lock = self._dirpath / 'snapshot.lock'
+        self._filepath_request = self._dirpath_requests / f'{os.getpid()}-{uuid.uuid4().hex[:8]}.json'
+        self._dirpath_requests.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Return whether the cache is supported on this platform, which requires ``fcntl`` for file locking."""
+        return fcntl is not None
+
+    def register(self, job_ids: Collection[str]) -> None:
+        """Register the job ids this instance is waiting for, to include them when another process polls the scheduler.
+
+        :param job_ids: the job ids, replacing those of any previous registration.
+        """
+        self._write_atomic(self._filepath_request, json.dumps(sorted(job_ids)))
+
+    def unregister(self) -> None:
+        """Remove the registration of this instance."""
+        self._filepath_request.unlink(missing_ok=True)
+
+    def get_requested_job_ids(self) -> set[str]:
+        """Return the job ids registered by all instances, removing registrations of processes that no longer exist."""
+        job_ids: set[str] = set()
+
+        for filepath in self._dirpath_requests.glob('*.json'):
+            pid = filepath.stem.split('-', 1)[0]
+            if not pid.isdigit() or not psutil.pid_exists(int(pid)):
+                filepath.unlink(missing_ok=True)
+                continue
+            try:
+                job_ids.update(json.loads(filepath.read_text()))
+            except (OSError, ValueError):
+                continue
+
+        return job_ids
+
+    def get_snapshot(self) -> JobsSnapshot | None:
+        """Return the last snapshot, or ``None`` if there is none or it cannot be read."""
+        try:
+            data = json.loads(self._filepath_snapshot.read_text())
+            return JobsSnapshot(
+                timestamp=data['timestamp'],
+                jobs={job_id: JobInfo.load_from_dict(job_info) for job_id, job_info in data['jobs'].items()},
+                queried=None if data['queried'] is None else frozenset(data['queried']),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set_snapshot(self, snapshot: JobsSnapshot) -> None:
+        """Replace the last snapshot."""
+        data = {
+            'timestamp': snapshot.timestamp,
+            'jobs': {job_id: job_info.get_dict() for job_id, job_info in snapshot.jobs.items()},
+            'queried': None if snapshot.queried is None else sorted(snapshot.queried),
+        }
+        self._write_atomic(self._filepath_snapshot, json.dumps(data))
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[bool]:
+        """Try to take the lock for polling the scheduler, without blocking.
+
+        The lock is released automatically by the operating system if the process holding it dies.
+
+        :return: context manager yielding whether the lock was acquired.
+        """
+        with self._filepath_lock.open('a') as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _write_atomic(filepath: Path, content: str) -> None:
+        """Write the content to a temporary file and move it into place, so readers never see a partial file."""
+        filepath_tmp = filepath.with_name(f'.{filepath.name}.{os.getpid()}.tmp')
+        filepath_tmp.write_text(content)
+        os.replace(filepath_tmp, filepath)
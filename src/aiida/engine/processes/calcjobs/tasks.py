@@ -39,6 +39,7 @@ from .monitors import CalcJobMonitorAction, CalcJobMonitorResult, CalcJobMonitor
 
 if TYPE_CHECKING:
     from .calcjob import CalcJob
+    from .manager import JobManager
 
 UPLOAD_COMMAND = 'upload'
 SUBMIT_COMMAND = 'submit'
@@ -120,16 +121,16 @@ async def task_upload_job(process: CalcJob, transport_queue: TransportQueue, can
         return skip_submit
 
 
-async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture):
+async def task_submit_job(node: CalcJobNode, job_manager: JobManager, cancellable: InterruptableFuture):
     """Transport task that will attempt to submit a job calculation.
 
-    The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
-    function is called, wrapped in the exponential_backoff_retry coroutine, which, in case of a caught exception, will
-    retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
-    If all retries fail, the task will raise a TransportTaskException
+    The task will request the job manager to submit the job, which bundles it with other jobs submitted at the same time
+    with the same authinfo. The request is wrapped in the exponential_backoff_retry coroutine, which, in case of a
+    caught exception, will retry after an interval that increases exponentially with the number of retries, for a
+    maximum number of retries. If all retries fail, the task will raise a TransportTaskException
 
     :param node: the node that represents the job calculation
-    :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: The job manager
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
 
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
@@ -142,12 +143,8 @@ async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, ca
     initial_interval = get_config_option(RETRY_INTERVAL_OPTION)
     max_attempts = get_config_option(MAX_ATTEMPTS_OPTION)
 
-    authinfo = node.get_authinfo()
-
     async def do_submit():
-        async with transport_queue.request_transport(authinfo) as request:
-            transport = await cancellable.with_interrupt(request)
-            return execmanager.submit_calculation(node, transport)
+        return await cancellable.with_interrupt(job_manager.submit_calculation(node))
 
     try:
         logger.info(f'scheduled request to submit CalcJob<{node.pk}>')
@@ -457,7 +454,7 @@ async def task_kill_job(node: CalcJobNode, transport_queue: TransportQueue, canc
     async def do_kill():
         async with transport_queue.request_transport(authinfo) as request:
             transport = await cancellable.with_interrupt(request)
-            return execmanager.kill_calculation(node, transport)
+            return await execmanager.kill_calculation(node, transport)
 
     try:
         logger.info(f'scheduled request to kill CalcJob<{node.pk}>')
@@ -567,7 +564,7 @@ class Waiting(plumpy.process_states.Waiting):
                     result = self.submit()
 
             elif self._command == SUBMIT_COMMAND:
-                task_result = await self._launch_task(task_submit_job, node, transport_queue)
+                task_result = await self._launch_task(task_submit_job, node, self.process.runner.job_manager)
 
                 if isinstance(task_result, ExitCode):
                     # The scheduler plugin returned an exit code from ``Scheduler.submit_job`` indicating the
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections
 import concurrent
 import functools
+import time
 import typing as t
 
 import kiwipy
 from kiwipy import communications
 from plumpy.futures import unwrap_kiwi_future
+from plumpy.process_comms import MessageBuilder, MessageType
 
 from aiida.brokers import Broker
 from aiida.common.exceptions import AiidaException
@@ -19,13 +22,81 @@ from aiida.manage.manager import get_manager
 from aiida.orm import ProcessNode, QueryBuilder
 from aiida.tools.query.calculation import CalculationQueryBuilder
 
+if t.TYPE_CHECKING:
+    from aiida.engine.runners import Runner
+
 LOGGER = AIIDA_LOGGER.getChild('process_control')
 
+BATCH_PKS_KEY = 'pks'
+BATCH_MESSAGE_KEY = 'message'
+BATCH_NOWAIT_KEY = 'nowait'
+
+BATCH_ACKNOWLEDGE_TIMEOUT = 10.0
+"""Time in seconds to wait for the daemon workers to acknowledge a batch of actions that is not waited for."""
+
 
 class ProcessTimeoutException(AiidaException):
     """Raised when action to communicate with a process times out."""
 
 
+def get_worker_rpc_identifier(pid: int) -> str:
+    """Return the identifier of the RPC subscriber of the daemon worker with the given system process id.
+
+    :param pid: the system process id of the daemon worker.
+    """
+    return f'aiida.daemon.worker.{pid}'
+
+
+class ProcessControlReceiver:
+    """RPC subscriber of a daemon worker that performs an action on a batch of processes with a single message.
+
+    The message contains the pks of the processes and the message of the action, e.g. to kill, pause or play, that would
+    otherwise be sent to each process separately. The worker performs the action on those processes that are run by its
+    runner and replies with the aggregated results, keyed by the pk as a string. The other processes are ignored, they
+    are either run by another worker or not by any, see :func:`_perform_batched_actions`.
+    """
+
+    def __init__(self, runner: Runner):
+        """Construct a new instance.
+
+        :param runner: the runner of the daemon worker.
+        """
+        self._runner = runner
+
+    async def __call__(self, communicator: kiwipy.Communicator, msg: dict[str, t.Any]) -> dict[str, dict[str, t.Any]]:
+        """Perform the action on the processes of the batch that are run by the runner of this worker.
+
+        :param communicator: the communicator that received the message.
+        :param msg: the batch message, with the pks, the message of the action and whether to wait for the results.
+        :return: the results of the action for each process and the errors for those processes where it excepted. If
+            the results are not waited for, the results are ``None``.
+        """
+        processes = [process for pk in msg[BATCH_PKS_KEY] if (process := self._runner.get_process(pk)) is not None]
+        futures = [process.message_receive(communicator, msg[BATCH_MESSAGE_KEY]) for process in processes]
+
+        if msg.get(BATCH_NOWAIT_KEY, False):
+            return {'results': {str(process.pid): None for process in processes}, 'errors': {}}
+
+        outcomes = await asyncio.gather(*[self._resolve(future) for future in futures], return_exceptions=True)
+        response: dict[str, dict[str, t.Any]] = {'results': {}, 'errors': {}}
+
+        for process, outcome in zip(processes, outcomes):
+            if isinstance(outcome, Exception):
+                response['errors'][str(process.pid)] = str(outcome)
+            else:
+                response['results'][str(process.pid)] = outcome
+
+        return response
+
+    @staticmethod
+    async def _resolve(future: t.Any) -> t.Any:
+        """Return the result of the future, awaiting the futures that it resolves to until it resolves to a value."""
+        result = future
+        while isinstance(result, (asyncio.Future, concurrent.futures.Future)):
+            result = await asyncio.wrap_future(result)
+        return result
+
+
 def get_active_processes(paused: bool = False, project: str | list[str] = '*') -> list[ProcessNode] | list[t.Any]:
     """Return all active processes, i.e., those with a process state of created, waiting or running.
 
@@ -128,7 +199,7 @@ def play_processes(
         return
 
     controller = get_manager().get_process_controller()
-    _perform_actions(processes, controller.play_process, 'play', 'playing', timeout)
+    _perform_actions(processes, controller.play_process, 'play', 'playing', timeout, message=MessageBuilder.play())
 
 
 def pause_processes(
@@ -162,7 +233,8 @@ def pause_processes(
 
     controller = get_manager().get_process_controller()
     action = functools.partial(controller.pause_process, msg_text=msg_text)
-    _perform_actions(processes, action, 'pause', 'pausing', timeout)
+    message = MessageBuilder.pause(text=msg_text)
+    _perform_actions(processes, action, 'pause', 'pausing', timeout, message=message)
 
 
 def kill_processes(
@@ -197,7 +269,8 @@ def kill_processes(
 
     controller = get_manager().get_process_controller()
     action = functools.partial(controller.kill_process, msg_text=msg_text, force_kill=force)
-    _perform_actions(processes, action, 'kill', 'killing', timeout)
+    message = MessageBuilder.kill(text=msg_text, force_kill=force)
+    _perform_actions(processes, action, 'kill', 'killing', timeout, message=message)
 
 
 def _perform_actions(
@@ -206,26 +279,57 @@ def _perform_actions(
     infinitive: str,
     present: str,
     timeout: float | None = None,
+    message: MessageType | None = None,
     **kwargs: t.Any,
 ) -> None:
     """Perform an action on a list of processes.
 
+    If the message of the action is specified and there is more than one process, the action is first sent in a single
+    batch to each daemon worker, see :func:`_perform_batched_actions`. The processes that are not run by any of the
+    workers fall back to the action being sent to each process separately. If a worker received the batch but did not
+    reply, it may still perform the action, so the remaining processes are reported as unreached instead, as they could
+    be run by that worker. The timeout applies to the batch and the separate actions together.
+
     :param processes: The list of processes to perform the action on.
     :param action: The action to perform.
     :param infinitive: The infinitive of the verb that represents the action.
     :param present: The present tense of the verb that represents the action.
     :param past: The past tense of the verb that represents the action.
     :param timeout: Raise a ``ProcessTimeoutException`` if the process does not respond within this amount of seconds.
+    :param message: The message that corresponds to the action, which is sent to the processes by the daemon workers.
     :param kwargs: Keyword arguments that will be passed to the method ``action``.
     :raises ``ProcessTimeoutException``: If the processes do not respond within the timeout.
     """
     futures = {}
+    active: list[ProcessNode] = []
+    deadline = time.monotonic() + timeout if timeout and timeout != float('inf') else None
 
     for process in processes:
         if process.is_terminated:
             LOGGER.error(f'Process<{process.pk}> is already terminated.')
             continue
-
+        active.append(process)
+
+    if message is not None and len(active) > 1:
+        pks = [t.cast(int, process.pk) for process in active]
+        reached, unanswered = _perform_batched_actions(pks, message, infinitive, present, timeout)
+        active = [process for process in active if process.pk not in reached]
+
+        if unanswered:
+            for process in active:
+                LOGGER.error(
+                    f'Process<{process.pk}> is unreachable: daemon worker(s) {", ".join(unanswered)} did not reply.'
+                )
+            active = []
+
+    if deadline is not None and active:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            for process in active:
+                LOGGER.error(f'Call to {infinitive} Process<{process.pk}> timed out.')
+            active = []
+
+    for process in active:
         try:
             future = action(process.pk, **kwargs)
             LOGGER.report(f'Request to {infinitive} Process<{process.pk}> sent.')
@@ -285,12 +389,7 @@ def _resolve_futures(
             except Exception as exception:
                 LOGGER.error(f'Failed to {infinitive} Process<{process.pk}>: {exception}')
             else:
-                if result is True:
-                    LOGGER.report(f'Request to {infinitive} Process<{process.pk}> processed.')
-                elif result is False:
-                    LOGGER.error(f'Problem {present} Process<{process.pk}>')
-                else:
-                    LOGGER.error(f'Got unexpected response when {present} Process<{process.pk}>: {result}')
+                _report_result(t.cast(int, process.pk), result, infinitive, present)
     except concurrent.futures.TimeoutError:
         # We cancel the tasks that are not done
         undone_futures = {future: process for future, process in unwrapped_futures.items() if not future.done()}
@@ -303,3 +402,92 @@ def _resolve_futures(
                     LOGGER.error(f'Call to {infinitive} Process<{process.pk}> timed out and was cancelled.')
                 else:
                     LOGGER.error(f'Call to {infinitive} Process<{process.pk}> timed out but could not be cancelled.')
+
+
+def _perform_batched_actions(
+    pks: list[int], message: MessageType, infinitive: str, present: str, timeout: float | None = None
+) -> tuple[set[int], list[str]]:
+    """Perform an action on a list of processes by sending a single message to each daemon worker.
+
+    Instead of one RPC per process, each worker receives the pks of all processes and performs the action on those that
+    it runs, replying with the aggregated results, see :class:`ProcessControlReceiver`. The workers are discovered
+    through the daemon, so if the daemon is not running no processes are reached.
+
+    :param pks: The pks of the processes to perform the action on.
+    :param message: The message of the action that is passed to the processes.
+    :param infinitive: The infinitive form of the action verb.
+    :param present: The present tense form of the action verb.
+    :param timeout: If None or 0, the results of the action are not waited for, and only the acknowledgements of the
+        workers are, for at most ``BATCH_ACKNOWLEDGE_TIMEOUT`` seconds. Otherwise, the amount of seconds to wait for the
+        results, where float('inf') waits until all workers have replied.
+    :return: The pks of the processes that were reached through one of the daemon workers and the pids of the workers
+        that did not reply within the timeout. Those workers may still perform the action on their processes, which are
+        not known, so no other process should be sent the action separately. A worker that replied with an error, e.g.
+        because it could not be routed to, did not perform the action.
+    """
+    try:
+        workers = get_daemon_client().get_worker_info().get('info', {})
+    except DaemonException:
+        return set(), []
+
+    communicator = get_manager().get_communicator()
+    batch = {BATCH_PKS_KEY: pks, BATCH_MESSAGE_KEY: message, BATCH_NOWAIT_KEY: not timeout}
+    futures: dict[concurrent.futures.Future, str] = {}
+
+    for pid in workers:
+        try:
+            future = communicator.rpc_send(get_worker_rpc_identifier(int(pid)), batch)
+        except communications.UnroutableError:
+            LOGGER.debug(f'Daemon worker<{pid}> is unreachable.')
+        else:
+            futures[unwrap_kiwi_future(future)] = str(pid)
+
+    if not timeout:
+        timeout = BATCH_ACKNOWLEDGE_TIMEOUT
+    elif timeout == float('inf'):
+        timeout = None
+
+    reached: set[int] = set()
+    unanswered: list[str] = []
+    done, not_done = concurrent.futures.wait(futures.keys(), timeout=timeout)
+
+    for future in not_done:
+        future.cancel()
+        unanswered.append(futures[future])
+        LOGGER.warning(f'Call to {infinitive} processes on daemon worker<{futures[future]}> timed out.')
+
+    for future in done:
+        try:
+            response = future.result()
+        except Exception as exception:
+            LOGGER.debug(f'Failed to {infinitive} processes on daemon worker<{futures[future]}>: {exception}')
+            continue
+
+        for pk, result in response['results'].items():
+            reached.add(int(pk))
+            if result is None:
+                LOGGER.report(f'Request to {infinitive} Process<{pk}> sent. Skipping waiting for response.')
+            else:
+                _report_result(int(pk), result, infinitive, present)
+
+        for pk, error in response['errors'].items():
+            reached.add(int(pk))
+            LOGGER.error(f'Failed to {infinitive} Process<{pk}>: {error}')
+
+    return reached, unanswered
+
+
+def _report_result(pk: int, result: t.Any, infinitive: str, present: str) -> None:
+    """Log the result of an action on a process.
+
+    :param pk: The pk of the process.
+    :param result: The result of the action, which should be a boolean.
+    :param infinitive: The infinitive form of the action verb.
+    :param present: The present tense form of the action verb.
+    """
+    if result is True:
+        LOGGER.report(f'Request to {infinitive} Process<{pk}> processed.')
+    elif result is False:
+        LOGGER.error(f'Problem {present} Process<{pk}>')
+    else:
+        LOGGER.error(f'Got unexpected response when {present} Process<{pk}>: {result}')
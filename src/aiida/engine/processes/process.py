@@ -14,6 +14,7 @@ import asyncio
 import collections
 import copy
 import enum
+import functools
 import inspect
 import logging
 import traceback
@@ -188,6 +189,9 @@ class Process(PlumpyProcess):
         if self._logger is None:
             self.set_logger(self.node.logger)
 
+        self.runner.add_process(self)
+        self.add_cleanup(functools.partial(self.runner.remove_process, self))
+
     @classmethod
     def get_exit_statuses(cls, exit_code_labels: Iterable[str]) -> list[int]:
         """Return the exit status (integers) for the given exit code labels.
@@ -464,18 +468,22 @@ class Process(PlumpyProcess):
             self.node.set_process_state(self._state.LABEL)
             return
 
-        # We need to guarantee that the process state gets updated even if the ``update_outputs`` call excepts, for
-        # example if the process implementation attaches an invalid output through ``Process.out``, and so we call the
-        # ``ProcessNode.set_process_state`` in the finally-clause. This way the state gets properly set on the node even
-        # if the process is transitioning to the terminal excepted state.
-        try:
-            self.update_outputs()
-        except ValueError:
-            raise
-        finally:
-            self.node.set_process_state(self._state.LABEL)  # type: ignore[arg-type]
+        # The updates of the node attributes for the state transition are written to the database in one go, when the
+        # batch update context exits, which also happens if the ``update_outputs`` call excepts.
+        with self.node.base.attributes.batch_update():
+            # We need to guarantee that the process state gets updated even if the ``update_outputs`` call excepts, for
+            # example if the process implementation attaches an invalid output through ``Process.out``, and so we call
+            # the ``ProcessNode.set_process_state`` in the finally-clause. This way the state gets properly set on the
+            # node even if the process is transitioning to the terminal excepted state.
+            try:
+                self.update_outputs()
+            except ValueError:
+                raise
+            finally:
+                self.node.set_process_state(self._state.LABEL)  # type: ignore[arg-type]
+
+            self._save_checkpoint()
 
-        self._save_checkpoint()
         set_process_state_change_timestamp(self.node)
 
         # The updating of outputs and state has to be performed before the super is called because the super will
@@ -487,6 +495,8 @@ class Process(PlumpyProcess):
     @override
     def on_terminated(self) -> None:
         """Called when a Process enters a terminal state."""
+        from aiida.orm.utils.log import flush_database_log_handlers
+
         super().on_terminated()
         if self._enable_persistence:
             try:
@@ -500,6 +510,9 @@ class Process(PlumpyProcess):
         except exceptions.ModificationNotAllowed:
             pass
 
+        # Make sure that all log records of the process are written to the database once it has terminated
+        flush_database_log_handlers()
+
     @override
     def on_except(self, exc_info: tuple[Any, Exception, TracebackType]) -> None:
         """Log the exception by calling the report method with formatted stack trace from exception info object
@@ -530,8 +543,9 @@ class Process(PlumpyProcess):
         if isinstance(result, int):
             self.node.set_exit_status(result)
         elif isinstance(result, ExitCode):
-            self.node.set_exit_status(result.status)
-            self.node.set_exit_message(result.message)
+            with self.node.base.attributes.batch_update():
+                self.node.set_exit_status(result.status)
+                self.node.set_exit_message(result.message)
         else:
             raise ValueError(
                 f'the result should be an integer, ExitCode or None, got {type(result)} {result} {self.pid}'
@@ -545,8 +559,9 @@ class Process(PlumpyProcess):
 
         """
         super().on_paused(msg)
-        self._save_checkpoint()
-        self.node.pause()
+        with self.node.base.attributes.batch_update():
+            self._save_checkpoint()
+            self.node.pause()
 
     @override
     def on_playing(self) -> None:
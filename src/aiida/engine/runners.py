@@ -13,11 +13,13 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+import pathlib
 import signal
 import threading
 import uuid
+import weakref
 from collections.abc import Callable
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, cast
 
 import kiwipy
 from plumpy import run_until_complete
@@ -54,6 +56,125 @@ TYPE_RUN_PROCESS = Process | type[Process] | ProcessBuilder
 TYPE_SUBMIT_PROCESS = Process | type[Process] | ProcessBuilder
 
 
+class ProcessTerminationWatcher:
+    """Polling mechanism that checks whether processes are terminated, as a fail-safe for missed broadcasts.
+
+    The states of all watched processes are checked with a single query every ``poll_interval`` seconds, instead of
+    with one query per process. Processes are checked for the first time as soon as possible after they are watched,
+    together with all other processes that are watched in the same iteration of the event loop.
+
+    The ``num_polls`` and ``num_terminated_by_polling`` counters are the number of times the states were checked and
+    the number of processes whose termination was detected by polling, before the broadcast of their termination was
+    received. Without a communicator the latter includes all processes, as there are no broadcasts to begin with.
+    """
+
+    _query_batch_size = 500
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, poll_interval: int | float):
+        """Construct a new watcher.
+
+        :param loop: the event loop on which to schedule the polling and the callbacks.
+        :param poll_interval: interval in seconds between checking the states of the watched processes.
+        """
+        self._loop = loop
+        self._poll_interval = poll_interval
+        self._callbacks: dict[int, list[Callable[[], Any]]] = {}
+        self._handle: asyncio.Handle | None = None
+        self._poll_scheduled_soon = False
+        self.num_polls = 0
+        self.num_terminated_by_polling = 0
+
+    @property
+    def watched(self) -> set[int]:
+        """Return the pks of the processes that are being watched."""
+        return set(self._callbacks)
+
+    def watch(self, pk: int, callback: Callable[[], Any]) -> None:
+        """Schedule the callback to be called once the process with the given pk is found to be terminated.
+
+        :param pk: pk of the process
+        :param callback: function to be called upon process termination
+        """
+        self._callbacks.setdefault(pk, []).append(callback)
+
+        if not self._poll_scheduled_soon:
+            self._schedule_poll(soon=True)
+
+    def unwatch(self, pk: int, callback: Callable[[], Any]) -> None:
+        """Stop watching the process for the given callback, for example because its termination was broadcast.
+
+        :param pk: pk of the process
+        :param callback: the callback that was passed to :meth:`watch`
+        """
+        callbacks = self._callbacks.get(pk, [])
+
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+        if not callbacks:
+            self._callbacks.pop(pk, None)
+
+        if not self._callbacks:
+            self.close()
+
+    def close(self) -> None:
+        """Cancel the scheduled poll, if any."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+        self._poll_scheduled_soon = False
+
+    def _schedule_poll(self, soon: bool = False) -> None:
+        """Schedule the next poll, replacing the currently scheduled one, if any."""
+        self.close()
+        if soon:
+            self._handle = self._loop.call_soon(self._poll)
+        else:
+            self._handle = self._loop.call_later(self._poll_interval, self._poll)
+        self._poll_scheduled_soon = soon
+
+    def _poll(self) -> None:
+        """Check the states of all watched processes, call the callbacks of the terminated ones and reschedule."""
+        self._handle = None
+        self._poll_scheduled_soon = False
+
+        if not self._callbacks:
+            return
+
+        try:
+            terminated = self._get_terminated(list(self._callbacks))
+        except Exception:
+            LOGGER.exception('failed to check the states of %d processes, retrying later', len(self._callbacks))
+            terminated = set()
+
+        self.num_polls += 1
+
+        for pk in terminated:
+            LOGGER.info('Process<%d> confirmed to be terminated by backup polling mechanism', pk)
+            self.num_terminated_by_polling += 1
+            for callback in self._callbacks.pop(pk, []):
+                self._loop.call_soon(callback)
+
+        if self._callbacks:
+            self._schedule_poll()
+
+    @classmethod
+    def _get_terminated(cls, pks: list[int]) -> set[int]:
+        """Return the pks of the given processes that are terminated."""
+        from aiida.common.utils import batch_iter
+        from aiida.orm import QueryBuilder
+
+        states = [state.value for state in (ProcessState.FINISHED, ProcessState.EXCEPTED, ProcessState.KILLED)]
+        terminated: set[int] = set()
+
+        for _, batch in batch_iter(pks, cls._query_batch_size):
+            filters = {'id': {'in': batch}, f'attributes.{ProcessNode.PROCESS_STATE_KEY}': {'in': states}}
+            query = QueryBuilder().append(ProcessNode, filters=filters, project='id')
+            terminated.update(query.all(flat=True))
+
+        return terminated
+
+
 class Runner:
     """Class that can launch processes by running in the current interpreter or by submitting them to the daemon."""
 
@@ -69,6 +190,7 @@ class Runner:
         communicator: kiwipy.Communicator | None = None,
         broker_submit: bool = False,
         persister: Persister | None = None,
+        job_poll_cache_dirpath: pathlib.Path | None = None,
     ):
         """Construct a new runner.
 
@@ -77,6 +199,8 @@ class Runner:
         :param communicator: the communicator to use
         :param broker_submit: if True, processes will be submitted to the broker, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
+        :param job_poll_cache_dirpath: optional directory of a scheduler job list cache to share with other runners, see
+            :class:`~aiida.engine.processes.calcjobs.manager.JobManager`
 
         """
         assert not (broker_submit and persister is None), (
@@ -87,9 +211,11 @@ class Runner:
         self._poll_interval = poll_interval
         self._broker_submit = broker_submit
         self._transport = transports.TransportQueue(self._loop)
-        self._job_manager = manager.JobManager(self._transport)
+        self._job_manager = manager.JobManager(self._transport, job_poll_cache_dirpath)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
+        self._termination_watcher = ProcessTerminationWatcher(self._loop, poll_interval)
+        self._processes: weakref.WeakValueDictionary[int, Process] = weakref.WeakValueDictionary()
 
         if communicator is not None:
             self._communicator = wrap_communicator(communicator, self._loop)
@@ -131,6 +257,11 @@ class Runner:
     def job_manager(self) -> manager.JobManager:
         return self._job_manager
 
+    @property
+    def termination_watcher(self) -> ProcessTerminationWatcher:
+        """Return the polling mechanism used as a fail-safe by :meth:`call_on_process_finish`."""
+        return self._termination_watcher
+
     @property
     def controller(self) -> RemoteProcessThreadController | None:
         """Get the controller used by this runner."""
@@ -147,6 +278,33 @@ class Runner:
     def is_closed(self) -> bool:
         return self._closed
 
+    def add_process(self, process: Process) -> None:
+        """Register a process that is run by this runner, such that it can be retrieved by :meth:`get_process`.
+
+        The runner only keeps a weak reference, so the process is dropped once it is no longer referenced elsewhere.
+
+        :param process: the process to register.
+        """
+        # The pid of an AiiDA process is the pk of its node
+        self._processes[cast(int, process.pid)] = process
+
+    def remove_process(self, process: Process) -> None:
+        """Unregister a process that was registered with :meth:`add_process`.
+
+        :param process: the process to unregister.
+        """
+        pk = cast(int, process.pid)
+        if self._processes.get(pk) is process:
+            del self._processes[pk]
+
+    def get_process(self, pk: int) -> Process | None:
+        """Return the process with the given pk if it is run by this runner.
+
+        :param pk: the pk of the process node.
+        :return: the process instance or ``None`` if the process is not run by this runner.
+        """
+        return self._processes.get(pk)
+
     def start(self) -> None:
         """Start the internal event loop."""
         self._loop.run_forever()
@@ -164,6 +322,7 @@ class Runner:
     def close(self) -> None:
         """Close the runner by stopping the loop."""
         assert not self._closed
+        self._termination_watcher.close()
         self.stop()
         if not self._loop.is_running():
             self._loop.close()
@@ -309,12 +468,13 @@ class Runner:
 
         This method will add a broadcast subscriber that will listen for state changes of the target process to be
         terminated. As a fail-safe, a polling-mechanism is used to check the state of the process, should the broadcast
-        message be missed by the subscriber, in order to prevent the caller to wait indefinitely.
+        message be missed by the subscriber, in order to prevent the caller to wait indefinitely. The polling is done
+        for all processes at once by the :class:`ProcessTerminationWatcher` of the runner.
 
         :param pk: pk of the process
         :param callback: function to be called upon process termination
         """
-        node = load_node(pk=pk)
+        load_node(pk=pk)
         subscriber_identifier = str(uuid.uuid4())
         event = threading.Event()
 
@@ -331,17 +491,19 @@ class Runner:
                 callback()
             finally:
                 event.set()
+                self._termination_watcher.unwatch(pk, wrapped_callback)
                 if self.communicator:
                     self.communicator.remove_broadcast_subscriber(subscriber_identifier)
 
-        broadcast_filter = kiwipy.BroadcastFilter(functools.partial(inline_callback, event), sender=pk)
+        wrapped_callback = functools.partial(inline_callback, event)
+        broadcast_filter = kiwipy.BroadcastFilter(wrapped_callback, sender=pk)
         for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
             broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
 
         if self.communicator:
             LOGGER.info('adding subscriber for broadcasts of %d', pk)
             self.communicator.add_broadcast_subscriber(broadcast_filter, subscriber_identifier)
-        self._poll_process(node, functools.partial(inline_callback, event))
+        self._termination_watcher.watch(pk, wrapped_callback)
 
     def get_process_future(self, pk: int) -> futures.ProcessFuture:
         """Return a future for a process.
@@ -351,16 +513,3 @@ class Runner:
         :return: A future representing the completion of the process node
         """
         return futures.ProcessFuture(pk, self._loop, self._poll_interval, self._communicator)
-
-    def _poll_process(self, node, callback):
-        """Check whether the process state of the node is terminated and call the callback or reschedule it.
-
-        :param node: the process node
-        :param callback: callback to be called when process is terminated
-        """
-        if node.is_terminated:
-            args = [node.__class__.__name__, node.pk]
-            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', *args)
-            self._loop.call_soon(callback)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_process, node, callback)
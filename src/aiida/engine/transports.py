@@ -73,10 +73,10 @@ class TransportQueue:
 
         from plumpy import ensure_portal
 
-        # NOTE: We need to ensure the portal here only because
-        # our scheduler has only a sync interface and _get_jobs_from_scheduler is using that
-        # if we ever provide a fully async scheduler interface then we can remove this here
-        # An issue is opened to reference this https://github.com/aiidateam/aiida-core/issues/7222
+        # NOTE: The built-in scheduler plugins are addressed through their async interface, but we still need to
+        # ensure the portal here for the sync transport calls in calcjob monitors and for scheduler plugins that
+        # only implement the sync interface, whose async methods fall back on it.
+        # See https://github.com/aiidateam/aiida-core/issues/7222
         await ensure_portal()
 
         open_callback_handle = None
@@ -242,6 +242,26 @@ class ProfileOptionsSchema(BaseModel, defer_build=True):
         description='Maximum number of transport task attempts before a Process is Paused.',
         json_schema_extra={'requires_daemon_restart': True},
     )
+    transport__upload_pack_threshold: int = Field(
+        0,
+        description='Minimum number of files written by a calculation job plugin for them to be uploaded as a single '
+        'tar archive that is extracted on the remote, instead of file by file. Set to zero to disable.',
+        json_schema_extra={'requires_daemon_restart': True},
+    )
+    transport__retrieve_archive_threshold: int = Field(
+        0,
+        description='Minimum number of items to retrieve for a calculation job for them to be packed in a single '
+        'tar archive on the remote that is retrieved and unpacked locally, instead of retrieving them item by item. '
+        'Requires the transport to support executing commands. Set to zero to disable.',
+        json_schema_extra={'requires_daemon_restart': True},
+    )
+    transport__local_copy_cache_size: int = Field(
+        0,
+        description='Maximum total size in MB of the files of the `local_copy_list` of calculation jobs that are kept '
+        'in a cache on each computer, such that files used by multiple calculations are uploaded only once. The least '
+        'recently used files are removed from the cache when it is full. Set to zero to disable.',
+        json_schema_extra={'requires_daemon_restart': True},
+    )
     broker__task_timeout: int = Field(
         10,
         description='Timeout in seconds for task/RPC communications with the message broker.',
@@ -253,6 +273,13 @@ class ProfileOptionsSchema(BaseModel, defer_build=True):
         json_schema_extra={'deprecated_by': 'broker.task_timeout', 'requires_daemon_restart': True},
     )
     storage__sandbox: str | None = Field(None, description='Absolute path to the directory to store sandbox folders.')
+    storage__array_cache_size: int = Field(
+        512,
+        description='Maximum total size in MB of the arrays of stored `ArrayData` nodes that are cached in memory '
+        'after being read. The least recently used arrays are removed from the cache when it is full. Set to zero to '
+        'disable.',
+        json_schema_extra={'requires_daemon_restart': True},
+    )
     caching__default_enabled: bool = Field(
         False,
         description='Enable calculation caching by default.',
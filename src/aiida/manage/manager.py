@@ -496,12 +496,19 @@ class Manager:
         :return: a runner configured to work in the daemon configuration
 
         """
+        import os
+
         from plumpy.persistence import LoadSaveContext
 
         from aiida.engine import persistence
+        from aiida.engine.processes.control import ProcessControlReceiver, get_worker_rpc_identifier
         from aiida.engine.processes.launcher import ProcessLauncher
+        from aiida.manage.configuration.settings import AiiDAConfigPathResolver
 
-        runner = self.create_runner(broker_submit=True, loop=loop)
+        # The daemon workers of a profile share their scheduler job lists, so each scheduler is polled once per interval
+        profile = self.get_profile()
+        job_poll_cache_dirpath = AiiDAConfigPathResolver().daemon_dir / 'jobs' / profile.name if profile else None
+        runner = self.create_runner(broker_submit=True, loop=loop, job_poll_cache_dirpath=job_poll_cache_dirpath)
         runner_loop = runner.loop
 
         # Listen for incoming launch requests
@@ -515,6 +522,11 @@ class Manager:
         assert runner.communicator is not None, 'communicator not set for runner'
         runner.communicator.add_task_subscriber(task_receiver)
 
+        # Listen for batches of control actions on the processes run by this worker
+        runner.communicator.add_rpc_subscriber(
+            ProcessControlReceiver(runner), identifier=get_worker_rpc_identifier(os.getpid())
+        )
+
         return runner
 
     def check_version(self):
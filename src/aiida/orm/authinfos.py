@@ -44,6 +44,7 @@ class AuthInfoCollection(entities.Collection['AuthInfo']):
         :param pk: the pk of the entry to delete
         """
         self._backend.authinfos.delete(pk)
+        self._backend.entity_cache.invalidate(entities.EntityTypes.AUTHINFO)
 
 
 class AuthInfo(entities.Entity['BackendAuthInfo', AuthInfoCollection]):
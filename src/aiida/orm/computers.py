@@ -11,7 +11,8 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, ClassVar
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 from uuid import UUID
 
 from aiida.common import exceptions
@@ -30,6 +31,8 @@ if TYPE_CHECKING:
 
 __all__ = ('Computer',)
 
+T = TypeVar('T')
+
 
 class ComputerCollection(entities.Collection['Computer']):
     """The collection of Computer entries."""
@@ -63,7 +66,9 @@ class ComputerCollection(entities.Collection['Computer']):
 
     def delete(self, pk: int) -> None:
         """Delete the computer with the given id"""
-        return self._backend.computers.delete(pk)
+        self._backend.computers.delete(pk)
+        self._backend.entity_cache.invalidate(entities.EntityTypes.COMPUTER)
+        self._backend.entity_cache.invalidate(entities.EntityTypes.AUTHINFO)
 
 
 class Computer(entities.Entity['BackendComputer', ComputerCollection]):
@@ -526,12 +531,16 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
 
         :return: The minimum interval (in seconds).
         """
-        try:
-            default = self.get_transport_class().DEFAULT_MINIMUM_JOB_POLL_INTERVAL
-        except (exceptions.ConfigurationError, AttributeError):
-            default = self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT
 
-        return self.get_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, default)
+        def get_minimum_job_poll_interval() -> float:
+            try:
+                default = self.get_transport_class().DEFAULT_MINIMUM_JOB_POLL_INTERVAL
+            except (exceptions.ConfigurationError, AttributeError):
+                default = self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT
+
+            return self.get_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, default)
+
+        return self._get_cached('minimum_job_poll_interval', get_minimum_job_poll_interval)
 
     def set_minimum_job_poll_interval(self, interval: float) -> None:
         """Set the minimum interval between subsequent requests to update the list
@@ -575,15 +584,18 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
         """
         from . import authinfos
 
-        try:
-            authinfo = authinfos.AuthInfo.get_collection(self.backend).get(dbcomputer_id=self.pk, aiidauser_id=user.pk)
-        except exceptions.NotExistent as exc:
-            raise exceptions.NotExistent(
-                f'Computer `{self.label}` (ID={self.pk}) not configured for user `{user.get_short_name()}` '
-                f'(ID={user.pk}) - use `verdi computer configure` first'
-            ) from exc
-
-        return authinfo
+        def get_authinfo() -> AuthInfo:
+            try:
+                return authinfos.AuthInfo.get_collection(self.backend).get(dbcomputer_id=self.pk, aiidauser_id=user.pk)
+            except exceptions.NotExistent as exc:
+                raise exceptions.NotExistent(
+                    f'Computer `{self.label}` (ID={self.pk}) not configured for user `{user.get_short_name()}` '
+                    f'(ID={user.pk}) - use `verdi computer configure` first'
+                ) from exc
+
+        return self._get_cached(
+            ('authinfo', user.pk), get_authinfo, entities.EntityTypes.AUTHINFO, entities.EntityTypes.USER
+        )
 
     @property
     def is_configured(self) -> bool:
@@ -648,7 +660,7 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
     def get_transport_class(self) -> type[Transport]:
         """Get the transport class for this computer.  Can be used to instantiate a transport instance."""
         try:
-            return TransportFactory(self.transport_type)
+            return self._get_cached('transport_class', lambda: TransportFactory(self.transport_type))
         except exceptions.EntryPointError as exception:
             raise exceptions.ConfigurationError(
                 f'No transport found for {self.label} [type {self.transport_type}], message: {exception}'
@@ -657,7 +669,7 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
     def get_scheduler(self) -> Scheduler:
         """Get a scheduler instance for this computer"""
         try:
-            scheduler_class = SchedulerFactory(self.scheduler_type)
+            scheduler_class = self._get_cached('scheduler_class', lambda: SchedulerFactory(self.scheduler_type))
             # I call the init without any parameter
             return scheduler_class()
         except exceptions.EntryPointError as exception:
@@ -665,6 +677,23 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
                 f'No scheduler found for {self.label} [type {self.scheduler_type}], message: {exception}'
             )
 
+    def _get_cached(self, name: Any, factory: Callable[[], T], *depends_on: entities.EntityTypes) -> T:
+        """Return a value derived from this computer from the entity cache of its backend, computing it if necessary.
+
+        The value is cached until a computer, or an entity of one of the other given types, is written or deleted. If
+        the computer is not stored, the value is not cached.
+
+        :param name: the name of the value, which should be unique among the values cached for a computer.
+        :param factory: a function without arguments that computes the value.
+        :param depends_on: the types of the entities, other than computers, that the value depends on.
+        """
+        if not self.is_stored:
+            return factory()
+
+        return self.backend.entity_cache.get(
+            ('computer', self.pk, name), factory, (entities.EntityTypes.COMPUTER, *depends_on)
+        )
+
     def configure(self, user: User | None = None, **kwargs: Any) -> AuthInfo:
         """Configure a computer for a user with valid auth params passed via kwargs
 
@@ -0,0 +1,112 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Module with the in-memory cache of entities, and values derived from them, that are loaded repeatedly."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+
+if t.TYPE_CHECKING:
+    from aiida.orm.entities import EntityTypes
+
+T = t.TypeVar('T')
+
+
+class EntityCache:
+    """Least recently used cache of entities, and values derived from them, that rarely change.
+
+    This class should not be instantiated directly, but rather accessed through the storage backend instance, such that
+    there is one cache per profile.
+
+    Processes, and calculation jobs in particular, repeatedly load the same computers, authorization infos, users and
+    codes, which each requires queries to the database. Each entry of this cache declares the types of entities that it
+    depends on, and is discarded whenever an entity of one of these types is written or deleted through the ORM of this
+    interpreter. Changes that are made by other interpreters, for example with ``verdi`` while the daemon is running,
+    are therefore only picked up once the cache is cleared, for example by restarting the daemon.
+
+    Changes to stored nodes do not invalidate the entries that depend on nodes, since these can only change their
+    extras and some process attributes, which entities still read from the database when accessed. Only deleting nodes
+    does. Entries are also versioned: if the cache is invalidated while a value is being computed, the value is returned
+    but not cached, since it may already be outdated.
+    """
+
+    def __init__(self, max_size: int = 1024, scope: Callable[[], Hashable] | None = None):
+        """Construct a new instance.
+
+        :param max_size: the maximum number of entries in the cache, beyond which the least recently used entries are
+            discarded.
+        :param scope: optional function that returns the current scope of the entries, for example the database session
+            to which the cached entities are bound. Entries are only returned in the scope in which they were cached.
+        """
+        self._max_size = max_size
+        self._scope = scope
+        self._entries: OrderedDict[Hashable, tuple[t.Any, frozenset[EntityTypes]]] = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum number of entries in the cache."""
+        return self._max_size
+
+    @property
+    def version(self) -> int:
+        """Return the version of the cache, which is incremented each time it is invalidated."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, factory: Callable[[], T], depends_on: Iterable[EntityTypes]) -> T:
+        """Return the cached value for the given key, computing and caching it with the factory if it is not cached.
+
+        :param key: the key of the value, which should be unique across all types of values that are cached.
+        :param factory: a function without arguments that computes the value. Exceptions are propagated and nothing is
+            cached.
+        :param depends_on: the types of the entities that the value depends on.
+        :return: the value.
+        """
+        if self._scope is not None:
+            key = (self._scope(), key)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            version = self._version
+
+        value = factory()
+
+        with self._lock:
+            if self._version == version:
+                self._entries[key] = (value, frozenset(depends_on))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, entity_type: EntityTypes) -> None:
+        """Discard all entries that depend on entities of the given type.
+
+        :param entity_type: the type of the entities that were written or deleted.
+        """
+        with self._lock:
+            self._version += 1
+            for key in [key for key, (_, depends_on) in self._entries.items() if entity_type in depends_on]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Discard all entries."""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
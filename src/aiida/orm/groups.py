@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import datetime
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
@@ -31,7 +31,7 @@ from .pydantic import OrmMetadataField
 if TYPE_CHECKING:
     from importlib_metadata import EntryPoint
 
-    from aiida.orm import Node, User
+    from aiida.orm import Node, QueryBuilder, User
     from aiida.orm.implementation import StorageBackend
     from aiida.orm.implementation.groups import BackendGroup
 
@@ -382,6 +382,64 @@ class Group(entities.Entity['BackendGroup', GroupCollection]):
 
         self._backend_entity.remove_nodes([node.backend_entity for node in nodes])
 
+    def add_nodes_by_pk(self, pks: int | Iterable[int] | QueryBuilder) -> None:
+        """Add a node or a set of nodes to the group by their pks, without loading the nodes.
+
+        This is considerably faster than :meth:`add_nodes` for large sets of nodes, since the nodes are added with a
+        single statement. Nodes that are already in the group are ignored.
+
+        :note: all the nodes *and* the group itself have to be stored.
+
+        :param pks: a single pk, an iterable of pks or a ``QueryBuilder`` that projects a single field: the pk of the
+            nodes to add.
+        :raises `~aiida.common.exceptions.NotExistent`: if no node exists for at least one of the pks
+        """
+        from .querybuilder import QueryBuilder
+
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
+
+        if isinstance(pks, QueryBuilder):
+            self._backend_entity.add_nodes_by_query(pks.as_dict())
+        else:
+            self._backend_entity.add_nodes_by_pk(self._get_pks(pks))
+
+    def remove_nodes_by_pk(self, pks: int | Iterable[int] | QueryBuilder) -> None:
+        """Remove a node or a set of nodes from the group by their pks, without loading the nodes.
+
+        This is considerably faster than :meth:`remove_nodes` for large sets of nodes, since the nodes are removed with
+        a single statement. Nodes that are not in the group are ignored.
+
+        :note: the group has to be stored.
+
+        :param pks: a single pk, an iterable of pks or a ``QueryBuilder`` that projects a single field: the pk of the
+            nodes to remove.
+        """
+        from .querybuilder import QueryBuilder
+
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot remove nodes from an unstored group')
+
+        if isinstance(pks, QueryBuilder):
+            self._backend_entity.remove_nodes_by_query(pks.as_dict())
+        else:
+            self._backend_entity.remove_nodes_by_pk(self._get_pks(pks))
+
+    @staticmethod
+    def _get_pks(pks: int | Iterable[int]) -> list[int]:
+        """Return the given pk or pks as a list, validating their type.
+
+        :param pks: a single pk or an iterable of pks
+        """
+        # The pks are passed by users, so their type is checked despite the annotation
+        values: list[Any] = [pks] if isinstance(pks, int) else list(pks)
+
+        for pk in values:
+            if not isinstance(pk, int) or isinstance(pk, bool):
+                raise TypeError(f'pks have to be of type {int}, got: {type(pk)}')
+
+        return values
+
     def is_user_defined(self) -> bool:
         """:return: True if the group is user defined, False otherwise"""
         return not self.type_string
@@ -17,6 +17,7 @@ from .entities import BackendCollection, BackendEntity, BackendEntityExtrasMixin
 from .nodes import BackendNode
 
 if TYPE_CHECKING:
+    from .querybuilder import QueryDictType
     from .users import BackendUser
 
 __all__ = ('BackendGroup', 'BackendGroupCollection')
@@ -146,6 +147,47 @@ class BackendGroup(BackendEntity, BackendEntityExtrasMixin):
         if any(not isinstance(node, BackendNode) for node in nodes):
             raise TypeError(f'nodes have to be of type {BackendNode}')
 
+    def add_nodes_by_pk(self, pks: Sequence[int]) -> None:
+        """Add a set of nodes to the group by their pks.
+
+        .. note:: The default implementation loads the nodes and calls :meth:`add_nodes`. Backends should override it
+            to add the nodes without loading them.
+
+        :param pks: the pks of the stored nodes to be added to this group
+        :raises `~aiida.common.exceptions.NotExistent`: if no node exists for at least one of the pks
+        """
+        self.add_nodes([self.backend.nodes.get(pk) for pk in pks])
+
+    def remove_nodes_by_pk(self, pks: Sequence[int]) -> None:
+        """Remove a set of nodes from the group by their pks.
+
+        .. note:: The default implementation loads the nodes and calls :meth:`remove_nodes`. Backends should override
+            it to remove the nodes without loading them.
+
+        :param pks: the pks of the nodes to be removed from this group
+        """
+        self.remove_nodes([self.backend.nodes.get(pk) for pk in pks])
+
+    def add_nodes_by_query(self, query: 'QueryDictType') -> None:
+        """Add the nodes whose pks are returned by a query to the group.
+
+        .. note:: The default implementation retrieves the pks and calls :meth:`add_nodes_by_pk`. Backends should
+            override it to add the nodes with a single statement, without retrieving the pks.
+
+        :param query: the query, which should project a single field: the pk of the nodes
+        """
+        self.add_nodes_by_pk([row[0] for row in self.backend.query().iterall(query, batch_size=None)])
+
+    def remove_nodes_by_query(self, query: 'QueryDictType') -> None:
+        """Remove the nodes whose pks are returned by a query from the group.
+
+        .. note:: The default implementation retrieves the pks and calls :meth:`remove_nodes_by_pk`. Backends should
+            override it to remove the nodes with a single statement, without retrieving the pks.
+
+        :param query: the query, which should project a single field: the pk of the nodes
+        """
+        self.remove_nodes_by_pk([row[0] for row in self.backend.query().iterall(query, batch_size=None)])
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {self!s}>'
 
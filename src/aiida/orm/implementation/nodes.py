@@ -9,7 +9,8 @@
 """Abstract BackendNode and BackendNodeCollection implementation."""
 
 import abc
-from collections.abc import Iterable, Sequence
+import contextlib
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
@@ -295,6 +296,15 @@ class BackendNode(BackendEntity, BackendEntityExtrasMixin, metaclass=abc.ABCMeta
         for key in keys:
             self.delete_attribute(key)
 
+    @contextlib.contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Return a context manager in which changes to a stored node are written to the storage when it is exited.
+
+        This allows implementations to write multiple changes, e.g. to multiple attributes, in a single operation. The
+        default implementation simply writes each change immediately.
+        """
+        yield
+
     @abc.abstractmethod
     def clear_attributes(self):
         """Delete all attributes."""
@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from aiida.manage.configuration.profile import Profile
     from aiida.orm.autogroup import AutogroupManager
     from aiida.orm.entities import EntityTypes
+    from aiida.orm.entity_cache import EntityCache
     from aiida.orm.implementation import (
         BackendAuthInfoCollection,
         BackendCommentCollection,
@@ -112,10 +113,12 @@ class StorageBackend(abc.ABC):
         :raises: :raises: :class:`aiida.common.exceptions.CorruptStorage` if the storage is internally inconsistent
         """
         from aiida.orm.autogroup import AutogroupManager
+        from aiida.orm.entity_cache import EntityCache
 
         self._profile = profile
         self._default_user: User | None = None
         self._autogroup = AutogroupManager(self)
+        self._entity_cache = EntityCache()
 
     @abc.abstractmethod
     def __str__(self) -> str:
@@ -131,6 +134,11 @@ class StorageBackend(abc.ABC):
         """Return the autogroup manager for this backend."""
         return self._autogroup
 
+    @property
+    def entity_cache(self) -> EntityCache:
+        """Return the cache of entities, and values derived from them, that are loaded repeatedly for this backend."""
+        return self._entity_cache
+
     def version(self) -> str:
         """Return the schema version of the profile's storage."""
         version = self.version_profile(self.profile)
@@ -168,6 +176,7 @@ class StorageBackend(abc.ABC):
 
         self.reset_default_user()
         self._autogroup = AutogroupManager(self)
+        self._entity_cache.clear()
 
     def reset_default_user(self) -> None:
         """Reset the default user.
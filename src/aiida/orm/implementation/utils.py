@@ -10,6 +10,7 @@
 
 import math
 import numbers
+import sys
 from collections.abc import Iterable, Mapping
 from decimal import Decimal
 
@@ -76,20 +77,7 @@ def clean_value(value):
         # This is for float-like types, like ``numpy.float128`` that are not json-serializable
         # Note that `numbers.Real` also match booleans but they are already returned above
         if isinstance(val, (numbers.Real, Decimal)):
-            string_representation = f'{{:.{AIIDA_FLOAT_PRECISION}g}}'.format(val)
-            new_val = float(string_representation)
-            if 'e' in string_representation and new_val.is_integer():
-                # This is indeed often quite unexpected, because it is going to change the type of the data
-                # from float to int. But anyway clean_value is changing some types, and we are also bound to what
-                # our current backends do.
-                # Currently, in both Django and SQLA (with JSONB attributes), if we store 1.e1, ..., 1.e14, 1.e15,
-                # they will be stored as floats; instead 1.e16, 1.e17, ... will all be stored as integer anyway,
-                # even if we don't run this clean_value step.
-                # So, for consistency, it's better if we do the conversion ourselves here, and we do it for a bit
-                # smaller numbers than python+[SQL+JSONB] would do (the AiiDA float precision is here 14), so the
-                # results are consistent, and the hashing will work also after a round trip as expected.
-                return int(new_val)
-            return new_val
+            return _clean_float(val)
 
         # Anything else we do not understand and we refuse
         raise exceptions.ValidationError(f'type `{type(val)}` is not supported as it is not json-serializable')
@@ -101,6 +89,10 @@ def clean_value(value):
         # Check dictionary before iterables
         return {k: clean_value(v) for k, v in value.items()}
 
+    cleaned = _clean_numeric_sequence(value)
+    if cleaned is not None:
+        return cleaned
+
     if isinstance(value, Iterable) and not isinstance(value, str):
         # list, tuple, ... but not a string
         # This should also properly take care of dealing with the
@@ -113,3 +105,90 @@ def clean_value(value):
     # but is not an integer, I still accept it)
 
     return clean_builtin(value)
+
+
+def _clean_float(val):
+    """Round a finite float-like value to ``AIIDA_FLOAT_PRECISION`` significant digits.
+
+    :return: the rounded value as a ``float``, or as an ``int`` if it is integer and large enough to be written in
+        exponential notation.
+    """
+    string_representation = f'{{:.{AIIDA_FLOAT_PRECISION}g}}'.format(val)
+    new_val = float(string_representation)
+    if 'e' in string_representation and new_val.is_integer():
+        # This is indeed often quite unexpected, because it is going to change the type of the data
+        # from float to int. But anyway clean_value is changing some types, and we are also bound to what
+        # our current backends do.
+        # Currently, in both Django and SQLA (with JSONB attributes), if we store 1.e1, ..., 1.e14, 1.e15,
+        # they will be stored as floats; instead 1.e16, 1.e17, ... will all be stored as integer anyway,
+        # even if we don't run this clean_value step.
+        # So, for consistency, it's better if we do the conversion ourselves here, and we do it for a bit
+        # smaller numbers than python+[SQL+JSONB] would do (the AiiDA float precision is here 14), so the
+        # results are consistent, and the hashing will work also after a round trip as expected.
+        return int(new_val)
+    return new_val
+
+
+def _clean_floats(values):
+    """Round a list of finite floats like ``_clean_float`` does for each of them, but faster.
+
+    :return: the list of rounded values.
+    """
+    string_format = f'%.{AIIDA_FLOAT_PRECISION}g'
+    cleaned = list(map(float, map(string_format.__mod__, values)))
+
+    # Only values of at least ``10**AIIDA_FLOAT_PRECISION`` after the rounding are written in exponential notation and
+    # can be integer, in which case ``_clean_float`` converts them to ``int``.
+    threshold = 10.0**AIIDA_FLOAT_PRECISION
+    return [int(val) if abs(val) >= threshold and val.is_integer() else val for val in cleaned]
+
+
+def _clean_numeric_sequence(value):
+    """Clean a numpy array of integers or floats, or a list of only integers and floats, in bulk.
+
+    This gives the same result as cleaning the elements one by one in ``clean_value``, but avoids the cost of the
+    recursion and of the type checks per element, which is significant for large arrays and lists.
+
+    :param value: the value to clean.
+    :return: the cleaned value as a (nested) list, or ``None`` if the value is not a numeric array or list, in which
+        case it should be cleaned element by element.
+    :raises aiida.common.ValidationError: if the value contains NaN or Inf.
+    """
+    # If ``numpy`` has not been imported yet, the value cannot be an array, so there is no need to import it here.
+    numpy = sys.modules.get('numpy')
+
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        # Arrays of other types, e.g. booleans, complex numbers or extended precision floats, are left to the element
+        # wise cleaning, which will convert or reject them as appropriate. Zero-dimensional arrays are not iterable.
+        if value.ndim == 0 or value.dtype.kind not in 'iuf' or value.dtype.itemsize > 8:
+            return None
+
+        if value.dtype.kind != 'f':
+            return value.tolist()
+
+        if not numpy.isfinite(value).all():
+            raise exceptions.ValidationError('nan and inf/-inf can not be serialized to the database')
+
+        if value.ndim > 1:
+            return [_clean_numeric_sequence(row) for row in value]
+
+        return _clean_floats(value.tolist())
+
+    if type(value) is list and value:
+        types = set(map(type, value))
+
+        if types == {int}:
+            return list(value)
+
+        if not types <= {int, float}:
+            return None
+
+        if not all(map(math.isfinite, value)):
+            raise exceptions.ValidationError('nan and inf/-inf can not be serialized to the database')
+
+        if types == {float}:
+            return _clean_floats(value)
+
+        return [val if type(val) is int else _clean_float(val) for val in value]
+
+    return None
@@ -48,11 +48,12 @@ class LogCollection(entities.Collection['Log']):
     def _entity_base_cls() -> type[Log]:
         return Log
 
-    def create_entry_from_record(self, record: logging.LogRecord) -> Log | None:
-        """Helper function to create a log entry from a record created as by the python logging library
+    @staticmethod
+    def get_fields_from_record(record: logging.LogRecord) -> dict[str, Any] | None:
+        """Return the fields of the log entry that corresponds to a record created by the python logging library.
 
         :param record: The record created by the logging module
-        :return: A stored log instance
+        :return: The fields of the log entry, or ``None`` if the record is not attached to a node
         """
         dbnode_id = record.__dict__.get('dbnode_id', None)
 
@@ -76,14 +77,39 @@ class LogCollection(entities.Collection['Log']):
             if key in metadata:
                 metadata[key] = str(metadata[key])
 
-        return Log(
-            time=timezone.make_aware(datetime.fromtimestamp(record.created)),
-            loggername=record.name,
-            levelname=record.levelname,
-            dbnode_id=dbnode_id,
-            message=message,
-            metadata=metadata,
-            backend=self.backend,
+        return {
+            'time': timezone.make_aware(datetime.fromtimestamp(record.created)),
+            'loggername': record.name,
+            'levelname': record.levelname,
+            'dbnode_id': dbnode_id,
+            'message': message,
+            'metadata': metadata,
+        }
+
+    def create_entry_from_record(self, record: logging.LogRecord) -> Log | None:
+        """Helper function to create a log entry from a record created as by the python logging library
+
+        :param record: The record created by the logging module
+        :return: A stored log instance
+        """
+        fields = self.get_fields_from_record(record)
+
+        if fields is None:
+            return None
+
+        return Log(**fields, backend=self.backend)
+
+    def create_entries(self, entries: list[dict[str, Any]]) -> list[int]:
+        """Store multiple log entries at once.
+
+        The entries are written to the database with a single bulk insert, which is a lot faster than storing them one
+        by one, but they are not validated in the same way as when constructing :class:`~aiida.orm.Log` instances.
+
+        :param entries: The fields of the log entries, as returned by :meth:`get_fields_from_record`
+        :return: The pks of the stored log entries
+        """
+        return self.backend.bulk_insert(
+            entities.EntityTypes.LOG, [dict(entry) for entry in entries], allow_defaults=True
         )
 
     def get_logs_for(self, entity: Node, order_by: OrderByType | None = None) -> list[Log]:
@@ -10,6 +10,7 @@
 
 import copy
 from collections.abc import Iterable
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -168,6 +169,24 @@ class NodeAttributes:
         self._node._check_mutability_attributes()
         self._backend_node.clear_attributes()
 
+    def batch_update(self) -> AbstractContextManager[None]:
+        """Return a context manager in which updates to the attributes of a stored node are written at once on exit.
+
+        Normally, each update of the attributes of a stored node, e.g. through :meth:`set` or :meth:`delete`, is
+        immediately written to the storage. Within this context, they are combined and written in a single operation
+        when the context is exited, also if an exception is raised. Note that other changes to the node that are made
+        within the context, e.g. to its extras, are deferred as well.
+
+        Example::
+
+            with node.base.attributes.batch_update():
+                node.base.attributes.set('a', 1)
+                node.base.attributes.set('b', 2)
+
+        :return: a context manager
+        """
+        return self._backend_node.batch_update()
+
     def items(self) -> Iterable[tuple[str, Any]]:
         """Return an iterator over the attributes.
 
@@ -11,13 +11,20 @@
 from __future__ import annotations
 
 import base64
+import gzip
 import io
+import operator
+import os
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, BinaryIO
 
 import numpy as np
 from pydantic import ConfigDict, field_validator
 
+from aiida.manage import get_config_option
 from aiida.orm.pydantic import OrmFieldsAsModelDump, OrmMetadataField, OrmModel
 
 from ..base import to_aiida_type
@@ -26,6 +33,83 @@ from ..data import Data
 __all__ = ('ArrayData',)
 
 
+class ArrayCache:
+    """Least recently used cache of the arrays of stored ``ArrayData`` nodes, with a maximum total size in bytes.
+
+    The arrays of a stored node can no longer change, so they are cached by the UUID of the node, which means that the
+    cache is shared by all instances of the same node. The cached arrays are therefore made read-only, such that they
+    cannot be modified in place through one of these instances.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        """Construct a new instance.
+
+        :param max_size: the maximum total size of the cached arrays in bytes. Arrays that are larger by themselves
+            are not cached. If not specified, the ``storage.array_cache_size`` config option is used.
+        """
+        self._max_size = max_size
+        self._arrays: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum total size of the cached arrays in bytes."""
+        if self._max_size is not None:
+            return self._max_size
+
+        return get_config_option('storage.array_cache_size') * 1024**2
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached arrays in bytes."""
+        return self._size
+
+    def get(self, uuid: str, name: str) -> np.ndarray | None:
+        """Return the cached array with the given name of the node with the given UUID, or ``None`` if not cached."""
+        with self._lock:
+            array = self._arrays.get((uuid, name))
+            if array is not None:
+                self._arrays.move_to_end((uuid, name))
+            return array
+
+    def put(self, uuid: str, name: str, array: np.ndarray) -> None:
+        """Add an array to the cache, evicting the least recently used arrays as needed to stay within the maximum.
+
+        The array is made read-only if it is cached.
+        """
+        max_size = self.max_size
+
+        if array.nbytes > max_size:
+            return
+
+        array.flags.writeable = False
+
+        with self._lock:
+            previous = self._arrays.pop((uuid, name), None)
+            if previous is not None:
+                self._size -= previous.nbytes
+
+            self._arrays[(uuid, name)] = array
+            self._size += array.nbytes
+
+            while self._size > max_size:
+                _, evicted = self._arrays.popitem(last=False)
+                self._size -= evicted.nbytes
+
+    def discard(self, uuid: str) -> None:
+        """Remove all cached arrays of the node with the given UUID."""
+        with self._lock:
+            for key in [key for key in self._arrays if key[0] == uuid]:
+                self._size -= self._arrays.pop(key).nbytes
+
+    def clear(self) -> None:
+        """Remove all cached arrays."""
+        with self._lock:
+            self._arrays.clear()
+            self._size = 0
+
+
 @to_aiida_type.register(np.ndarray)
 def _(value):
     return ArrayData(value)
@@ -42,9 +126,12 @@ class ArrayData(Data):
         :py:meth:`.get_array` call, the array will be re-read from disk.
         If instead the ArrayData node has already been stored,
         the array is cached in memory after the first read, and the cached array
-        is used thereafter.
-        If too much RAM memory is used, you can clear the
-        cache with the :py:meth:`.clear_internal_cache` method.
+        is used thereafter. The cache is shared by all nodes and the least recently
+        used arrays are evicted once their total size exceeds the
+        ``storage.array_cache_size`` config option. The cached arrays are read-only,
+        copy them to modify them.
+        You can also remove the arrays of a node from the cache with the
+        :py:meth:`.clear_internal_cache` method.
 
     """
 
@@ -97,8 +184,11 @@ class ArrayData(Data):
                 raise TypeError(f'`arrays` should be an iterable or dictionary of iterables but got: {value}')
 
     array_prefix = 'array|'
+    chunks_prefix = 'chunks|'
     default_array_name = 'default'
 
+    _array_cache = ArrayCache()
+
     def __init__(self, arrays: Iterable | dict[str, Iterable] | None = None, **kwargs):
         """Construct a new instance and set one or multiple numpy arrays.
 
@@ -107,7 +197,6 @@ class ArrayData(Data):
         arrays = arrays if arrays is not None else {}
 
         super().__init__(**kwargs)
-        self._cached_arrays: dict[str, np.ndarray] = {}
 
         if isinstance(arrays, (Sequence, np.ndarray)):
             arrays = {self.default_array_name: arrays}
@@ -171,27 +260,38 @@ class ArrayData(Data):
     def arrays(self) -> dict[str, np.ndarray]:
         return {name: self.get_array(name) for name in self.get_arraynames()}
 
-    def initialize(self):
-        super().initialize()
-        self._cached_arrays = {}
-
     def delete_array(self, name: str) -> None:
         """Delete an array from the node. Can only be called before storing.
 
         :param name: The name of the array to delete from the node.
         """
-        fname = f'{name}.npy'
-        if fname not in self.base.repository.list_object_names():
+        if name not in self._arraynames_from_files():
             raise KeyError(f"Array with name '{name}' not found in node pk= {self.pk}")
 
-        # remove both file and attribute
-        self.base.repository.delete_object(fname)
+        # remove both files and attributes
+        self._delete_array_files(name)
         try:
             self.base.attributes.delete(f'{self.array_prefix}{name}')
         except (KeyError, AttributeError):
             # Should not happen, but do not crash if for some reason the property was not set.
             pass
 
+    def _delete_array_files(self, name: str) -> None:
+        """Delete the file, or the files of the chunks, of an array and the index of its chunks, if they exist.
+
+        :param name: The name of the array.
+        """
+        filenames = self.base.repository.list_object_names()
+
+        if f'{name}.npy' in filenames:
+            self.base.repository.delete_object(f'{name}.npy')
+
+        if self._get_chunks_index(name) is not None:
+            for filename in filenames:
+                if filename.startswith(f'{name}.') and filename.endswith('.npy.gz'):
+                    self.base.repository.delete_object(filename)
+            self.base.attributes.delete(f'{self.chunks_prefix}{name}')
+
     def get_arraynames(self) -> list[str]:
         """Return a list of all arrays stored in the node, listing the files (and
         not relying on the properties)."""
@@ -201,7 +301,15 @@ class ArrayData(Data):
         """Return a list of all arrays stored in the node, listing the files (and
         not relying on the properties).
         """
-        return [i[:-4] for i in self.base.repository.list_object_names() if i.endswith('.npy')]
+        names = []
+
+        for filename in self.base.repository.list_object_names():
+            if filename.endswith('.npy'):
+                names.append(filename[:-4])
+            elif filename.endswith('.npy.gz') and filename.partition('.')[0] not in names:
+                names.append(filename.partition('.')[0])
+
+        return names
 
     def _arraynames_from_properties(self) -> list[str]:
         """Return a list of all arrays stored in the node, listing the attributes
@@ -222,12 +330,17 @@ class ArrayData(Data):
         for name in self.get_arraynames():
             yield (name, self.get_array(name))
 
-    def get_array(self, name: str | None = None) -> np.ndarray:
+    def get_array(self, name: str | None = None, index: Any = None) -> np.ndarray:
         """Return an array stored in the node
 
         :param name: The name of the array to return. The name can be omitted in case the node contains only a single
             array, which will be returned in that case. If ``name`` is ``None`` and the node contains multiple arrays or
             no arrays at all a ``ValueError`` is raised.
+        :param index: Optional index, e.g. an integer, a slice or a tuple thereof, to select part of the array. Only
+            the selected part is read from the repository, unless the whole array is already cached, such that a
+            single step of a large trajectory can be read without loading the whole trajectory in memory.
+        :return: the array, which is read-only if the node is stored and the array is cached. Copy it, for example with
+            ``array.copy()``, to modify it.
         :raises ValueError: If ``name`` is ``None`` and the node contains more than one arrays or no arrays at all.
         """
         if name is None:
@@ -241,25 +354,38 @@ class ArrayData(Data):
 
             name = names[0]
 
-        def get_array_from_file(self, name: str) -> np.ndarray:
-            """Return the array stored in a .npy file"""
+        def get_array_from_file(self, name: str, index: Any = None) -> np.ndarray:
+            """Return the array stored in a .npy file, or the part of it selected by ``index`` if specified."""
             filename = f'{name}.npy'
 
+            if self._get_chunks_index(name) is not None:
+                return self._get_chunked_array(name, index)
+
             if filename not in self.base.repository.list_object_names():
                 raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
 
             # Open a handle in binary read mode as the arrays are written as binary files as well
             with self.base.repository.open(filename, mode='rb') as handle:
-                return np.load(handle, allow_pickle=False)
+                if index is None:
+                    return np.load(handle, allow_pickle=False)
+                return read_array_index(handle, index)
 
         # Return with proper caching if the node is stored, otherwise always re-read from disk
         if not self.is_stored:
-            return get_array_from_file(self, name)
+            return get_array_from_file(self, name, index)
+
+        array = self._array_cache.get(self.uuid, name)
+
+        if array is not None:
+            return array if index is None else array[index]
+
+        if index is not None:
+            return get_array_from_file(self, name, index)
 
-        if name not in self._cached_arrays:
-            self._cached_arrays[name] = get_array_from_file(self, name)
+        array = get_array_from_file(self, name)
+        self._array_cache.put(self.uuid, name, array)
 
-        return self._cached_arrays[name]
+        return array
 
     def clear_internal_cache(self) -> None:
         """Clear the internal memory cache where the arrays are stored after being
@@ -268,16 +394,22 @@ class ArrayData(Data):
         This function is useful if you want to keep the node in memory, but you
         do not want to waste memory to cache the arrays in RAM.
         """
-        self._cached_arrays = {}
+        self._array_cache.discard(self.uuid)
 
-    def set_array(self, name: str, array: np.ndarray) -> None:
+    def set_array(self, name: str, array: np.ndarray, chunk_size: int | None = None) -> None:
         """Store a new numpy array inside the node. Possibly overwrite the array
         if it already existed.
 
         Internally, it stores a name.npy file in numpy format.
 
+        If a ``chunk_size`` is specified, the array is instead split along its first axis in chunks of that many rows,
+        which are each stored as a compressed ``name.<index>.npy.gz`` file. Rows can then be added with
+        :meth:`append_to_array`, and reading part of the array with :meth:`get_array` only decompresses the chunks that
+        contain it. When the whole array is read, the chunks are decompressed in parallel.
+
         :param name: The name of the array.
         :param array: The numpy array to store.
+        :param chunk_size: Optional number of rows per chunk, to store the array in compressed chunks.
         """
         import tempfile
 
@@ -287,6 +419,20 @@ class ArrayData(Data):
         # Check if the name is valid
         self._validate_array_name(name)
 
+        if chunk_size is not None:
+            if chunk_size < 1:
+                raise ValueError(f'The chunk size should be a positive integer, got {chunk_size}.')
+            if array.ndim == 0:
+                raise ValueError('Only arrays with at least one dimension can be stored in chunks.')
+
+        self._delete_array_files(name)
+
+        if chunk_size is not None:
+            self._put_chunks(name, array, 0, chunk_size)
+            self.base.attributes.set(f'{self.chunks_prefix}{name}', {'size': chunk_size, 'dtype': array.dtype.str})
+            self.base.attributes.set(f'{self.array_prefix}{name}', list(array.shape))
+            return
+
         # Write the array to a temporary file, and then add it to the repository of the node
         with tempfile.NamedTemporaryFile() as handle:
             np.save(handle, array, allow_pickle=False)
@@ -301,6 +447,119 @@ class ArrayData(Data):
         # Store the array name and shape for querying purposes
         self.base.attributes.set(f'{self.array_prefix}{name}', list(array.shape))
 
+    def append_to_array(self, name: str, array: np.ndarray) -> None:
+        """Append rows to an array that is stored in chunks, see :meth:`set_array`.
+
+        Only the last chunk is rewritten, if it is not yet full, so this can be used to add the rows of an array one by
+        one, for example while they are being parsed.
+
+        :param name: The name of the array.
+        :param array: The numpy array with the rows to append, which should have the same shape as the stored array,
+            apart from the first axis, and a data type that can be safely cast to the one of the stored array.
+        :raises KeyError: if the node contains no array with the given name.
+        :raises ValueError: if the array is not stored in chunks, or the shape or data type does not match.
+        """
+        if not isinstance(array, np.ndarray):
+            raise TypeError('ArrayData can only store numpy arrays. Convert the object to an array first')
+
+        if name not in self.get_arraynames():
+            raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
+
+        chunks_index = self._get_chunks_index(name)
+
+        if chunks_index is None:
+            raise ValueError(f'The array `{name}` is not stored in chunks, use `set_array` with a `chunk_size`.')
+
+        shape = self.get_shape(name)
+        dtype = np.dtype(chunks_index['dtype'])
+
+        if array.shape[1:] != shape[1:] or array.ndim != len(shape):
+            raise ValueError(f'The shape {array.shape} of the rows does not match the shape {shape} of the array.')
+
+        if not np.can_cast(array.dtype, dtype):
+            raise ValueError(f'The data type {array.dtype} of the rows cannot be cast to {dtype} of the array.')
+
+        chunk_size = chunks_index['size']
+        first_chunk, num_rows_last_chunk = divmod(shape[0], chunk_size)
+        rows = array.astype(dtype, copy=False)
+
+        if num_rows_last_chunk:
+            rows = np.concatenate([self._read_chunk(name, first_chunk), rows])
+
+        self._put_chunks(name, rows, first_chunk, chunk_size)
+        self.base.attributes.set(f'{self.array_prefix}{name}', [shape[0] + array.shape[0], *shape[1:]])
+
+    def _get_chunks_index(self, name: str) -> dict[str, Any] | None:
+        """Return the index of the chunks of an array, or ``None`` if the array is not stored in chunks.
+
+        :param name: The name of the array.
+        """
+        return self.base.attributes.get(f'{self.chunks_prefix}{name}', None)
+
+    def _put_chunks(self, name: str, array: np.ndarray, first_chunk: int, chunk_size: int) -> None:
+        """Store the rows of an array as compressed chunks, starting at the given chunk index.
+
+        :param name: The name of the array.
+        :param array: The rows to store.
+        :param first_chunk: The index of the chunk of the first row.
+        :param chunk_size: The number of rows per chunk.
+        """
+        for index, start in enumerate(range(0, array.shape[0], chunk_size), start=first_chunk):
+            stream = io.BytesIO()
+            np.save(stream, array[start : start + chunk_size], allow_pickle=False)
+            content = gzip.compress(stream.getvalue(), compresslevel=6, mtime=0)
+            self.base.repository.put_object_from_bytes(content, f'{name}.{index}.npy.gz')
+
+    def _read_chunk(self, name: str, index: int) -> np.ndarray:
+        """Return the rows of the chunk of an array with the given index.
+
+        :param name: The name of the array.
+        :param index: The index of the chunk.
+        """
+        return _load_chunk(self.base.repository.get_object_content(f'{name}.{index}.npy.gz', mode='rb'))
+
+    def _get_chunked_array(self, name: str, index: Any = None) -> np.ndarray:
+        """Return an array that is stored in chunks, or the part of it selected by ``index`` if specified.
+
+        If the index selects along the first axis with an integer or a slice, only the chunks containing the selected
+        rows are read. The chunks are decompressed in parallel.
+
+        :param name: The name of the array.
+        :param index: Optional index to apply to the array.
+        """
+        shape = self.get_shape(name)
+        chunks_index = self._get_chunks_index(name)
+        assert chunks_index is not None
+        chunk_size = chunks_index['size']
+        row_index = parse_row_index(index, shape[0]) if index is not None and shape else None
+
+        if row_index is None:
+            chunks = list(range(-(-shape[0] // chunk_size)))
+        else:
+            chunks = sorted({row // chunk_size for row in row_index[0]})
+
+        contents = [self.base.repository.get_object_content(f'{name}.{chunk}.npy.gz', mode='rb') for chunk in chunks]
+
+        if len(contents) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(contents), os.cpu_count() or 1)) as executor:
+                arrays = list(executor.map(_load_chunk, contents))
+        else:
+            arrays = [_load_chunk(content) for content in contents]
+
+        if arrays:
+            array = np.concatenate(arrays)
+        else:
+            array = np.empty((0, *shape[1:]), dtype=np.dtype(chunks_index['dtype']))
+
+        if row_index is None:
+            return array if index is None else array[index]
+
+        rows, rest = row_index
+        offsets = {chunk: position * chunk_size for position, chunk in enumerate(chunks)}
+        positions = [offsets[row // chunk_size] + row % chunk_size for row in rows]
+
+        return array[positions][rest]
+
     def attach_file(self, name: str, fileobj: BinaryIO) -> None:
         if not name.lower().endswith('.npy'):
             raise ValueError(f'expected .npy file: {name}')
@@ -381,6 +640,91 @@ class ArrayData(Data):
         return fields
 
 
+def read_array_index(handle: BinaryIO, index: Any) -> np.ndarray:
+    """Read the part of an array in ``.npy`` format that is selected by an index, without reading the whole array.
+
+    If the handle is a regular file, the array is memory-mapped, which supports any index. Otherwise, e.g. for an
+    object in a pack file of the repository, an index that selects along the first axis with an integer or a slice
+    is supported by only reading the byte range of the selected rows. For other indices, and arrays that are not stored
+    in C order, the whole array is read.
+
+    :param handle: a seekable binary handle positioned at the start of the ``.npy`` content.
+    :param index: the index to apply to the array.
+    :return: a new array with the selected part of the stored array.
+    """
+    version = np.lib.format.read_magic(handle)
+
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+    else:
+        shape, fortran_order, dtype = (), True, None
+
+    if fortran_order or dtype is None or dtype.hasobject or not shape or 0 in shape:
+        handle.seek(0)
+        return np.load(handle, allow_pickle=False)[index]
+
+    offset = handle.tell()
+
+    if isinstance(handle, io.BufferedReader) and isinstance(handle.raw, io.FileIO):
+        array = np.memmap(handle, dtype=dtype, mode='r', offset=offset, shape=shape)
+        return np.array(array[index])
+
+    row_index = parse_row_index(index, shape[0])
+
+    if row_index is None:
+        handle.seek(0)
+        return np.load(handle, allow_pickle=False)[index]
+
+    rows, rest = row_index
+
+    if not rows:
+        return np.empty((0, *shape[1:]), dtype=dtype)[rest]
+
+    start, stop = min(rows), max(rows) + 1
+    row_size = dtype.itemsize * int(np.prod(shape[1:]))
+
+    handle.seek(offset + start * row_size)
+    block = np.frombuffer(handle.read((stop - start) * row_size), dtype=dtype).reshape((stop - start, *shape[1:]))
+
+    return np.array(block[rows[0] - start :: rows.step][rest])
+
+
+def _load_chunk(content: bytes) -> np.ndarray:
+    """Return the array of a chunk from its compressed ``.npy`` content."""
+    return np.load(io.BytesIO(gzip.decompress(content)), allow_pickle=False)
+
+
+def parse_row_index(index: Any, num_rows: int) -> tuple[range, tuple] | None:
+    """Split an index of an array into the rows it selects along the first axis and the index of the other axes.
+
+    :param index: the index to apply to the array.
+    :param num_rows: the length of the first axis of the array.
+    :return: the rows and the index to apply to the array of these rows to obtain the selection, or ``None`` if the
+        index does not select along the first axis with an integer or a slice.
+    :raises IndexError: if an integer index is out of bounds.
+    """
+    first, rest = (index[0], index[1:]) if isinstance(index, tuple) and index else (index, ())
+
+    if isinstance(first, slice):
+        return range(*first.indices(num_rows)), (slice(None), *rest)
+
+    # A boolean is an integer for ``operator.index``, but numpy treats it as a mask that adds an axis
+    if isinstance(first, bool):
+        return None
+
+    try:
+        row = operator.index(first)
+    except TypeError:
+        return None
+
+    if not -num_rows <= row < num_rows:
+        raise IndexError(f'index {row} is out of bounds for axis 0 with size {num_rows}')
+
+    return range(row % num_rows, row % num_rows + 1), (0, *rest)
+
+
 def clean_array(array: np.ndarray) -> list:
     """Replacing np.nan and np.inf/-np.inf for Nones.
 
@@ -1827,15 +1827,15 @@ def get_bands_and_parents_structure(args, backend=None):
         tag='sdata',
         with_descendants='bdata',
         # We don't care about the creator of StructureData
-        project=['id', 'attributes.kinds', 'attributes.sites', 'ctime'],
+        project=['id', 'attributes.kinds', 'attributes.sites', 'attributes.num_sites', 'ctime'],
     )
 
     q_build.order_by({orm.StructureData: {'ctime': 'desc'}})
 
     structure_dict = {}
     list_data = q_build.distinct().all()
-    for bid, _, _, _, akinds, asites, _ in list_data:
-        structure_dict[bid] = (akinds, asites)
+    for bid, _, _, sid, akinds, asites, num_sites, _ in list_data:
+        structure_dict[bid] = (sid, akinds, asites, num_sites)
 
     entry_list = []
     already_visited_bdata: set[int] = set()
@@ -1854,7 +1854,11 @@ def get_bands_and_parents_structure(args, backend=None):
         strct = structure_dict.get(bid, None)
 
         if strct is not None:
-            akinds, asites = strct
+            sid, akinds, asites, num_sites = strct
+            # The sites of compact structures are stored in the repository, see ``StructureData.set_site_arrays``
+            if asites is None and num_sites is not None:
+                structure = orm.QueryBuilder(backend=backend).append(orm.StructureData, filters={'id': sid}).one()[0]
+                asites = [{'kind_name': kind_name} for kind_name in structure.get_site_kindnames()]
             formula = _extract_formula(akinds, asites, args)
         elif args.element is not None or args.element_only is not None:
             formula = None
@@ -118,6 +118,7 @@ class TrajectoryData(ArrayData):
         times: np.ndarray | None = None,
         velocities: np.ndarray | None = None,
         pbc: tuple[bool, bool, bool] | list[bool] | None = None,
+        chunk_size: int | None = None,
     ) -> None:
         r"""Store the whole trajectory, after checking that types and dimensions
         are correct.
@@ -169,6 +170,8 @@ class TrajectoryData(ArrayData):
         :param pbc: periodic boundary conditions of the structure. Should be a list of
             length three with booleans indicating if the structure is periodic in that
             direction. The same periodic boundary conditions are set for each step.
+        :param chunk_size: optional number of steps per chunk, to store the arrays in compressed chunks such that steps
+            can be added with :py:meth:`.append_steps`. See :py:meth:`~aiida.orm.ArrayData.set_array`.
 
         .. todo :: Choose suitable units for velocities
         """
@@ -188,13 +191,13 @@ class TrajectoryData(ArrayData):
         # set symbols/pbc as attributes for easier querying
         self.base.attributes.set('symbols', list(symbols))
         self.base.attributes.set('pbc', tuple(pbc))
-        self.set_array('positions', positions)
+        self.set_array('positions', positions, chunk_size=chunk_size)
         if stepids is not None:  # use input stepids
-            self.set_array('steps', stepids)
+            self.set_array('steps', stepids, chunk_size=chunk_size)
         else:  # use consecutive sequence if not given
-            self.set_array('steps', numpy.arange(positions.shape[0]))
+            self.set_array('steps', numpy.arange(positions.shape[0]), chunk_size=chunk_size)
         if cells is not None:
-            self.set_array('cells', cells)
+            self.set_array('cells', cells, chunk_size=chunk_size)
         else:
             # Delete cells array, if it was present
             try:
@@ -202,7 +205,7 @@ class TrajectoryData(ArrayData):
             except KeyError:
                 pass
         if times is not None:
-            self.set_array('times', times)
+            self.set_array('times', times, chunk_size=chunk_size)
         else:
             # Delete times array, if it was present
             try:
@@ -210,7 +213,7 @@ class TrajectoryData(ArrayData):
             except KeyError:
                 pass
         if velocities is not None:
-            self.set_array('velocities', velocities)
+            self.set_array('velocities', velocities, chunk_size=chunk_size)
         else:
             # Delete velocities array, if it was present
             try:
@@ -218,6 +221,53 @@ class TrajectoryData(ArrayData):
             except KeyError:
                 pass
 
+    def append_steps(
+        self,
+        positions: np.ndarray,
+        stepids: np.ndarray | None = None,
+        cells: np.ndarray | None = None,
+        times: np.ndarray | None = None,
+        velocities: np.ndarray | None = None,
+    ) -> None:
+        r"""Append steps to a trajectory that was set with a ``chunk_size``, see :py:meth:`.set_trajectory`.
+
+        This allows to build a long trajectory step by step, e.g. while parsing the output of a molecular dynamics
+        simulation, without keeping the whole trajectory in memory or rewriting it for every new step.
+
+        :param positions: float array with dimension :math:`s \times n \times 3`, where ``s`` is the number of steps
+            to append and ``n`` the number of symbols of the trajectory.
+        :param stepids: integer array with dimension ``s``. If not specified, the step ids continue from the last one.
+        :param cells: float array with dimension :math:`s \times 3 \times 3`, which should be specified if and only if
+            the trajectory has cells.
+        :param times: float array with dimension ``s``, which should be specified if and only if the trajectory has
+            times.
+        :param velocities: float array with the same dimensions as ``positions``, which should be specified if and only
+            if the trajectory has velocities.
+        :raises ValueError: if the arrays of the trajectory are not stored in chunks, or if the optional arrays do not
+            match those of the trajectory.
+        """
+        import numpy
+
+        arraynames = self.get_arraynames()
+
+        for name, array in (('cells', cells), ('times', times), ('velocities', velocities)):
+            if array is None and name in arraynames:
+                raise ValueError(f'The trajectory has {name}, so `{name}` should be specified.')
+            if array is not None and name not in arraynames:
+                raise ValueError(f'The trajectory has no {name}, so `{name}` should not be specified.')
+
+        if stepids is None:
+            last_stepid = int(self.get_array('steps', -1)) if self.numsteps else -1
+            stepids = numpy.arange(last_stepid + 1, last_stepid + 1 + positions.shape[0])
+
+        self._internal_validate(stepids, cells, self.symbols, positions, times, velocities, self.pbc)
+
+        self.append_to_array('positions', positions)
+        self.append_to_array('steps', stepids)
+        for name, array in (('cells', cells), ('times', times), ('velocities', velocities)):
+            if array is not None:
+                self.append_to_array(name, array)
+
     def set_structurelist(self, structurelist: list[StructureData]) -> None:
         """Create trajectory from the list of
         :py:class:`aiida.orm.nodes.data.structure.StructureData` instances.
@@ -399,18 +449,17 @@ class TrajectoryData(ArrayData):
         if index >= self.numsteps:
             raise IndexError(f'You have only {self.numsteps} steps, but you are looking beyond (index={index})')
 
-        vel = self.get_velocities()
-        if vel is not None:
-            vel = vel[index, :, :]
-        time_array = self.get_times()
+        # Only the arrays of the requested step are read, instead of the arrays of the whole trajectory
+        arraynames = self.get_arraynames()
+        vel = self.get_array('velocities', index) if 'velocities' in arraynames else None
         time: float | None = None
-        if time_array is not None:
-            time = float(time_array[index])
-        cells = self.get_cells()
+        if 'times' in arraynames:
+            time = float(self.get_array('times', index))
         cell: np.ndarray | None = None
-        if cells is not None:
-            cell = cells[index, :, :]
-        return (int(self.get_stepids()[index]), time, cell, self.symbols, self.get_positions()[index, :, :], vel)
+        if 'cells' in arraynames:
+            cell = self.get_array('cells', index)
+        stepid = int(self.get_array('steps', index))
+        return (stepid, time, cell, self.symbols, self.get_array('positions', index), vel)
 
     def get_step_structure(self, index: int, custom_kinds: list[Kind] | None = None) -> StructureData:
         """Return an AiiDA :py:class:`aiida.orm.nodes.data.structure.StructureData` node
@@ -782,7 +831,7 @@ class TrajectoryData(ArrayData):
         try:
             if self.base.attributes.get('units|positions') in ('bohr', 'atomic'):
                 bohr_to_ang = 0.52917720859
-                positions *= bohr_to_ang
+                positions = positions * bohr_to_ang
         except AttributeError:
             pass
 
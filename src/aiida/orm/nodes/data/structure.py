@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import copy
 import functools
+import io
 import itertools
 import json
 import typing as t
@@ -688,6 +689,10 @@ class StructureData(Data):
     _dimensionality_label = {0: '', 1: 'length', 2: 'surface', 3: 'volume'}
     _internal_kind_tags = None
 
+    # Attribute with the number of sites, which is only set if the sites are stored as arrays in the repository
+    _NUM_SITES_KEY = 'num_sites'
+    _SITE_ARRAY_FILENAMES = {'positions': 'site_positions.npy', 'kind_indices': 'site_kind_indices.npy'}
+
     class AttributesModel(Data.AttributesModel):
         pbc1: bool = OrmMetadataField(
             False,
@@ -708,7 +713,8 @@ class StructureData(Data):
         kinds: list[dict] = OrmMetadataField(
             description='The kinds of atoms',
         )
-        sites: list[dict] = OrmMetadataField(
+        sites: list[dict] | None = OrmMetadataField(
+            None,
             description='The atomic sites',
         )
 
@@ -719,7 +725,9 @@ class StructureData(Data):
 
         @field_validator('sites', mode='before')
         @classmethod
-        def _validate_sites(cls, value: list[Site | dict[str, t.Any]]) -> list[dict]:
+        def _validate_sites(cls, value: list[Site | dict[str, t.Any]] | None) -> list[dict] | None:
+            if value is None:
+                return None
             return [site.get_raw() if isinstance(site, Site) else site for site in value]
 
     def __init__(
@@ -959,22 +967,53 @@ class StructureData(Data):
             if counts[count] != 1:
                 raise ValidationError(f"Kind with name '{count}' appears {counts[count]} times instead of only one")
 
-        try:
-            # This will try to create the sites objects
-            sites = self.sites
-        except ValueError as exc:
-            raise ValidationError(f'Unable to validate the sites: {exc}')
+        if self.has_site_arrays:
+            kinds_without_sites = self._validate_site_arrays(kinds)
+        else:
+            try:
+                # This will try to create the sites objects
+                sites = self.sites
+            except ValueError as exc:
+                raise ValidationError(f'Unable to validate the sites: {exc}')
 
-        for site in sites:
-            if site.kind_name not in [k.name for k in kinds]:
-                raise ValidationError(f'A site has kind {site.kind_name}, but no specie with that name exists')
+            for site in sites:
+                if site.kind_name not in [k.name for k in kinds]:
+                    raise ValidationError(f'A site has kind {site.kind_name}, but no specie with that name exists')
+
+            kinds_without_sites = set(k.name for k in kinds) - set(s.kind_name for s in sites)
 
-        kinds_without_sites = set(k.name for k in kinds) - set(s.kind_name for s in sites)
         if kinds_without_sites:
             raise ValidationError(
                 f'The following kinds are defined, but there are no sites with that kind: {list(kinds_without_sites)}'
             )
 
+    def _validate_site_arrays(self, kinds):
+        """Validate the arrays of the sites stored in the repository.
+
+        :param kinds: the list of kinds of the structure.
+        :return: the set of names of the kinds that are not used by any site.
+        :raises aiida.common.ValidationError: if the arrays are invalid.
+        """
+        from aiida.common.exceptions import ValidationError
+
+        num_sites = self.base.attributes.get(self._NUM_SITES_KEY)
+
+        try:
+            positions = self.get_positions()
+            kind_indices = self.get_kind_indices()
+        except (FileNotFoundError, ValueError) as exc:
+            raise ValidationError(f'Unable to validate the sites: {exc}')
+
+        if positions.shape != (num_sites, 3) or kind_indices.shape != (num_sites,):
+            raise ValidationError(f'The shapes of the site arrays do not match the number of sites {num_sites}')
+
+        if num_sites and (kind_indices.min() < 0 or kind_indices.max() >= len(kinds)):
+            raise ValidationError('A site has a kind index that does not refer to any of the kinds')
+
+        used_kind_indices = set(kind_indices.tolist())
+
+        return {kind.name for index, kind in enumerate(kinds) if index not in used_kind_indices}
+
     def _prepare_xsf(self, main_file_name=''):
         """Write the given structure to a string of format XSF (for XCrySDen)."""
         if self.is_alloy or self.has_vacancies:
@@ -1012,7 +1051,7 @@ class StructureData(Data):
 
         # Get cell vectors and atomic position
         lattice_vectors = np.array(self.base.attributes.get('cell'))
-        base_sites = self.base.attributes.get('sites')
+        base_sites = list(zip(self.get_site_kindnames(), self.get_positions().tolist()))
 
         start1 = -int(supercell_factors[0] / 2)
         start2 = -int(supercell_factors[1] / 2)
@@ -1032,18 +1071,17 @@ class StructureData(Data):
         center = (lattice_vectors[0] + lattice_vectors[1] + lattice_vectors[2]) / 2.0
 
         for ix, iy, iz in product(grid1, grid2, grid3):
-            for base_site in base_sites:
+            for kind_name, position in base_sites:
                 shift = (ix * lattice_vectors[0] + iy * lattice_vectors[1] + iz * lattice_vectors[2] - center).tolist()
 
-                kind_name = base_site['kind_name']
                 kind_string = self.get_kind(kind_name).get_symbols_string()
 
                 atoms_json.append(
                     {
                         'l': kind_string,
-                        'x': base_site['position'][0] + shift[0],
-                        'y': base_site['position'][1] + shift[1],
-                        'z': base_site['position'][2] + shift[2],
+                        'x': position[0] + shift[0],
+                        'y': position[1] + shift[1],
+                        'z': position[2] + shift[2],
                         'atomic_elements_html': atom_kinds_to_html(kind_string),
                     }
                 )
@@ -1119,14 +1157,17 @@ class StructureData(Data):
             return list(zip(*[(min(values), max(values)) for values in zip(*positions)]))
 
         # Calculating the minimal cell:
-        positions = np.array([site.position for site in self.sites])
+        positions = np.array(self.get_positions())
         position_min, _ = get_extremas_from_positions(positions)
 
         # Translate the structure to the origin, such that the minimal values in each dimension
         # amount to (0,0,0)
         positions -= position_min
-        for index, site in enumerate(self.base.attributes.get('sites')):
-            site['position'] = list(positions[index])
+        if self.has_site_arrays:
+            self.set_site_arrays(positions, self.get_kind_indices())
+        else:
+            for index, site in enumerate(self.base.attributes.get('sites')):
+                site['position'] = list(positions[index])
 
         # The orthorhombic cell that (just) accomodates the whole structure is now given by the
         # extremas of position in each dimension:
@@ -1207,7 +1248,7 @@ class StructureData(Data):
             initial order in which the atoms were appended by the user is
             used to group and/or order the symbols in the formula
         """
-        symbol_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
+        symbol_list = self._get_site_symbols()
 
         return get_formula(symbol_list, mode=mode, separator=separator)
 
@@ -1221,8 +1262,17 @@ class StructureData(Data):
 
         :return: a list of strings
         """
+        if self.has_site_arrays:
+            kind_names = self.get_kind_names()
+            return [kind_names[index] for index in self.get_kind_indices().tolist()]
+
         return [this_site.kind_name for this_site in self.sites]
 
+    def _get_site_symbols(self):
+        """Return a list with, for each site, the symbols string of its kind, see :meth:`Kind.get_symbols_string`."""
+        symbols = [kind.get_symbols_string() for kind in self.kinds]
+        return [symbols[index] for index in self.get_kind_indices().tolist()]
+
     def get_composition(self, mode='full'):
         """Returns the chemical composition of this structure as a dictionary,
         where each key is the kind symbol (e.g. H, Li, Ba),
@@ -1239,7 +1289,7 @@ class StructureData(Data):
         """
         import numpy as np
 
-        symbols_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
+        symbols_list = self._get_site_symbols()
         symbols_set = set(symbols_list)
 
         if mode == 'full':
@@ -1364,7 +1414,14 @@ class StructureData(Data):
             )
 
         # If here, no exceptions have been raised, so I add the site.
-        self.base.attributes.all.setdefault('sites', []).append(new_site.get_raw())
+        if self.has_site_arrays:
+            import numpy as np
+
+            kind_index = self.get_kind_names().index(new_site.kind_name)
+            positions = np.vstack([self.get_positions(), new_site.position])
+            self.set_site_arrays(positions, np.append(self.get_kind_indices(), kind_index))
+        else:
+            self.base.attributes.all.setdefault('sites', []).append(new_site.get_raw())
 
     def append_atom(self, **kwargs):
         """Append an atom to the Structure, taking care of creating the
@@ -1488,17 +1545,148 @@ class StructureData(Data):
         if self.is_stored:
             raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
 
+        if self.has_site_arrays:
+            for filename in self._SITE_ARRAY_FILENAMES.values():
+                self.base.repository.delete_object(filename)
+            self.base.attributes.delete(self._NUM_SITES_KEY)
+
         self.base.attributes.set('sites', [])
 
     @property
     def sites(self):
-        """Returns a list of sites."""
+        """Returns a list of sites.
+
+        .. note:: This creates a :class:`Site` for each site, which is slow for large structures. Use
+            :meth:`get_positions` and :meth:`get_kind_indices` instead where possible.
+        """
+        if self.has_site_arrays:
+            kind_names = self.get_kind_names()
+            return [
+                Site(kind_name=kind_names[index], position=position)
+                for index, position in zip(self.get_kind_indices().tolist(), self.get_positions().tolist())
+            ]
+
         try:
             raw_sites = self.base.attributes.get('sites')
         except AttributeError:
             raw_sites = []
         return [Site(raw=i) for i in raw_sites]
 
+    @property
+    def has_site_arrays(self) -> bool:
+        """Return whether the sites are stored as arrays in the repository, see :meth:`set_site_arrays`."""
+        return self.base.attributes.get(self._NUM_SITES_KEY, None) is not None
+
+    def set_site_arrays(self, positions, kind_indices):
+        """Replace the sites by the given positions and kinds, which are stored as arrays in the repository.
+
+        This is a compact representation for large structures: instead of a dictionary per site in the ``sites``
+        attribute, the positions and the indices of the kinds of the sites are written to ``.npy`` files, and only the
+        kinds, the cell and the periodic boundary conditions remain in the attributes. The sites can still be accessed
+        through :attr:`sites`, but :meth:`get_positions` and :meth:`get_kind_indices` return them without creating an
+        object per site.
+
+        :param positions: the absolute positions of the sites in angstrom, an array-like with shape ``(N, 3)``.
+        :param kind_indices: the index in :attr:`kinds` of the kind of each site, an array-like with shape ``(N,)``.
+        :raises aiida.common.ModificationNotAllowed: if the node is already stored.
+        :raises ValueError: if the shapes of the arrays do not match, or an index does not refer to one of the kinds.
+        """
+        import numpy as np
+
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
+
+        positions = np.array(positions, dtype=np.float64)
+        kind_indices = np.array(kind_indices, dtype=np.int64)
+
+        if positions.size == 0:
+            positions = positions.reshape(0, 3)
+
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError(f'The positions should have shape (N, 3), got {positions.shape}.')
+
+        if kind_indices.shape != (len(positions),):
+            raise ValueError(f'The kind indices should have shape ({len(positions)},), got {kind_indices.shape}.')
+
+        num_kinds = len(self.base.attributes.get('kinds', []))
+
+        if len(kind_indices) and (kind_indices.min() < 0 or kind_indices.max() >= num_kinds):
+            raise ValueError(f'The kind indices should be between 0 and the number of kinds {num_kinds}.')
+
+        for name, array in (('positions', positions), ('kind_indices', kind_indices)):
+            stream = io.BytesIO()
+            np.save(stream, array, allow_pickle=False)
+            stream.seek(0)
+            self.base.repository.put_object_from_filelike(stream, self._SITE_ARRAY_FILENAMES[name])
+
+        if 'sites' in self.base.attributes:
+            self.base.attributes.delete('sites')
+
+        self.base.attributes.set(self._NUM_SITES_KEY, len(positions))
+
+    def compact_sites(self):
+        """Store the sites as arrays in the repository instead of in the attributes, see :meth:`set_site_arrays`.
+
+        :raises aiida.common.ModificationNotAllowed: if the node is already stored.
+        """
+        if not self.has_site_arrays:
+            self.set_site_arrays(self.get_positions(), self.get_kind_indices())
+
+    def get_positions(self):
+        """Return the positions of the sites in angstrom.
+
+        :return: a numpy array with shape ``(N, 3)``, which is read-only if the node is stored.
+        """
+        import numpy as np
+
+        if self.has_site_arrays:
+            return self._get_site_array('positions')
+
+        sites = self.base.attributes.get('sites', [])
+        return np.array([site['position'] for site in sites], dtype=np.float64).reshape(-1, 3)
+
+    def get_kind_indices(self):
+        """Return for each site the index of its kind in :attr:`kinds`.
+
+        :return: a numpy array of integers with shape ``(N,)``, which is read-only if the node is stored.
+        :raises ValueError: if a site has a kind name that does not correspond to any of the kinds.
+        """
+        import numpy as np
+
+        if self.has_site_arrays:
+            return self._get_site_array('kind_indices')
+
+        indices = {name: index for index, name in enumerate(self.get_kind_names())}
+        sites = self.base.attributes.get('sites', [])
+
+        try:
+            return np.array([indices[site['kind_name']] for site in sites], dtype=np.int64)
+        except KeyError as exc:
+            raise ValueError(f"Kind name '{exc.args[0]}' unknown")
+
+    def _get_site_array(self, name):
+        """Return the array of the sites with the given name from the repository, caching it if the node is stored."""
+        import numpy as np
+
+        if self.is_stored:
+            try:
+                return self._site_arrays_cache[name]
+            except AttributeError:
+                self._site_arrays_cache = {}
+            except KeyError:
+                pass
+
+        with self.base.repository.open(self._SITE_ARRAY_FILENAMES[name], mode='rb') as handle:
+            array = np.load(handle, allow_pickle=False)
+
+        if self.is_stored:
+            array.flags.writeable = False
+            self._site_arrays_cache[name] = array
+
+        return array
+
     @property
     def kinds(self):
         """Returns a list of kinds."""
@@ -1605,6 +1793,11 @@ class StructureData(Data):
 
         if not conserve_particle:
             raise NotImplementedError
+        elif self.has_site_arrays:
+            if self.base.attributes.get(self._NUM_SITES_KEY) != len(new_positions):
+                raise ValueError('the new positions should be as many as the previous structure.')
+
+            self.set_site_arrays(new_positions, self.get_kind_indices())
         else:
             # test consistency of th enew input
             n_sites = len(self.sites)
@@ -1809,9 +2002,26 @@ class StructureData(Data):
 
         asecell = ase.Atoms(cell=self.cell, pbc=self.pbc)
         _kinds = self.kinds
+        kind_indices = self.get_kind_indices().tolist()
 
-        for site in self.sites:
-            asecell.append(site.get_ase(kinds=_kinds))
+        if not kind_indices:
+            return asecell
+
+        # The atom of a site only depends on the position through the position itself, so each kind is converted once
+        kind_atoms = {
+            index: Site(kind_name=_kinds[index].name, position=(0, 0, 0)).get_ase(kinds=_kinds)
+            for index in dict.fromkeys(kind_indices)
+        }
+        atoms = [kind_atoms[index] for index in kind_indices]
+
+        asecell.extend(
+            ase.Atoms(
+                symbols=[atom.symbol for atom in atoms],
+                positions=self.get_positions(),
+                masses=[atom.mass for atom in atoms],
+                tags=[atom.tag for atom in atoms] if any(atom.tag for atom in atoms) else None,
+            )
+        )
         return asecell
 
     def _get_object_pymatgen(self, **kwargs):
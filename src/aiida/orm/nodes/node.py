@@ -618,6 +618,16 @@ class Node(Entity['BackendNode', NodeCollection['Node']], metaclass=AbstractNode
         if self.is_stored:
             raise exceptions.ModificationNotAllowed('the attributes of a stored entity are immutable')
 
+    def _check_mutability_repository(self, paths: list[str] | None = None) -> None:
+        """Check if the repository of the entity is mutable and raise an exception if not.
+
+        This is called from `NodeRepository` methods that modify the repository.
+
+        :param paths: the paths of the objects that will be mutated, or all if None
+        """
+        if self.is_stored:
+            raise exceptions.ModificationNotAllowed('the node is stored and therefore the repository is immutable.')
+
     def __eq__(self, other: Any) -> bool:
         """Fallback equality comparison by uuid (can be overwritten by specific types)"""
         if isinstance(other, Node) and self.uuid == other.uuid:
@@ -19,6 +19,7 @@ from pydantic import field_validator
 from aiida.common import exceptions
 from aiida.common.datastructures import CalcJobState
 from aiida.common.lang import classproperty
+from aiida.orm.entities import EntityTypes
 from aiida.orm.pydantic import OrmMetadataField
 
 from ..process import ProcessNodeCaching
@@ -461,12 +462,24 @@ class CalcJobNode(CalculationNode):
 
         :return: `AuthInfo`
         """
-        computer = self.computer
 
-        if computer is None:
-            raise exceptions.NotExistent('No computer has been set for this calculation')
+        def get_authinfo() -> AuthInfo:
+            computer = self.computer
 
-        return computer.get_authinfo(self.user)
+            if computer is None:
+                raise exceptions.NotExistent('No computer has been set for this calculation')
+
+            return computer.get_authinfo(self.user)
+
+        if not self.is_stored:
+            return get_authinfo()
+
+        # The computer and user of a stored node cannot change, so the authinfo is cached until one is written
+        return self.backend.entity_cache.get(
+            ('calcjob_authinfo', self.pk),
+            get_authinfo,
+            (EntityTypes.NODE, EntityTypes.AUTHINFO, EntityTypes.COMPUTER, EntityTypes.USER),
+        )
 
     def get_transport(self) -> Transport:
         """Return the transport for this calculation.
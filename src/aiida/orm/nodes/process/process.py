@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import enum
+import gzip
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -156,6 +157,7 @@ class ProcessNode(Sealable, Node):
     _CLS_NODE_CACHING = ProcessNodeCaching
 
     CHECKPOINT_KEY = 'checkpoints'
+    CHECKPOINT_FILEPATH = '.aiida_checkpoint.yaml.gz'
     EXCEPTION_KEY = 'exception'
     EXIT_MESSAGE_KEY = 'exit_message'
     EXIT_STATUS_KEY = 'exit_status'
@@ -191,6 +193,10 @@ class ProcessNode(Sealable, Node):
             cls.PROCESS_STATUS_KEY,
         )
 
+    @classproperty
+    def _updatable_repository_objects(cls) -> tuple[str, ...]:  # noqa: N805
+        return super()._updatable_repository_objects + (cls.CHECKPOINT_FILEPATH,)
+
     class AttributesModel(Node.AttributesModel, Sealable.AttributesModel):
         process_label: str | None = OrmMetadataField(
             None,
@@ -551,24 +557,73 @@ class ProcessNode(Sealable, Node):
     def checkpoint(self) -> str | None:
         """Return the checkpoint bundle set for the process
 
+        If the checkpoint was stored compressed in the repository, it is only read and decompressed when this property
+        is accessed.
+
         :returns: checkpoint bundle if it exists, None otherwise
         """
-        return self.base.attributes.get(self.CHECKPOINT_KEY, None)
+        checkpoint = self.base.attributes.get(self.CHECKPOINT_KEY, None)
+
+        if self._is_checkpoint_reference(checkpoint):
+            content = self.base.repository.get_object_content(checkpoint['path'], mode='rb')
+            return gzip.decompress(content).decode('utf-8')
+
+        return checkpoint
 
-    def set_checkpoint(self, checkpoint: str) -> None:
+    def set_checkpoint(self, checkpoint: str, compress: bool = False) -> None:
         """Set the checkpoint bundle set for the process
 
         :param state: string representation of the stepper state info
+        :param compress: if True, the checkpoint is stored compressed in the repository of the node, at the path
+            ``CHECKPOINT_FILEPATH``, and the attribute only contains a reference to it. This keeps large checkpoints
+            out of the attributes, which are rewritten in their entirety on every update. The node has to be stored.
+            Each write adds a new object to the repository backend, the replaced checkpoint is no longer referenced and
+            is deleted by the maintenance operations of the storage.
         """
-        return self.base.attributes.set(self.CHECKPOINT_KEY, checkpoint)
+        if not compress:
+            self._delete_checkpoint_object()
+            return self.base.attributes.set(self.CHECKPOINT_KEY, checkpoint)
+
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('a compressed checkpoint can only be set on a stored node.')
+
+        content = gzip.compress(checkpoint.encode('utf-8'), compresslevel=1, mtime=0)
+        self.base.repository.put_object_from_bytes(content, self.CHECKPOINT_FILEPATH)
+
+        reference = {'path': self.CHECKPOINT_FILEPATH, 'compression': 'gzip'}
+
+        if self.base.attributes.get(self.CHECKPOINT_KEY, None) != reference:
+            self.base.attributes.set(self.CHECKPOINT_KEY, reference)
 
     def delete_checkpoint(self) -> None:
         """Delete the checkpoint bundle set for the process"""
+        self._delete_checkpoint_object()
         try:
             self.base.attributes.delete(self.CHECKPOINT_KEY)
         except AttributeError:
             pass
 
+    def _delete_checkpoint_object(self) -> None:
+        """Delete the compressed checkpoint from the repository, if the current checkpoint is stored there.
+
+        The object is only removed from the repository metadata of the node: the content is deleted from the
+        repository backend once it is no longer referenced, by the maintenance operations of the storage.
+        """
+        checkpoint = self.base.attributes.get(self.CHECKPOINT_KEY, None)
+
+        if not self._is_checkpoint_reference(checkpoint):
+            return
+
+        try:
+            self.base.repository.delete_object(checkpoint['path'])
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _is_checkpoint_reference(checkpoint: Any) -> bool:
+        """Return whether the checkpoint attribute is a reference to a compressed checkpoint in the repository."""
+        return isinstance(checkpoint, dict) and set(checkpoint) == {'path', 'compression'}
+
     @property
     def paused(self) -> bool:
         """Return whether the process is paused
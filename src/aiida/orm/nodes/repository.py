@@ -11,7 +11,6 @@ import tempfile
 import typing as t
 import zipfile
 
-from aiida.common import exceptions
 from aiida.manage import get_config_option
 
 if t.TYPE_CHECKING:
@@ -61,13 +60,13 @@ class NodeRepository:
         if self._node.is_stored:
             self._node.backend_entity.repository_metadata = self.serialize()
 
-    def _check_mutability(self):
+    def _check_mutability(self, paths: list[str] | None = None):
         """Check if the node is mutable.
 
+        :param paths: the paths of the objects that will be mutated, or all if None
         :raises `~aiida.common.exceptions.ModificationNotAllowed`: when the node is stored and therefore immutable.
         """
-        if self._node.is_stored:
-            raise exceptions.ModificationNotAllowed('the node is stored and therefore the repository is immutable.')
+        self._node._check_mutability_repository(paths)
 
     @property
     def _repository(self) -> Repository:
@@ -316,7 +315,7 @@ class NodeRepository:
         :raises TypeError: if the path is not a string and relative path.
         :raises FileExistsError: if an object already exists at the given path.
         """
-        self._check_mutability()
+        self._check_mutability([path])
         self._repository.put_object_from_filelike(io.BytesIO(content), path)
         self._update_repository_metadata()
 
@@ -405,7 +404,7 @@ class NodeRepository:
         :raises OSError: if the file could not be deleted.
         :raises `~aiida.common.exceptions.ModificationNotAllowed`: when the node is stored and therefore immutable.
         """
-        self._check_mutability()
+        self._check_mutability([path])
         self._repository.delete_object(path)
         self._update_repository_metadata()
 
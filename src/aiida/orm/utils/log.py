@@ -10,6 +10,12 @@
 
 import logging
 import sys
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiida.orm.implementation import StorageBackend
 
 
 class DBLogHandler(logging.Handler):
@@ -47,6 +53,135 @@ class DBLogHandler(logging.Handler):
             raise
 
 
+class BufferedDBLogHandler(DBLogHandler):
+    """A db log handler that buffers records and writes them to the database in bulk.
+
+    Writing a log entry to the database for each record blocks the thread that emits it, which for a daemon worker is
+    the event loop that runs all its processes. Instead, this handler buffers the records and a background thread writes
+    them to the database every ``flush_interval`` seconds, or as soon as ``capacity`` records are buffered. Processes
+    call :func:`flush_database_log_handlers` when they terminate, such that their log entries are stored once they are
+    done, and the remaining records are written when the handler is closed, which also happens at interpreter exit.
+    """
+
+    def __init__(self, level=logging.NOTSET, capacity=100, flush_interval=1.0):
+        """Construct a new instance.
+
+        :param level: the level of the handler
+        :param capacity: the number of buffered records at which they are written to the database straight away
+        :param flush_interval: the maximum number of seconds that records are buffered before they are written
+        """
+        super().__init__(level)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._closed = threading.Event()
+        self._thread = None
+        _BUFFERED_HANDLERS.add(self)
+
+    def emit(self, record, _sys=sys):
+        # when we finalize we do not have any guarantee on database resources being alive, therefore we omit logging
+        if _sys.is_finalizing() or self._closed.is_set():
+            return
+
+        if record.exc_info:
+            self.format(record)
+
+        from aiida import orm
+
+        try:
+            backend = record.__dict__.pop('backend')
+        except KeyError:
+            # The backend should be set. We silently absorb this error
+            return
+
+        # The fields are determined straight away, as the arguments of the record may still change after it is emitted
+        fields = orm.Log.get_collection(backend).get_fields_from_record(record)
+
+        if fields is None:
+            return
+
+        with self._buffer_lock:
+            self._buffer.append((backend, fields))
+            full = len(self._buffer) >= self.capacity
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='aiida-db-log-handler', daemon=True)
+                self._thread.start()
+
+        if full:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Write all buffered records to the database."""
+        from aiida import orm
+
+        with self._flush_lock:
+            with self._buffer_lock:
+                buffer, self._buffer = self._buffer, []
+
+            # Records are grouped per storage backend, keeping their order, and written with a single insert per backend
+            entries: dict[StorageBackend, list[dict[str, Any]]] = {}
+            for backend, fields in buffer:
+                entries.setdefault(backend, []).append(fields)
+
+            for backend, fields in entries.items():
+                if backend.is_closed:
+                    continue
+
+                collection = orm.Log.get_collection(backend)
+                try:
+                    collection.create_entries(fields)
+                except Exception:
+                    # A single entry that cannot be stored should not cause all the others to be lost
+                    for entry in fields:
+                        try:
+                            collection.create_entries([entry])
+                        except Exception:
+                            import traceback
+
+                            traceback.print_exc()
+
+    def close(self):
+        """Stop the background thread and write all buffered records to the database."""
+        self._closed.set()
+        self._flush_requested.set()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self.flush()
+        _BUFFERED_HANDLERS.discard(self)
+        super().close()
+
+    def _run(self):
+        """Write the buffered records to the database periodically, until the handler is closed."""
+        while not self._closed.is_set():
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+
+            if self._closed.is_set():
+                break
+
+            try:
+                self.flush()
+            except Exception:
+                import traceback
+
+                traceback.print_exc()
+
+
+_BUFFERED_HANDLERS: 'weakref.WeakSet[BufferedDBLogHandler]' = weakref.WeakSet()
+
+
+def flush_database_log_handlers():
+    """Write the records of all buffered db log handlers to the database."""
+    for handler in list(_BUFFERED_HANDLERS):
+        handler.flush()
+
+
 def get_dblogger_extra(node):
     """Return the additional information necessary to attach any log records to the given node instance.
 
@@ -192,6 +192,10 @@ class Sealable:
     def _updatable_attributes(cls) -> tuple[str, ...]:  # noqa: N805
         return (cls.SEALED_KEY,)
 
+    @classproperty
+    def _updatable_repository_objects(cls) -> tuple[str, ...]:  # noqa: N805
+        return ()
+
     @property
     def sealed(self) -> bool:
         return self.base.attributes.get(self.SEALED_KEY, False)  # type: ignore[attr-defined]
@@ -227,3 +231,23 @@ class Sealable:
                 raise exceptions.ModificationNotAllowed(
                     f'Cannot modify non-updatable attributes of a stored+unsealed node: {keys}'
                 )
+
+    @override
+    def _check_mutability_repository(self, paths: list[str] | None = None) -> None:
+        """Check if the repository of the entity is mutable and raise an exception if not.
+
+        This is called from `NodeRepository` methods that modify the repository.
+
+        :param paths: the paths of the objects that will be mutated, or all if None
+        """
+        if self.is_sealed:
+            raise exceptions.ModificationNotAllowed('the repository of a sealed node is immutable')
+
+        if self.is_stored:  # type: ignore[attr-defined]
+            # here we are more lenient than the base class, since we allow the modification of some objects
+            if paths is None:
+                raise exceptions.ModificationNotAllowed('Cannot bulk modify the repository of a stored+unsealed node')
+            elif any(path not in self._updatable_repository_objects for path in paths):
+                raise exceptions.ModificationNotAllowed(
+                    f'Cannot modify non-updatable repository objects of a stored+unsealed node: {paths}'
+                )
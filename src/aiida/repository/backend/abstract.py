@@ -183,6 +183,19 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with self.open(key) as handle:
             return chunked_file_hash(handle, hashlib.sha256)
 
+    def get_object_hashes(self, keys: list[str]) -> list[str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        Implementations should override this if the hashes of many objects can be determined more efficiently at once
+        than by calling :meth:`get_object_hash` for each of them.
+
+        :param keys: list of fully qualified identifiers for the objects within the repository.
+        :return: list of hashes, in the same order as the keys provided.
+        :raise FileNotFoundError: if any of the files does not exist.
+        :raise OSError: if any of the files could not be opened.
+        """
+        return [self.get_object_hash(key) for key in keys]
+
     @abc.abstractmethod
     def delete_objects(self, keys: list[str]) -> None:
         """Delete the objects from the repository.
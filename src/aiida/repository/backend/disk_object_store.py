@@ -146,6 +146,30 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
                 return super().get_object_hash(key)
         return key
 
+    def get_object_hashes(self, keys: list[str]) -> list[str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        If the container uses SHA-256 as its hash type, the keys are the hashes, so only a single query is needed to
+        check that all objects exist.
+
+        :param keys: list of fully qualified identifiers for the objects within the repository.
+        :return: list of hashes, in the same order as the keys provided.
+        :raise FileNotFoundError: if any of the files does not exist.
+        """
+        with self._container as container:
+            hash_type = container.hash_type
+            keys_exist = container.has_objects(keys) if hash_type == 'sha256' else []
+
+        if hash_type != 'sha256':
+            return super().get_object_hashes(keys)
+
+        missing = [key for key, key_exists in zip(keys, keys_exist) if not key_exists]
+
+        if missing:
+            raise FileNotFoundError(f'objects with keys `{", ".join(missing)}` do not exist.')
+
+        return list(keys)
+
     def maintain(
         self,
         dry_run: bool = False,
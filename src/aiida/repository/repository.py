@@ -117,12 +117,16 @@ class Repository:
         :return: the hash representing the contents of the repository.
         """
         objects: dict[str, Any] = {}
+        keys: dict[str, str] = {}
         for root, dirnames, filenames in self.walk():
             objects['__dirnames__'] = dirnames
             for filename in filenames:
                 key = self.get_file(root / filename).key
                 assert key is not None, 'Expected FileType.File to have a key'
-                objects[str(root / filename)] = self.backend.get_object_hash(key)
+                keys[str(root / filename)] = key
+
+        # Retrieve the hashes of all files at once, which is a lot faster for backends that support it
+        objects.update(zip(keys, self.backend.get_object_hashes(list(keys.values()))))
 
         return make_hash(objects)
 
@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import abc
+import re
 import typing as t
 
 from aiida.common.escaping import escape_for_bash
@@ -20,6 +21,11 @@ from aiida.schedulers.scheduler import Scheduler, SchedulerError
 
 __all__ = ('BashCliScheduler',)
 
+BATCH_SUBMIT_MARKER = '__AIIDA_SUBMIT__'
+"""Marker echoed around the output of each submit command in a batched submission."""
+
+BATCH_SUBMIT_MARKER_REGEX = re.compile(rf'{BATCH_SUBMIT_MARKER} (\d+) (begin|end (-?\d+))\n')
+
 
 class BashCliScheduler(Scheduler, metaclass=abc.ABCMeta):
     """Job scheduler that is interacted with through a CLI in bash."""
@@ -35,6 +41,104 @@ class BashCliScheduler(Scheduler, metaclass=abc.ABCMeta):
         )
         return self._parse_submit_output(*result)
 
+    async def submit_job_async(self, working_directory: str, filename: str) -> str | ExitCode:
+        """Submit a job without blocking the event loop.
+
+        :param working_directory: The absolute filepath to the working directory where the job is to be executed.
+        :param filename: The filename of the submission script relative to the working directory.
+        """
+        result = await self.transport.exec_command_wait_async(
+            self._get_submit_command(escape_for_bash(filename)), workdir=working_directory
+        )
+        return self._parse_submit_output(*result)
+
+    async def submit_jobs_async(self, jobs: t.Sequence[tuple[str, str]]) -> list[str | ExitCode | Exception]:
+        """Submit multiple jobs with a single command without blocking the event loop.
+
+        The submit commands of all jobs are executed one after the other in a single shell invocation, with markers
+        echoed around the output of each, such that the output can be split per job and parsed by
+        ``_parse_submit_output`` as if the jobs had been submitted separately.
+
+        :param jobs: sequence of tuples of the working directory and filename of the submission script of each job.
+        :returns: for each job, in the same order, the job ID, exit code or exception as returned or raised by
+            :meth:`submit_job`.
+        """
+        if len(jobs) <= 1:
+            return await super().submit_jobs_async(jobs)
+
+        retval, stdout, stderr = await self.transport.exec_command_wait_async(self._get_batch_submit_command(jobs))
+        outputs = self._split_batch_submit_output(len(jobs), stdout, stderr)
+        results: list[str | ExitCode | Exception] = []
+
+        for index, output in enumerate(outputs):
+            if output is None:
+                results.append(
+                    SchedulerError(
+                        f'No output for job {index} of batched submission: retval={retval}; stdout={stdout}; '
+                        f'stderr={stderr}'
+                    )
+                )
+                continue
+            try:
+                results.append(self._parse_submit_output(*output))
+            except Exception as exception:
+                results.append(exception)
+
+        return results
+
+    def _get_batch_submit_command(self, jobs: t.Sequence[tuple[str, str]]) -> str:
+        """Return the command to submit multiple jobs in a single shell invocation.
+
+        The submit command of each job runs in a subshell in its working directory. Its exit status is recorded before
+        waiting for any background processes it started, such that their output is written before the end marker.
+
+        :param jobs: sequence of tuples of the working directory and filename of the submission script of each job.
+        """
+        lines = []
+
+        for index, (working_directory, filename) in enumerate(jobs):
+            submit_command = self._get_submit_command(escape_for_bash(filename))
+            lines.extend(
+                [
+                    f'echo "{BATCH_SUBMIT_MARKER} {index} begin"; echo "{BATCH_SUBMIT_MARKER} {index} begin" >&2',
+                    f'(cd {escape_for_bash(working_directory)} && {submit_command}',
+                    'retval=$?; wait; exit $retval)',
+                    f'echo "{BATCH_SUBMIT_MARKER} {index} end $?"',
+                ]
+            )
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _split_batch_submit_output(num_jobs: int, stdout: str, stderr: str) -> list[tuple[int, str, str] | None]:
+        """Split the output of the command returned by ``_get_batch_submit_command`` per job.
+
+        :param num_jobs: the number of jobs in the batch.
+        :returns: for each job the tuple of exit status, stdout and stderr of its submit command, or ``None`` if the
+            output of the job is incomplete, e.g. because the connection was lost.
+        """
+        stdouts: dict[int, str] = {}
+        retvals: dict[int, int] = {}
+        stderrs: dict[int, str] = {}
+        start: dict[int, int] = {}
+
+        for match in BATCH_SUBMIT_MARKER_REGEX.finditer(stdout):
+            index = int(match.group(1))
+            if match.group(2) == 'begin':
+                start[index] = match.end()
+            elif index in start:
+                stdouts[index] = stdout[start[index] : match.start()]
+                retvals[index] = int(match.group(3))
+
+        matches = [match for match in BATCH_SUBMIT_MARKER_REGEX.finditer(stderr) if match.group(2) == 'begin']
+        for match, following in zip(matches, [*matches[1:], None]):
+            stderrs[int(match.group(1))] = stderr[match.end() : following.start() if following else len(stderr)]
+
+        return [
+            (retvals[index], stdouts[index], stderrs.get(index, '')) if index in retvals else None
+            for index in range(num_jobs)
+        ]
+
     @t.overload
     def get_jobs(
         self,
@@ -68,6 +172,49 @@ class BashCliScheduler(Scheduler, metaclass=abc.ABCMeta):
         with self.transport:
             retval, stdout, stderr = self.transport.exec_command_wait(self._get_joblist_command(jobs=jobs, user=user))
 
+        return self._get_jobs_from_output(retval, stdout, stderr, as_dict)
+
+    @t.overload
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: t.Literal[False] = False,
+    ) -> list[JobInfo]: ...
+
+    @t.overload
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: t.Literal[True] = ...,
+    ) -> dict[str, JobInfo]: ...
+
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: bool = False,
+    ) -> list[JobInfo] | dict[str, JobInfo]:
+        """Return the list of currently active jobs without blocking the event loop.
+
+        :param jobs: A list of jobs to check; only these are checked.
+        :param user: A string with a user: only jobs of this user are checked.
+        :param as_dict: If ``False`` (default), a list of ``JobInfo`` objects is returned. If ``True``, a dictionary is
+            returned, where the ``job_id`` is the key and the values are the ``JobInfo`` objects.
+        :returns: List of active jobs.
+        """
+        async with self.transport:
+            retval, stdout, stderr = await self.transport.exec_command_wait_async(
+                self._get_joblist_command(jobs=jobs, user=user)
+            )
+
+        return self._get_jobs_from_output(retval, stdout, stderr, as_dict)
+
+    def _get_jobs_from_output(
+        self, retval: int, stdout: str, stderr: str, as_dict: bool
+    ) -> list[JobInfo] | dict[str, JobInfo]:
+        """Parse the output of the joblist command into the return value of ``get_jobs``."""
         joblist = self._parse_joblist_output(retval, stdout, stderr)
         if as_dict:
             jobdict = {job.job_id: job for job in joblist}
@@ -91,6 +238,15 @@ class BashCliScheduler(Scheduler, metaclass=abc.ABCMeta):
         retval, stdout, stderr = self.transport.exec_command_wait(self._get_kill_command(jobid))
         return self._parse_kill_output(retval, stdout, stderr)
 
+    async def kill_job_async(self, jobid: str) -> bool:
+        """Kill a remote job without blocking the event loop.
+
+        :param jobid: the job ID to be killed
+        :returns: True if everything seems ok, False otherwise.
+        """
+        retval, stdout, stderr = await self.transport.exec_command_wait_async(self._get_kill_command(jobid))
+        return self._parse_kill_output(retval, stdout, stderr)
+
     @abc.abstractmethod
     def _get_submit_command(self, submit_script: str) -> str:
         """Return the string to execute to submit a given script.
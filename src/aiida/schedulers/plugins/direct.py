@@ -296,7 +296,42 @@ class DirectScheduler(BashCliScheduler):
         missing processes as DONE.
         """
         job_stats = super().get_jobs(jobs=jobs, user=user, as_dict=True)
+        return self._add_missing_jobs(job_stats, jobs, as_dict)
 
+    @t.overload
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: t.Literal[False] = False,
+    ) -> list[JobInfo]: ...
+
+    @t.overload
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: t.Literal[True] = ...,
+    ) -> dict[str, JobInfo]: ...
+
+    @override
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: bool = False,
+    ) -> list[JobInfo] | dict[str, JobInfo]:
+        """Overrides original method from BashScheduler in order to list
+        missing processes as DONE.
+        """
+        job_stats = await super().get_jobs_async(jobs=jobs, user=user, as_dict=True)
+        return self._add_missing_jobs(job_stats, jobs, as_dict)
+
+    @staticmethod
+    def _add_missing_jobs(
+        job_stats: dict[str, JobInfo], jobs: list[str] | None, as_dict: bool
+    ) -> list[JobInfo] | dict[str, JobInfo]:
+        """Add the requested jobs that are no longer running to the job list with the ``DONE`` state."""
         # Get the list of known jobs
         found_jobs = job_stats.keys()
         # Now check if there are any the user requested but were not found
@@ -179,6 +179,86 @@ class Scheduler(metaclass=abc.ABCMeta):
         :returns: True if everything seems ok, False otherwise.
         """
 
+    async def submit_job_async(self, working_directory: str, filename: str) -> str | ExitCode:
+        """Submit a job without blocking the event loop.
+
+        The default implementation calls :meth:`submit_job`. Plugins should override it if the scheduler can be
+        addressed through the asynchronous interface of the transport.
+
+        :param working_directory: The absolute filepath to the working directory where the job is to be executed.
+        :param filename: The filename of the submission script relative to the working directory.
+        """
+        return self.submit_job(working_directory, filename)
+
+    async def submit_jobs_async(self, jobs: t.Sequence[tuple[str, str]]) -> list[str | ExitCode | Exception]:
+        """Submit multiple jobs without blocking the event loop.
+
+        The default implementation submits the jobs one by one with :meth:`submit_job_async`. Plugins should override
+        it if the scheduler can submit multiple jobs with a single command.
+
+        :param jobs: sequence of tuples of the working directory and filename of the submission script of each job,
+            see :meth:`submit_job`.
+        :returns: for each job, in the same order, the result of :meth:`submit_job` or the exception it raised, so the
+            failure of one job does not affect the others.
+        """
+        results: list[str | ExitCode | Exception] = []
+
+        for working_directory, filename in jobs:
+            try:
+                results.append(await self.submit_job_async(working_directory, filename))
+            except Exception as exception:
+                results.append(exception)
+
+        return results
+
+    @t.overload
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: t.Literal[False] = False,
+    ) -> list[JobInfo]: ...
+
+    @t.overload
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: t.Literal[True] = ...,
+    ) -> dict[str, JobInfo]: ...
+
+    async def get_jobs_async(
+        self,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: bool = False,
+    ) -> list[JobInfo] | dict[str, JobInfo]:
+        """Return the list of currently active jobs without blocking the event loop.
+
+        The default implementation calls :meth:`get_jobs`. Plugins should override it if the scheduler can be
+        addressed through the asynchronous interface of the transport.
+
+        :param jobs: A list of jobs to check; only these are checked.
+        :param user: A string with a user: only jobs of this user are checked.
+        :param as_dict: If ``False`` (default), a list of ``JobInfo`` objects is returned. If ``True``, a dictionary is
+            returned, where the ``job_id`` is the key and the values are the ``JobInfo`` objects.
+        :returns: List of active jobs.
+        """
+        if as_dict:
+            return self.get_jobs(jobs=jobs, user=user, as_dict=True)
+        return self.get_jobs(jobs=jobs, user=user, as_dict=False)
+
+    async def kill_job_async(self, jobid: str) -> bool:
+        """Kill a remote job without blocking the event loop.
+
+        The default implementation calls :meth:`kill_job`. Plugins should override it if the scheduler can be
+        addressed through the asynchronous interface of the transport.
+
+        :param jobid: the job ID to be killed
+        :returns: True if everything seems ok, False otherwise.
+        """
+        return self.kill_job(jobid)
+
     def get_submit_script(self, job_tmpl: JobTemplate) -> str:
         """Return the submit script as a string.
 
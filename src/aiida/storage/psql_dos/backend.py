@@ -20,6 +20,7 @@ from disk_objectstore import Container, backup_utils
 from sqlalchemy import column, insert, update
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
+from aiida.cmdline.params.options.interactive import InteractiveOption
 from aiida.common import exceptions
 from aiida.common.exceptions import ClosedStorage, ConfigurationError, IntegrityError
 from aiida.common.log import AIIDA_LOGGER
@@ -46,6 +47,8 @@ CONTAINER_DEFAULTS: dict[str, Any] = {
     'hash_type': 'sha256',
     'compression_algorithm': 'zlib+1',
 }
+OPTION_NOT_PROMPTED = functools.partial(InteractiveOption, prompt_fn=lambda ctx: False)
+"""Class of the command line options for settings that are only tuned by experts, which are not prompted for."""
 
 
 def get_filepath_container(profile: Profile) -> pathlib.Path:
@@ -106,6 +109,45 @@ class PsqlDosBackend(StorageBackend):
             title='File repository URI',
             description='URI to the file repository.',
         )
+        database_pool_size: int = MetadataField(
+            5,
+            title='PostgreSQL connection pool size',
+            description='The number of connections that each process, e.g. a daemon worker, keeps open.',
+            option_cls=OPTION_NOT_PROMPTED,
+        )
+        database_max_overflow: int = MetadataField(
+            10,
+            title='PostgreSQL connection pool overflow',
+            description='The number of connections that each process can open beyond the pool size when needed.',
+            option_cls=OPTION_NOT_PROMPTED,
+        )
+        database_pool_pre_ping: bool = MetadataField(
+            False,
+            title='PostgreSQL connection pre-ping',
+            description='Whether to test connections before they are used, such that connections that were closed, '
+            'for example by a restart of the server, are replaced instead of causing an error.',
+            option_cls=OPTION_NOT_PROMPTED,
+        )
+        database_keepalives_idle: int | None = MetadataField(
+            None,
+            title='PostgreSQL TCP keepalive idle time',
+            description='The number of seconds of inactivity after which TCP keepalives are sent to the server, '
+            'which prevents firewalls from dropping idle connections.',
+            option_cls=OPTION_NOT_PROMPTED,
+        )
+        database_statement_timeout: int | None = MetadataField(
+            None,
+            title='PostgreSQL statement timeout',
+            description='The number of milliseconds after which statements are aborted by the server.',
+            option_cls=OPTION_NOT_PROMPTED,
+        )
+        database_prepared_statements: bool = MetadataField(
+            True,
+            title='PostgreSQL prepared statements',
+            description='Whether statements that are executed repeatedly are prepared on the server. This should be '
+            'disabled when connecting through a pooler in transaction mode, such as PgBouncer.',
+            option_cls=OPTION_NOT_PROMPTED,
+        )
 
     migrator = PsqlDosMigrator
 
@@ -166,11 +208,17 @@ class PsqlDosBackend(StorageBackend):
         Multi-thread support is currently required by the REST API.
         Although, in the future, we may want to move the multi-thread handling to higher in the AiiDA stack.
         """
+        from aiida.orm.entity_cache import EntityCache
+        from aiida.storage.psql_dos.orm.utils import clear_entity_cache_on_detach
         from aiida.storage.psql_dos.utils import create_sqlalchemy_engine
 
         engine = create_sqlalchemy_engine(self._profile.storage_config)  # type: ignore[arg-type]
         self._session_factory = scoped_session(sessionmaker(bind=engine, future=True, expire_on_commit=True))
 
+        # Cached entities are bound to the session of the thread that loaded them
+        self._entity_cache = EntityCache(scope=lambda: id(self.get_session()))
+        clear_entity_cache_on_detach(self._session_factory.session_factory, self._entity_cache)
+
     def get_session(self) -> Session:
         """Return an SQLAlchemy session bound to the current thread."""
         if self._session_factory is None:
@@ -341,6 +389,7 @@ class PsqlDosBackend(StorageBackend):
         session = self.get_session()
         with nullcontext() if self.in_transaction else self.transaction():
             session.execute(update(mapper), rows)
+        self.entity_cache.invalidate(entity_type)
 
     def delete(self, delete_database_user: bool = False) -> None:
         """Delete the storage and all the data.
@@ -395,6 +444,7 @@ class PsqlDosBackend(StorageBackend):
         session.query(DbNode).filter(_create_smarter_in_clause(session=session, column=DbNode.id, values=pks)).delete(
             synchronize_session='fetch'
         )
+        self.entity_cache.invalidate(EntityTypes.NODE)
 
     def get_backend_entity(self, model: base.Base) -> BackendEntity:
         """Return the backend entity that corresponds to the given Model instance
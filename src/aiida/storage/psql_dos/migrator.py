@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import contextlib
 import pathlib
+import warnings
 from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
@@ -27,7 +28,7 @@ from alembic.runtime.environment import EnvironmentContext
 from alembic.runtime.migration import MigrationContext, MigrationInfo
 from alembic.script import ScriptDirectory
 from sqlalchemy import Connection, Engine, MetaData, String, column, desc, insert, inspect, select, table
-from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.exc import OperationalError, ProgrammingError, SAWarning
 from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.orm import Session
 
@@ -335,7 +336,14 @@ class PsqlDosMigrator:
 
         if inspect(self.connection).has_table(self.alembic_version_tbl_name):
             metadata = MetaData()
-            metadata.reflect(bind=self.connection)
+
+            # SQLite cannot reflect expression-based indexes, such as the one on the hash in the extras of nodes, and
+            # emits an SAWarning. The indexes are not needed to delete the contents of the tables.
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    'ignore', message='Skipped unsupported reflection of expression-based index', category=SAWarning
+                )
+                metadata.reflect(bind=self.connection)
 
             # The ``sorted_tables`` property returns the tables sorted by their foreign-key dependencies, with those
             # that are dependent on others first. Iterate over the list in reverse to ensure that the tables with
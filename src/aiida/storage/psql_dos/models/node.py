@@ -11,6 +11,7 @@
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.schema import Column
+from sqlalchemy.sql.expression import text
 from sqlalchemy.sql.schema import ForeignKey, Index
 from sqlalchemy.types import DateTime, Integer, String, Text
 
@@ -104,6 +105,8 @@ class DbNode(Base):
             postgresql_using='btree',
             postgresql_ops={'process_type': 'varchar_pattern_ops'},
         ),
+        # Index on the hash of nodes in the extras, which is used to look up nodes to cache from
+        Index('ix_db_dbnode_extras_aiida_hash', text("(extras #>> '{_aiida_hash}'::text[])"), postgresql_using='btree'),
     )
 
     @property
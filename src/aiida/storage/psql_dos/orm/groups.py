@@ -10,10 +10,14 @@
 
 import logging
 
+from sqlalchemy import select
+
+from aiida.common import exceptions
 from aiida.common.exceptions import UniquenessError
 from aiida.common.lang import type_check
 from aiida.orm.implementation.groups import BackendGroup, BackendGroupCollection
 from aiida.storage.psql_dos.models.group import DbGroup, DbGroupNode
+from aiida.storage.utils import _create_smarter_in_clause
 
 from . import entities, users, utils
 from .extras_mixin import ExtrasMixin
@@ -209,8 +213,6 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], ExtrasMixin, BackendGroup):
 
         :param nodes: a list of `BackendNode` instance to be added to this group
         """
-        from sqlalchemy import and_
-
         super().remove_nodes(nodes)
 
         def check_node(node):
@@ -220,13 +222,134 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], ExtrasMixin, BackendGroup):
             if node.id is None:
                 raise ValueError('At least one of the provided nodes is unstored, stopping...')
 
+        for node in nodes:
+            check_node(node)
+
+        self.remove_nodes_by_pk([node.id for node in nodes])
+
+    def add_nodes_by_pk(self, pks):
+        """Add a set of nodes to the group by their pks, with a single statement that does not load the nodes.
+
+        :note: the group has to be stored.
+
+        :param pks: the pks of the stored nodes to be added to this group
+        :raises `~aiida.common.exceptions.NotExistent`: if no node exists for at least one of the pks
+        """
+        from sqlalchemy import func
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        pks = list(set(pks))
+
+        if not pks:
+            return
+
+        session = self.backend.get_session()
+        node_table = self.NODE_CLASS.MODEL_CLASS.__table__
+        clause = _create_smarter_in_clause(session=session, column=node_table.c.id, values=pks)
+        count = session.execute(select(func.count()).select_from(node_table).where(clause)).scalar_one()
+
+        if count != len(pks):
+            existing = set(session.execute(select(node_table.c.id).where(clause)).scalars())
+            missing = sorted(set(pks).difference(existing))
+            raise exceptions.NotExistent(f'no nodes exist with the pks: {missing}')
+
+        self._insert_nodes(select(node_table.c.id).where(clause))
+
+    def remove_nodes_by_pk(self, pks):
+        """Remove a set of nodes from the group by their pks, with a single statement that does not load the nodes.
+
+        :note: the group has to be stored.
+
+        :param pks: the pks of the nodes to be removed from this group
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+        pks = list(set(pks))
+
+        if not pks:
+            return
+
+        table = self.GROUP_NODE_CLASS.__table__
+        self._delete_nodes(
+            _create_smarter_in_clause(session=self.backend.get_session(), column=table.c.dbnode_id, values=pks)
+        )
+
+    def add_nodes_by_query(self, query):
+        """Add the nodes whose pks are returned by a query to the group, with a single ``INSERT ... SELECT`` statement.
+
+        :note: the group has to be stored.
+
+        :param query: the query, which should project a single field: the pk of the nodes
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        subquery = self._get_pks_subquery(query)
+        self._insert_nodes(select(subquery.c[0]).where(subquery.c[0].is_not(None)))
+
+    def remove_nodes_by_query(self, query):
+        """Remove the nodes whose pks are returned by a query from the group, with a single statement.
+
+        :note: the group has to be stored.
+
+        :param query: the query, which should project a single field: the pk of the nodes
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+        subquery = self._get_pks_subquery(query)
+        table = self.GROUP_NODE_CLASS.__table__
+        self._delete_nodes(table.c.dbnode_id.in_(select(subquery.c[0])))
+
+    def _get_pks_subquery(self, query):
+        """Return the subquery of the given query, validating that it projects a single field.
+
+        :param query: the query, which should project a single field: the pk of the nodes
+        """
+        subquery = self.backend.query().get_query(query).query.subquery()
+
+        if len(subquery.c) != 1:
+            raise ValueError(
+                f'the query should project a single field, the pk of the nodes, got: {list(subquery.c.keys())}'
+            )
+
+        return subquery
+
+    def _insert_nodes(self, pks):
+        """Insert the nodes whose pks are selected by the given statement in the group, skipping those already in it.
+
+        :param pks: a select statement of the pks of the nodes
+        """
+        from sqlalchemy import literal
+        from sqlalchemy.dialects.postgresql import insert
+
+        pks = pks.subquery()
+        table = self.GROUP_NODE_CLASS.__table__
+        # The ``WHERE`` clause is required by SQLite to parse the ``ON CONFLICT`` clause of an ``INSERT ... SELECT``
+        statement = insert(table).from_select(
+            ['dbnode_id', 'dbgroup_id'], select(pks.c[0], literal(self.id)).where(pks.c[0].is_not(None))
+        )
+
         with utils.disable_expire_on_commit(self.backend.get_session()) as session:
-            table = self.GROUP_NODE_CLASS.__table__
-            for node in nodes:
-                check_node(node)
-                clause = and_(table.c.dbnode_id == node.id, table.c.dbgroup_id == self.id)
-                statement = table.delete().where(clause)
-                session.execute(statement)
+            session.execute(statement.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id']))
+
+            if not session.in_nested_transaction():
+                session.commit()
+
+    def _delete_nodes(self, clause):
+        """Delete the nodes that match the given clause from the group.
+
+        :param clause: a clause on the ``dbnode_id`` column of the table of group memberships
+        """
+        from sqlalchemy import and_
+
+        table = self.GROUP_NODE_CLASS.__table__
+
+        with utils.disable_expire_on_commit(self.backend.get_session()) as session:
+            session.execute(table.delete().where(and_(table.c.dbgroup_id == self.id, clause)))
 
             if not session.in_nested_transaction():
                 session.commit()
@@ -293,6 +293,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
 
         self._flush_if_stored({'attributes'})
 
+    def batch_update(self):
+        return self.model.defer_flush()
+
     def clear_attributes(self):
         self.model.attributes = {}
         self._flush_if_stored({'attributes'})
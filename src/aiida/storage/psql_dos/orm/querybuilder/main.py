@@ -662,6 +662,10 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case((type_filter, casted_entity == value), else_=False)
+            if isinstance(value, str):
+                # The ``CASE`` expression cannot use an index, so also compare the text value directly, which is
+                # equivalent for strings and lets an expression index on the key be used, e.g. for the node hash.
+                expr = and_(casted_entity == value, expr)
         elif operator == '>':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case((type_filter, casted_entity > value), else_=False)
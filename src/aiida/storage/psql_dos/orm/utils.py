@@ -11,18 +11,27 @@
 import contextlib
 from typing import TYPE_CHECKING
 
-from sqlalchemy import inspect
+from sqlalchemy import event, inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
 from aiida.common import exceptions
+from aiida.orm.entities import EntityTypes
 
 if TYPE_CHECKING:
+    from aiida.orm.entity_cache import EntityCache
     from aiida.storage.psql_dos.backend import PsqlDosBackend
 
 IMMUTABLE_MODEL_FIELDS = {'id', 'pk', 'uuid', 'node_type'}
 
+# The tables of the entities that, when written, invalidate the entries of the entity cache that depend on them
+CACHED_ENTITY_TABLES = {
+    'db_dbauthinfo': EntityTypes.AUTHINFO,
+    'db_dbcomputer': EntityTypes.COMPUTER,
+    'db_dbuser': EntityTypes.USER,
+}
+
 
 class ModelWrapper:
     """Wrap an SQLA ORM model and AiiDA storage backend instance together,
@@ -57,6 +66,7 @@ class ModelWrapper:
         # Have to do it this way because we overwrite __setattr__
         object.__setattr__(self, '_model', model)
         object.__setattr__(self, '_backend', backend)
+        object.__setattr__(self, '_deferred_fields', None)
 
     @property
     def session(self) -> Session:
@@ -75,10 +85,15 @@ class ModelWrapper:
         # Python 3's implementation of copy.copy does not call __init__ on the new object
         # but manually restores attributes instead. Make sure we never get into a recursive
         # loop by protecting the special variables here
-        if item in ('_model', '_backend'):
+        if item in ('_model', '_backend', '_deferred_fields'):
             raise AttributeError()
 
-        if self.is_saved() and self._is_mutable_model_field(item) and not self._in_transaction():
+        if (
+            self.is_saved()
+            and self._is_mutable_model_field(item)
+            and not self._in_transaction()
+            and self._deferred_fields is None
+        ):
             self._ensure_model_uptodate(fields=(item,))
 
         return getattr(self._model, item)
@@ -113,6 +128,10 @@ class ModelWrapper:
 
         :raises `aiida.common.IntegrityError`: if a database integrity error is raised during the save.
         """
+        entity_type = CACHED_ENTITY_TABLES.get(self._model.__tablename__)
+        if entity_type is not None:
+            self._backend.entity_cache.invalidate(entity_type)
+
         try:
             self.session.add(self._model)
             if not self._in_transaction():
@@ -151,7 +170,35 @@ class ModelWrapper:
             for field in fields:
                 flag_modified(self._model, field)
 
-            self.save()
+            if self._deferred_fields is not None:
+                self._deferred_fields.update(fields)
+            else:
+                self.save()
+
+    @contextlib.contextmanager
+    def defer_flush(self):
+        """Context manager that defers flushing changed fields to the database until the context is exited.
+
+        Changed fields are marked as modified in the session straight away, but are only saved when the context is
+        exited, also if an exception is raised, such that all changes are written in a single statement. While in the
+        context, fields are not refreshed from the database when they are retrieved, as that would discard the changes
+        that are not yet saved. Note that the changes are flushed earlier if the session is flushed or committed in the
+        meantime, for example when another entity is stored. Contexts can be nested, in which case the changes are
+        saved when the outermost context is exited.
+        """
+        if self._deferred_fields is not None:
+            yield
+            return
+
+        object.__setattr__(self, '_deferred_fields', set())
+
+        try:
+            yield
+        finally:
+            fields = self._deferred_fields
+            object.__setattr__(self, '_deferred_fields', None)
+            if fields and self.is_saved():
+                self.save()
 
     def _ensure_model_uptodate(self, fields=None):
         """Refresh all fields of the wrapped model instance by fetching the current state of the database instance.
@@ -168,6 +215,21 @@ class ModelWrapper:
         return self.session.in_nested_transaction()
 
 
+def clear_entity_cache_on_detach(target, entity_cache: 'EntityCache') -> None:
+    """Clear the entity cache whenever instances are detached from a session of the target, e.g. when it is closed.
+
+    Cached entities wrap model instances of the session, that can no longer be used once they are detached from it.
+
+    :param target: the session, or session factory, whose sessions to listen to
+    :param entity_cache: the entity cache to clear
+    """
+
+    def clear(session, instance):
+        entity_cache.clear()
+
+    event.listen(target, 'persistent_to_detached', clear)
+
+
 @contextlib.contextmanager
 def disable_expire_on_commit(session):
     """Context manager that disables expire_on_commit and restores the original value on exit
@@ -28,16 +28,71 @@ class PsqlConfig(TypedDict, total=False):
     database_password: str
     database_name: str
 
+    database_pool_size: int
+    """The number of connections that are kept open in the connection pool of each process."""
+
+    database_max_overflow: int
+    """The number of connections that can be opened beyond the pool size, which are closed when returned."""
+
+    database_pool_pre_ping: bool
+    """Whether to test connections when they are taken from the pool, replacing them if they were closed."""
+
+    database_keepalives_idle: int | None
+    """The number of seconds of inactivity after which TCP keepalives are sent to the server, if set."""
+
+    database_statement_timeout: int | None
+    """The number of milliseconds after which statements are aborted by the server, if set."""
+
+    database_prepared_statements: bool
+    """Whether the driver prepares the statements that are executed repeatedly on the server."""
+
     engine_kwargs: dict[str, Any]
     """keyword argument that will be passed on to the SQLAlchemy engine."""
 
 
+def get_engine_kwargs(config: PsqlConfig) -> dict[str, Any]:
+    """Return the keyword arguments for ``sqlalchemy.create_engine`` that configure the pool and the connections.
+
+    The defaults are those of SQLAlchemy and ``psycopg``. The ``engine_kwargs`` of the configuration take precedence.
+    The pool size and overflow are only passed if the engine uses a ``QueuePool``, which is the default, since other
+    pools, e.g. the ``NullPool``, do not accept them.
+
+    :param config: the configuration to connect to the database.
+    """
+    from sqlalchemy.pool import QueuePool
+
+    connect_args: dict[str, Any] = {}
+
+    if config.get('database_keepalives_idle'):
+        connect_args['keepalives'] = 1
+        connect_args['keepalives_idle'] = config['database_keepalives_idle']
+
+    if config.get('database_statement_timeout'):
+        connect_args['options'] = f'-c statement_timeout={config["database_statement_timeout"]}'
+
+    if not config.get('database_prepared_statements', True):
+        # Required when connecting through a pooler in transaction mode, e.g. PgBouncer, that does not support them
+        connect_args['prepare_threshold'] = None
+
+    engine_kwargs = dict(config.get('engine_kwargs', {}))
+    engine_kwargs['connect_args'] = {**connect_args, **engine_kwargs.get('connect_args', {})}
+
+    kwargs: dict[str, Any] = {'pool_pre_ping': config.get('database_pool_pre_ping', False)}
+
+    poolclass = engine_kwargs.get('poolclass')
+    if 'pool' not in engine_kwargs and (poolclass is None or issubclass(poolclass, QueuePool)):
+        kwargs['pool_size'] = config.get('database_pool_size', 5)
+        kwargs['max_overflow'] = config.get('database_max_overflow', 10)
+
+    return {**kwargs, **engine_kwargs}
+
+
 def create_sqlalchemy_engine(config: PsqlConfig) -> Engine:
     """Create SQLAlchemy engine (to be used for QueryBuilder queries)
 
-    :param kwargs: keyword arguments that will be passed on to `sqlalchemy.create_engine`.
-        See https://docs.sqlalchemy.org/en/13/core/engines.html?highlight=create_engine#sqlalchemy.create_engine for
-        more info.
+    :param config: the configuration to connect to the database. The pool and connections are configured as described
+        by :func:`get_engine_kwargs`. See https://docs.sqlalchemy.org/en/20/core/engines.html#sqlalchemy.create_engine
+        for more info.
     """
     from urllib.parse import quote_plus
 
@@ -61,7 +116,7 @@ def create_sqlalchemy_engine(config: PsqlConfig) -> Engine:
         engine_url,
         json_serializer=json.dumps,
         json_deserializer=json.loads,
-        **config.get('engine_kwargs', {}),
+        **get_engine_kwargs(config),
     )
 
 
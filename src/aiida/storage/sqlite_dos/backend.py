@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import pathlib
+import tempfile
 from functools import cached_property, lru_cache
 from pathlib import Path
 from shutil import rmtree
@@ -20,7 +21,7 @@ from uuid import uuid4
 from alembic.config import Config
 from disk_objectstore import Container, backup_utils
 from pydantic import field_validator
-from sqlalchemy import insert, inspect, select
+from sqlalchemy import insert, inspect, select, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from aiida.common import exceptions
@@ -33,11 +34,11 @@ from aiida.storage.log import MIGRATE_LOGGER
 from aiida.storage.psql_dos.models.settings import DbSetting
 from aiida.storage.sqlite_zip import models, orm
 from aiida.storage.sqlite_zip.backend import validate_sqlite_version
-from aiida.storage.sqlite_zip.utils import create_sqla_engine
 
 from ..migrations import TEMPLATE_INVALID_SCHEMA_VERSION
 from ..psql_dos import PsqlDosBackend
 from ..psql_dos.migrator import PsqlDosMigrator
+from .utils import backup_database, create_sqla_engine
 
 if TYPE_CHECKING:
     from disk_objectstore import Container
@@ -56,6 +57,10 @@ ALEMBIC_REL_PATH = 'migrations'
 
 REPOSITORY_UUID_KEY = 'repository|uuid'
 
+SQL_CREATE_INDEX_NODE_HASH = (
+    "CREATE INDEX ix_db_dbnode_extras_aiida_hash ON db_dbnode (json_extract(extras, '$._aiida_hash'))"
+)
+
 
 class SqliteDosMigrator(PsqlDosMigrator):
     """Class for validating and migrating `sqlite_dos` storage instances.
@@ -97,6 +102,10 @@ class SqliteDosMigrator(PsqlDosMigrator):
         assert self._engine is not None
         models.SqliteBase.metadata.create_all(self._engine)
 
+        # The models are shared with the archive format, which does not need the index on the hash of nodes that is
+        # used to look up nodes to cache from, so it is created separately, identical to migration ``main_0003``.
+        self.connection.execute(text(SQL_CREATE_INDEX_NODE_HASH))
+
         repository_uuid = self.get_repository_uuid()
 
         # Create a "sync" between the database and repository, by saving its UUID in the settings table
@@ -215,6 +224,14 @@ class SqliteDosStorage(PsqlDosBackend):
             """Return the resolved and absolute filepath."""
             return str(Path(value).resolve().absolute())
 
+        serialize_writes: bool = MetadataField(
+            False,
+            title='Serialize writes with a file lock',
+            description='Whether processes, e.g. daemon workers, wait on a file lock for their turn to write to the '
+            'database, instead of retrying until it is unlocked. This can help when transactions are long and there '
+            'are many workers. Ignored on platforms without `fcntl`.',
+        )
+
     @property
     def filepath_root(self) -> Path:
         return Path(self.profile.storage_config['filepath'])
@@ -264,7 +281,9 @@ class SqliteDosStorage(PsqlDosBackend):
         Multi-thread support is currently required by the REST API.
         Although, in the future, we may want to move the multi-thread handling to higher in the AiiDA stack.
         """
-        engine = create_sqla_engine(self.filepath_database)
+        engine = create_sqla_engine(
+            self.filepath_database, serialize_writes=self.profile.storage_config.get('serialize_writes', False)
+        )
         self._session_factory = scoped_session(sessionmaker(bind=engine, future=True, expire_on_commit=True))
 
     def delete(self) -> None:  # type: ignore[override]
@@ -375,4 +394,7 @@ class SqliteDosStorage(PsqlDosBackend):
         manager.call_rsync(self.filepath_container, path, link_dest=prev_backup, dest_trailing_slash=True)
 
         LOGGER.report('Backing up sqlite database')
-        manager.call_rsync(self.filepath_database, path, link_dest=prev_backup, dest_trailing_slash=True)
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath_database = Path(dirpath) / FILENAME_DATABASE
+            backup_database(self.filepath_database, filepath_database)
+            manager.call_rsync(filepath_database, path, link_dest=prev_backup, dest_trailing_slash=True)
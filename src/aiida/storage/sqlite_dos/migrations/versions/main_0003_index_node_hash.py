@@ -0,0 +1,39 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add an index on the ``_aiida_hash`` key of the extras of ``DbNode``.
+
+The hash is used to look up nodes to cache from whenever a process is launched with caching enabled. Without the index,
+each lookup requires a full scan of the extras of all nodes.
+
+Revision ID: main_0003
+Revises: main_0002
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0003'
+down_revision = 'main_0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_extras_aiida_hash', 'db_dbnode', [sa.text("json_extract(extras, '$._aiida_hash')")], unique=False
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_extras_aiida_hash', table_name='db_dbnode')
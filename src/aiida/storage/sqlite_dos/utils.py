@@ -0,0 +1,221 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Utilities for this backend."""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, TextIO
+
+from sqlalchemy import event
+from sqlalchemy.future.engine import Engine
+
+from aiida.storage.sqlite_zip.utils import create_sqla_engine as create_sqla_engine_sqlite
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+SQLITE_PRAGMAS: dict[str, Any] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 30_000,
+    'mmap_size': 256 * 1024**2,
+}
+"""The pragmas that are set on each connection to the database.
+
+In WAL mode, readers do not block the writer and the writer does not block readers, such that multiple processes, e.g.
+daemon workers, can use the database concurrently. With ``synchronous=NORMAL`` the database is only synced to disk when
+the WAL is checkpointed instead of on each commit, which in WAL mode still guarantees the consistency of the database,
+but transactions committed just before a power loss may be rolled back. The ``busy_timeout`` is the time in milliseconds
+that a connection waits for another connection to finish writing, before failing with ``database is locked``.
+
+See: https://www.sqlite.org/pragma.html
+"""
+
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+"""The statements that require the write lock of the database, which is held until the end of the transaction."""
+
+
+def sqlite_set_pragmas(dbapi_connection, _):
+    """Set the pragmas defined by :data:`SQLITE_PRAGMAS`."""
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f'PRAGMA {name}={value};')
+    cursor.close()
+
+
+def create_sqla_engine(path: str | Path, *, serialize_writes: bool = False, **kwargs) -> Engine:
+    """Create a new engine instance for the database of a ``core.sqlite_dos`` storage.
+
+    :param path: the path of the database.
+    :param serialize_writes: whether to serialize the write transactions of all processes with a file lock, see
+        :class:`SerializedWritesConnection`. Ignored on platforms that do not support ``fcntl``.
+    """
+    if serialize_writes and fcntl is not None:
+        kwargs.setdefault('connect_args', {})['factory'] = SerializedWritesConnection
+
+    engine = create_sqla_engine_sqlite(path, **kwargs)
+    event.listen(engine, 'connect', sqlite_set_pragmas)
+    return engine
+
+
+def backup_database(filepath: str | Path, destination: str | Path) -> None:
+    """Copy the database with the online backup API of SQLite.
+
+    Unlike copying the database file, this gives a consistent copy, that includes the transactions that are committed to
+    the WAL but not yet written to the database file, even if other processes, e.g. daemon workers, keep writing.
+
+    :param filepath: the path of the database.
+    :param destination: the path of the copy, which is overwritten if it exists.
+    """
+    with contextlib.closing(sqlite3.connect(filepath)) as source:
+        with contextlib.closing(sqlite3.connect(destination)) as target:
+            source.backup(target)
+
+
+class WriteLock:
+    """Exclusive lock on a file that is shared by all processes, e.g. daemon workers, that write to a database.
+
+    Each instance opens its own file description, such that the lock is also exclusive between instances, and therefore
+    between the connections of different threads, of the same process.
+    """
+
+    def __init__(self, filepath: str | Path, timeout: float):
+        """Construct a new instance.
+
+        :param filepath: the path of the lock file, which is created if it does not exist.
+        :param timeout: the time in seconds to wait for the lock, after which :meth:`acquire` gives up.
+        """
+        self._filepath = Path(filepath)
+        self._timeout = timeout
+        self._handle: TextIO | None = None
+        self._is_locked = False
+
+    @property
+    def is_locked(self) -> bool:
+        """Return whether this instance holds the lock."""
+        return self._is_locked
+
+    def acquire(self) -> bool:
+        """Acquire the lock, waiting until it is released by its current holder or the timeout is reached.
+
+        :return: whether the lock was acquired.
+        """
+        if self._is_locked:
+            return True
+
+        if self._handle is None:
+            self._handle = self._filepath.open('a')
+
+        deadline = time.monotonic() + self._timeout
+        interval = 0.0001
+
+        while True:
+            try:
+                fcntl.flock(self._handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    return False
+                time.sleep(interval)
+                interval = min(interval * 2, 0.005)
+            else:
+                self._is_locked = True
+                return True
+
+    def release(self) -> None:
+        """Release the lock if it is held by this instance."""
+        if self._is_locked and self._handle is not None:
+            fcntl.flock(self._handle, fcntl.LOCK_UN)
+            self._is_locked = False
+
+    def close(self) -> None:
+        """Release the lock and close the lock file."""
+        self.release()
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class SerializedWritesConnection(sqlite3.Connection):
+    """Connection that serializes its write transactions with those of all other processes through a :class:`WriteLock`.
+
+    SQLite only allows a single connection to write at a time. By default, a connection that wants to write while
+    another one holds the write lock of the database retries with sleeps of up to 100 ms, until the busy timeout is
+    reached. With many concurrent writers, such as the workers of a daemon, this causes long stalls and writers that are
+    unlucky can fail with ``database is locked``. This connection instead waits for a file lock, that is next to the
+    database, before the first write of a transaction and releases it when the transaction is committed or rolled back,
+    such that waiting writers proceed as soon as the database is available.
+
+    If the file lock is not acquired within the busy timeout, the write proceeds without it and the busy timeout of the
+    database applies as usual.
+    """
+
+    def __init__(self, database, *args, **kwargs):
+        super().__init__(database, *args, **kwargs)
+        self._write_lock = WriteLock(f'{database}.lock', timeout=SQLITE_PRAGMAS['busy_timeout'] / 1000)
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or SerializedWritesCursor)
+
+    def acquire_write_lock(self, sql: str) -> None:
+        """Acquire the write lock if the statement is the first write of a transaction.
+
+        :param sql: the statement that is about to be executed.
+        """
+        if not self._write_lock.is_locked and sql.lstrip()[:7].upper().startswith(WRITE_STATEMENTS):
+            self._write_lock.acquire()
+
+    def release_write_lock(self) -> None:
+        """Release the write lock if no transaction is open anymore."""
+        if not self.in_transaction:
+            self._write_lock.release()
+
+    def commit(self):
+        try:
+            super().commit()
+        finally:
+            self.release_write_lock()
+
+    def rollback(self):
+        try:
+            super().rollback()
+        finally:
+            self.release_write_lock()
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._write_lock.close()
+
+
+class SerializedWritesCursor(sqlite3.Cursor):
+    """Cursor of a :class:`SerializedWritesConnection` that acquires its write lock before executing a write."""
+
+    connection: SerializedWritesConnection
+
+    def execute(self, sql, parameters=(), /):
+        self.connection.acquire_write_lock(sql)
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection.release_write_lock()
+
+    def executemany(self, sql, seq_of_parameters, /):
+        self.connection.acquire_write_lock(sql)
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.connection.release_write_lock()
@@ -29,6 +29,7 @@ from aiida.manage.configuration import Profile
 from aiida.orm.entities import EntityTypes
 from aiida.orm.implementation import BackendEntity, StorageBackend
 from aiida.repository.backend.sandbox import SandboxRepositoryBackend
+from aiida.storage.psql_dos.orm.utils import clear_entity_cache_on_detach
 from aiida.storage.sqlite_zip import models, orm
 from aiida.storage.sqlite_zip.migrator import get_schema_version_head
 from aiida.storage.sqlite_zip.utils import create_sqla_engine
@@ -140,6 +141,7 @@ class SqliteTempBackend(StorageBackend):
             engine = create_sqla_engine(':memory:', echo=self.profile.storage_config.get('debug', False))
             models.SqliteBase.metadata.create_all(engine)
             self._session = Session(engine, future=True)
+            clear_entity_cache_on_detach(self._session, self.entity_cache)
             self._session.add(models.DbUser(email=self.profile.default_user_email or 'user@email.com'))  # type: ignore[operator]
             self._session.commit()
         return self._session
@@ -284,6 +286,7 @@ class SqliteTempBackend(StorageBackend):
         session = self.get_session()
         with nullcontext() if self.in_transaction else self.transaction():
             session.execute(update(mapper), rows)
+        self.entity_cache.invalidate(entity_type)
 
     def delete(self) -> None:
         """Delete the storage and all the data."""
@@ -39,6 +39,7 @@ from aiida.manage import Profile
 from aiida.orm.entities import EntityTypes
 from aiida.orm.implementation import StorageBackend
 from aiida.repository.backend.abstract import AbstractRepositoryBackend, InfoDictType
+from aiida.storage.psql_dos.orm.utils import clear_entity_cache_on_detach
 
 from . import orm
 from .utils import (
@@ -259,6 +260,7 @@ class SqliteZipBackend(StorageBackend):
                 if not db_file.exists():
                     raise CorruptStorage(f'database could not be read: non-existent {db_file}')
             self._session = Session(create_sqla_engine(db_file), future=True)
+            clear_entity_cache_on_detach(self._session, self.entity_cache)
         return self._session
 
     def get_repository(self) -> _RoBackendRepository:
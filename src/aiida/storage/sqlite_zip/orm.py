@@ -17,7 +17,7 @@ import json
 from functools import singledispatch
 from typing import Any
 
-from sqlalchemy import JSON, case, func, select
+from sqlalchemy import JSON, and_, case, func, literal, select
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql import ColumnElement, null
 
@@ -248,7 +248,14 @@ class SqliteQueryBuilder(SqlaQueryBuilder):
             if isinstance(value, (list, dict)):
                 return case((type_filter, casted_entity == func.json(json.dumps(value))), else_=False)
             # to-do not working for dict
-            return case((type_filter, casted_entity == value), else_=False)
+            expr = case((type_filter, casted_entity == value), else_=False)
+            if isinstance(value, str) and all(key.isidentifier() for key in attr_key):
+                # The ``CASE`` expression cannot use an index, so also compare the extracted value directly, which is
+                # equivalent for strings. The path is rendered inline, since SQLite only uses an expression index on
+                # the key, e.g. for the node hash, if the expression in the query is identical, including constants.
+                path = literal('$.' + '.'.join(attr_key), literal_execute=True)
+                return and_(func.json_extract(column, path) == value, expr)
+            return expr
         if operator == '>':
             type_filter, casted_entity = _cast_json_type(database_entity, value)
             return case((type_filter, casted_entity > value), else_=False)
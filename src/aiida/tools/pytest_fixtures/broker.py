@@ -58,7 +58,15 @@ def run_aiida_broker_service_for_profile() -> t.Callable[..., t.ContextManager[Z
         broker._service_dir.mkdir(exist_ok=False)
 
         process = subprocess.Popen(
-            [sys.executable, '-m', 'aiida.brokers.zeromq.service', '--service-dir', str(broker._service_dir)],
+            [
+                sys.executable,
+                '-m',
+                'aiida.brokers.zeromq.service',
+                '--service-dir',
+                str(broker._service_dir),
+                '--queue-engine',
+                broker.queue_engine,
+            ],
             start_new_session=True,
             stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
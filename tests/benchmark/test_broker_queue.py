@@ -0,0 +1,85 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for the persistent task queue engines of the ZeroMQ broker.
+
+The purpose of these tests is to compare the folder-per-task layout with the append-only segment log, both for the
+throughput of the ``push/pop/ack`` cycle and for the time it takes to recover the queue when the broker restarts.
+"""
+
+import shutil
+import uuid
+
+import pytest
+
+from aiida.brokers.zeromq.queue import QUEUE_ENGINES, open_task_queue
+
+GROUP_NAME = 'zeromq-queue'
+NUM_TASKS = 2_000
+
+
+def get_task(index):
+    """Return a task resembling a process continuation task."""
+    return {
+        'id': uuid.uuid4().hex,
+        'sender': 'client-benchmark',
+        'body': f'args:\n  nowait: true\n  pid: {index}\n  tag: null\ntask: continue\n',
+        'no_reply': True,
+    }
+
+
+@pytest.mark.parametrize('engine', QUEUE_ENGINES)
+@pytest.mark.benchmark(group=f'{GROUP_NAME}-throughput')
+def test_throughput(benchmark, tmp_path, engine):
+    """Benchmark pushing, popping and acknowledging a batch of tasks."""
+    tasks = [(uuid.uuid4().hex, get_task(index)) for index in range(NUM_TASKS)]
+    queue_path = tmp_path / 'tasks'
+
+    def _setup():
+        shutil.rmtree(queue_path, ignore_errors=True)
+        return (open_task_queue(queue_path, engine),), {}
+
+    def _run(queue):
+        for task_id, task in tasks:
+            queue.push(task_id, task)
+        while (result := queue.pop()) is not None:
+            queue.ack(result[0])
+        queue.close()
+        return queue
+
+    queue = benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=5, warmup_rounds=1)
+    assert queue.is_empty()
+
+
+@pytest.mark.parametrize('engine', QUEUE_ENGINES)
+@pytest.mark.benchmark(group=f'{GROUP_NAME}-recovery')
+def test_restart_recovery(benchmark, tmp_path, engine):
+    """Benchmark reopening a queue with pending and unacknowledged tasks, as after a broker crash."""
+    queue_path = tmp_path / 'tasks'
+    queue = open_task_queue(queue_path, engine)
+    for index in range(NUM_TASKS):
+        queue.push(uuid.uuid4().hex, get_task(index))
+    for _ in range(NUM_TASKS // 10):
+        queue.pop()
+    queue.sync()
+
+    # The queues are only closed after the benchmark, because closing snapshots the index, which would speed up the
+    # recovery of the following rounds.
+    queues = [queue]
+
+    def _run():
+        recovered = open_task_queue(queue_path, engine)
+        queues.append(recovered)
+        return recovered
+
+    try:
+        recovered = benchmark.pedantic(_run, iterations=1, rounds=10, warmup_rounds=1)
+        assert recovered.size() == NUM_TASKS
+    finally:
+        for queue in queues:
+            queue.close()
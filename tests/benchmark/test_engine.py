@@ -12,10 +12,18 @@ The purpose of these tests is to benchmark and compare processes,
 which are executed *via* both a local runner and the daemon.
 """
 
-import pytest
+import contextlib
+import uuid
 
-from aiida.engine import WorkChain, run_get_node, while_
-from aiida.orm import InstalledCode, Int
+import pytest
+from sqlalchemy import event, text
+
+from aiida.engine import Process, WorkChain, calcfunction, run_get_node, while_
+from aiida.manage import get_manager
+from aiida.manage.caching import enable_caching
+from aiida.orm import CalcFunctionNode, InstalledCode, Int
+from aiida.orm.entities import EntityTypes
+from aiida.orm.nodes.attributes import NodeAttributes
 from aiida.plugins.factories import CalculationFactory
 
 ArithmeticAddCalculation = CalculationFactory('core.arithmetic.add')
@@ -144,3 +152,106 @@ def test_workchain_daemon(benchmark, submit_and_await, aiida_localhost, workchai
 
     assert result.is_finished_ok, (result.exit_status, result.exit_message)
     assert len(result.base.links.get_outgoing().all()) == outgoing
+
+
+@pytest.mark.parametrize('batched', (False, True), ids=('unbatched', 'batched'))
+@pytest.mark.benchmark(group='engine-statements')
+def test_workchain_node_updates(benchmark, monkeypatch, batched):
+    """Benchmark a Workchain in the local runner and report the number of node UPDATE statements per process step.
+
+    A process step is an entered state of the process. Without batching, each attribute that is changed during a state
+    transition is written with a separate statement.
+    """
+    if not batched:
+        monkeypatch.setattr(NodeAttributes, 'batch_update', lambda self: contextlib.nullcontext())
+
+    engine = get_manager().get_profile_storage().get_session().bind
+    counts = {'statements': 0, 'steps': 0}
+    on_entered = Process.on_entered
+
+    def count_statements(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith('UPDATE DB_DBNODE'):
+            counts['statements'] += 1
+
+    def count_steps(self, from_state):
+        counts['steps'] += 1
+        return on_entered(self, from_state)
+
+    def _run():
+        return run_get_node(WorkchainLoop, iterations=Int(4))
+
+    monkeypatch.setattr(Process, 'on_entered', count_steps)
+    event.listen(engine, 'before_cursor_execute', count_statements)
+
+    try:
+        result = benchmark.pedantic(_run, iterations=1, rounds=10, warmup_rounds=1)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statements)
+
+    assert result.node.is_finished_ok, (result.node.exit_status, result.node.exit_message)
+    benchmark.extra_info['node_updates_per_step'] = counts['statements'] / counts['steps']
+
+
+@calcfunction
+def add(x, y):
+    return x + y
+
+
+@pytest.fixture
+def synthetic_database(request):
+    """Fill the database with nodes that have a hash, to emulate looking up a node to cache from in a large database.
+
+    The fixture is parametrized with whether the index on the hash of nodes is present.
+    """
+    from aiida.storage.psql_dos.models.node import DbNode
+    from aiida.storage.sqlite_dos.backend import SQL_CREATE_INDEX_NODE_HASH, SqliteDosStorage
+
+    storage = get_manager().get_profile_storage()
+    rows = [
+        {
+            'node_type': CalcFunctionNode._plugin_type_string,
+            'user_id': storage.default_user.pk,
+            'extras': {'_aiida_hash': uuid.uuid4().hex},
+        }
+        for _ in range(50_000)
+    ]
+    pks = storage.bulk_insert(EntityTypes.NODE, rows, allow_defaults=True)
+    session = storage.get_session()
+
+    if not request.param:
+        session.execute(text('DROP INDEX ix_db_dbnode_extras_aiida_hash'))
+        session.commit()
+
+    try:
+        yield
+    finally:
+        if not request.param:
+            if isinstance(storage, SqliteDosStorage):
+                session.execute(text(SQL_CREATE_INDEX_NODE_HASH))
+            else:
+                index = next(index for index in DbNode.__table__.indexes if index.name.endswith('_aiida_hash'))
+                index.create(session.connection())
+            session.commit()
+
+        with storage.transaction():
+            storage.delete_nodes_and_connections(pks)
+
+
+@pytest.mark.parametrize('synthetic_database', (False, True), ids=('unindexed', 'indexed'), indirect=True)
+@pytest.mark.usefixtures('synthetic_database')
+@pytest.mark.benchmark(group='engine-caching')
+def test_calcfunction_caching(benchmark):
+    """Benchmark launching a calcfunction with caching enabled in a database with many nodes that have a hash.
+
+    When a process is launched with caching enabled, nodes with the same hash are looked up to cache from, which
+    requires a scan of the extras of all nodes of the same type unless there is an index on the hash.
+    """
+    run_get_node(add, x=Int(1), y=Int(2))
+
+    def _run():
+        with enable_caching():
+            return run_get_node(add, x=Int(1), y=Int(2))
+
+    result = benchmark.pedantic(_run, iterations=1, rounds=20, warmup_rounds=1)
+
+    assert result.node.base.caching.is_created_from_cache
@@ -0,0 +1,129 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for concurrent writes to the database of the ``core.sqlite_dos`` storage.
+
+The purpose of these tests is to measure how many process steps per second multiple daemon workers can write to the same
+SQLite database concurrently, comparing the rollback journal that was used originally with the WAL mode, with and
+without serializing the writes with a file lock. Each process step is a transaction that reads a process node, updates
+its attributes and adds a log record, like the engine does when a process transitions to another state.
+"""
+
+import multiprocessing
+import time
+import uuid
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from aiida.common import timezone
+from aiida.storage.sqlite_dos import utils
+from aiida.storage.sqlite_zip import models
+
+GROUP_NAME = 'sqlite-dos-concurrency'
+NUM_WORKERS = 4
+NUM_NODES = 100
+NUM_STEPS = 250
+
+STRATEGIES = {
+    'rollback-journal': ({'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 5000}, False),
+    'wal': ({}, False),
+    'wal-serialized': ({}, True),
+}
+
+
+def run_worker(filepath, pragmas, serialize_writes, worker):
+    """Run the process steps of a single worker, each in a separate transaction."""
+    utils.SQLITE_PRAGMAS.update(pragmas)
+    engine = utils.create_sqla_engine(filepath, serialize_writes=serialize_writes)
+
+    with engine.connect() as connection:
+        for step in range(NUM_STEPS):
+            pk = (worker * NUM_STEPS + step) % NUM_NODES + 1
+            attributes = connection.execute(select(models.DbNode.attributes).where(models.DbNode.id == pk)).scalar_one()
+            attributes = {**attributes, 'process_state': 'running', 'step': step}
+            connection.execute(
+                update(models.DbNode).where(models.DbNode.id == pk).values(attributes=attributes, mtime=timezone.now())
+            )
+            connection.execute(
+                insert(models.DbLog).values(
+                    uuid=str(uuid.uuid4()),
+                    time=timezone.now(),
+                    loggername='aiida.orm.nodes.process.process.ProcessNode',
+                    levelname='REPORT',
+                    dbnode_id=pk,
+                    message=f'step {step} of worker {worker}',
+                    metadata={},
+                )
+            )
+            connection.commit()
+
+    engine.dispose()
+
+
+def create_database(filepath):
+    """Create a database with the schema of the storage, containing a user and process nodes."""
+    engine = utils.create_sqla_engine(filepath)
+    models.SqliteBase.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(models.DbUser).values(id=1, email='user@aiida.net'))
+        connection.execute(
+            insert(models.DbNode),
+            [
+                {
+                    'uuid': str(uuid.uuid4()),
+                    'node_type': 'process.workflow.workchain.WorkChainNode.',
+                    'ctime': timezone.now(),
+                    'mtime': timezone.now(),
+                    'attributes': {},
+                    'extras': {},
+                    'repository_metadata': {},
+                    'user_id': 1,
+                }
+                for _ in range(NUM_NODES)
+            ],
+        )
+
+    engine.dispose()
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_process_steps(benchmark, tmp_path, strategy):
+    """Benchmark the process steps of multiple workers writing to the same database concurrently."""
+    pragmas, serialize_writes = STRATEGIES[strategy]
+    context = multiprocessing.get_context('fork')
+
+    def _setup():
+        filepath = tmp_path / f'{uuid.uuid4().hex}.sqlite'
+        create_database(filepath)
+        return (filepath,), {}
+
+    def _run(filepath):
+        workers = [
+            context.Process(target=run_worker, args=(filepath, pragmas, serialize_writes, worker))
+            for worker in range(NUM_WORKERS)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        benchmark.extra_info['steps_per_second'] = NUM_WORKERS * NUM_STEPS / (time.perf_counter() - start)
+        return filepath, [worker.exitcode for worker in workers]
+
+    filepath, exitcodes = benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=3)
+    assert exitcodes == [0] * NUM_WORKERS
+
+    engine = utils.create_sqla_engine(filepath)
+    with engine.connect() as connection:
+        assert (
+            connection.execute(select(func.count()).select_from(models.DbLog)).scalar_one() == NUM_WORKERS * NUM_STEPS
+        )
+    engine.dispose()
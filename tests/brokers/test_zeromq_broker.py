@@ -43,6 +43,7 @@ def zeromq_broker(tmp_path):
     profile = MagicMock()
     profile.name = 'test-profile'
     profile.process_control_backend = 'core.zeromq'
+    profile.process_control_config = ZeromqBroker.get_default_config()
 
     config = get_config()
     original_filepaths = config.filepaths
@@ -61,7 +62,7 @@ def zeromq_broker(tmp_path):
 
 def test_get_default_config():
     """Test that the default broker settings declare the service as managed by the daemon."""
-    assert ZeromqBroker.get_default_config() == {'supervised_by_daemon': True}
+    assert ZeromqBroker.get_default_config() == {'supervised_by_daemon': True, 'queue_engine': 'folder'}
 
 
 def test_init_invalid_backend():
@@ -164,7 +165,9 @@ class TestZeromqBrokerCommunicator:
 
             assert result is communicator
             sleep.assert_called_once_with(0.2)
-            communicator_cls.assert_called_once_with(router_endpoint=endpoint, task_timeout=None)
+            communicator_cls.assert_called_once_with(
+                router_endpoint=endpoint, task_timeout=None, task_prefetch_count=None
+            )
             communicator.start.assert_called_once()
 
     def test_get_communicator_warns_while_waiting_for_endpoint(self, zeromq_broker, monkeypatch):
@@ -189,7 +192,9 @@ class TestZeromqBrokerCommunicator:
             assert result is communicator
             assert sleep.call_count == 2
             warning.assert_called_once_with('Still waiting for broker to become ready...')
-            communicator_cls.assert_called_once_with(router_endpoint=endpoint, task_timeout=None)
+            communicator_cls.assert_called_once_with(
+                router_endpoint=endpoint, task_timeout=None, task_prefetch_count=None
+            )
             communicator.start.assert_called_once()
 
     def test_get_communicator(self, aiida_broker, monkeypatch):
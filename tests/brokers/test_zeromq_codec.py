@@ -0,0 +1,151 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the envelope and payload frames of the ZeroMQ protocol."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiida.brokers.zeromq.broker import ZeromqIncomingTask
+from aiida.brokers.zeromq.protocol import (
+    CODECS,
+    MessageType,
+    Payload,
+    decode_frames,
+    encode_frames,
+    encode_message,
+    get_codec,
+)
+from aiida.brokers.zeromq.server import ZeromqBrokerServer
+
+BODY = {'task': 'continue', 'args': {'pid': 10, 'nowait': True, 'tag': None}}
+
+
+@pytest.fixture(params=tuple(CODECS))
+def codec(request):
+    """Return each available codec."""
+    return get_codec(request.param)
+
+
+def get_task_message(body=BODY):
+    return {'type': MessageType.TASK.value, 'id': 'task-1', 'sender': 'client-a', 'body': body, 'no_reply': True}
+
+
+@pytest.mark.presto
+def test_roundtrip(codec):
+    """Test that the body is sent in a separate payload frame and restored on decoding."""
+    frames = encode_frames(get_task_message(), codec)
+    assert len(frames) == 2
+
+    msg, detected = decode_frames(frames)
+    assert detected is codec
+    assert msg == get_task_message()
+
+
+@pytest.mark.presto
+def test_roundtrip_uuid(codec):
+    """Test that UUIDs are serialized as strings."""
+    identifier = uuid.uuid4()
+    msg, _ = decode_frames(encode_frames(get_task_message({'pid': identifier}), codec))
+    assert msg['body'] == {'pid': str(identifier)}
+
+
+@pytest.mark.presto
+def test_none_payload_stays_in_envelope(codec):
+    """Test that a message without payload is a single frame."""
+    frames = encode_frames(get_task_message(None), codec)
+    assert len(frames) == 1
+    assert decode_frames(frames)[0]['body'] is None
+
+
+@pytest.mark.presto
+def test_decode_legacy_single_frame():
+    """Test that single-frame JSON messages with an inline body are still accepted."""
+    msg, codec = decode_frames([encode_message(get_task_message())])
+    assert codec.name == 'json'
+    assert msg == get_task_message()
+
+
+@pytest.mark.presto
+def test_opaque_payload_is_forwarded(codec):
+    """Test that an opaque payload is forwarded as the same frame if the codec matches."""
+    frames = encode_frames(get_task_message(), codec)
+    msg, _ = decode_frames(frames, decode_payload=False)
+    assert isinstance(msg['body'], Payload)
+
+    forwarded = encode_frames(msg, codec)
+    assert forwarded[1] is frames[1]
+
+
+@pytest.mark.presto
+def test_opaque_payload_is_transcoded():
+    """Test that an opaque payload is transcoded if the recipient uses another codec."""
+    pytest.importorskip('msgpack')
+    msg, _ = decode_frames(encode_frames(get_task_message(), get_codec('msgpack')), decode_payload=False)
+
+    forwarded = encode_frames(msg, get_codec('json'))
+    assert decode_frames(forwarded) == (get_task_message(), get_codec('json'))
+
+
+@pytest.mark.presto
+def test_payload_to_dict(codec):
+    """Test the JSON-serializable representation of a payload used by the task queue."""
+    payload = Payload(codec.name, codec.encode(BODY))
+    assert Payload.from_dict(payload.to_dict()) == payload
+    assert Payload.from_dict(payload.to_dict()).decode() == BODY
+
+
+@pytest.mark.presto
+def test_get_codec_invalid():
+    """Test that requesting an unknown codec raises."""
+    with pytest.raises(ValueError, match='codec `invalid` is not available'):
+        get_codec('invalid')
+
+
+@pytest.mark.presto
+def test_get_codec_msgpack_not_installed(monkeypatch):
+    """Test that requesting the ``msgpack`` codec without the package installed points to the optional extra."""
+    monkeypatch.setattr('aiida.brokers.zeromq.protocol.CODECS', {'json': get_codec('json')})
+    with pytest.raises(ValueError, match=r'pip install aiida-core\[msgpack\]'):
+        get_codec('msgpack')
+
+
+@pytest.mark.presto
+def test_server_queues_payload_without_decoding(tmp_path, codec):
+    """Test that the server persists the encoded payload and the worker receives the original body."""
+    server = ZeromqBrokerServer(tmp_path / 'storage', tmp_path / 'sockets')
+    msg, _ = decode_frames(encode_frames(get_task_message(), codec), decode_payload=False)
+    server._handle_task(b'client', msg)
+
+    [(task_id, task_data)] = server.get_pending_tasks()
+    assert 'body' not in task_data
+    assert task_data['payload']['codec'] == codec.name
+
+    task = ZeromqIncomingTask(task_id, task_data, MagicMock())
+    assert task.body == BODY
+
+
+@pytest.mark.presto
+def test_server_replies_in_client_codec(tmp_path, codec):
+    """Test that the server encodes messages with the codec last used by the recipient."""
+    server = ZeromqBrokerServer(tmp_path / 'storage', tmp_path / 'sockets')
+    server._router = MagicMock()
+    server._client_codecs[b'worker'] = codec.name
+
+    encoded: dict = {}
+    server._send_to_client(b'worker', get_task_message(), encoded)
+    server._send_to_client(b'worker', get_task_message(), encoded)
+
+    assert list(encoded) == [codec.name]
+    frames = server._router.send_multipart.call_args[0][0]
+    assert frames[:2] == [b'worker', b'']
+    assert decode_frames(frames[2:]) == (get_task_message(), codec)
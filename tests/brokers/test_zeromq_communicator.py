@@ -10,7 +10,9 @@
 
 from __future__ import annotations
 
+import re
 import time
+import uuid
 from concurrent.futures import Future
 from pathlib import Path
 
@@ -18,7 +20,7 @@ import kiwipy
 import pytest
 
 from aiida.brokers.zeromq.broker import ZeromqBroker
-from aiida.brokers.zeromq.communicator import ZeromqCommunicator
+from aiida.brokers.zeromq.communicator import ZeromqCommunicator, get_broadcast_filter_spec
 
 
 @pytest.fixture(scope='module')
@@ -202,6 +204,23 @@ class TestZeromqCommunicatorRoundTrip:
         assert len(received) >= 1
         assert received[0] == ('ping', 'test.ping')
 
+    def test_broadcast_filtered_by_broker(self, sender_and_worker):
+        """Test that the broker only forwards broadcasts that match the filters of a subscriber."""
+        sender, worker = sender_and_worker
+        received = []
+
+        def on_broadcast(comm, body, bsender, subject, cid):
+            received.append(subject)
+
+        worker.add_broadcast_subscriber(kiwipy.BroadcastFilter(on_broadcast, subject='test.keep.*'), 'listener')
+        time.sleep(0.5)
+
+        sender.broadcast_send(body=None, subject='test.drop')
+        sender.broadcast_send(body=None, subject='test.keep.me')
+        time.sleep(1.0)
+
+        assert received == ['test.keep.me']
+
     def test_task_with_deferred_future(self, sender_and_worker):
         """Test task send with deferred handler gets immediate zeromq_broker ack."""
         sender, worker = sender_and_worker
@@ -248,3 +267,29 @@ class TestZeromqCommunicatorRoundTrip:
         future = sender.rpc_send('error-svc', 'test')
         with pytest.raises(Exception, match='handler error'):
             future.result(timeout=5.0)
+
+
+@pytest.mark.parametrize(
+    ('subscriber', 'expected'),
+    (
+        (lambda c, b, s, subj, cid: None, None),
+        (kiwipy.BroadcastFilter(print), {}),
+        (kiwipy.BroadcastFilter(print, sender=10), {'sender': [{'value': 10}]}),
+        (
+            kiwipy.BroadcastFilter(print, subject='state_changed.*'),
+            {'subject': [{'regex': 'state_changed[.].*', 'flags': re.UNICODE}]},
+        ),
+        (kiwipy.BroadcastFilter(print, sender=uuid.uuid4()), None),
+    ),
+)
+def test_get_broadcast_filter_spec(subscriber, expected):
+    """Test the filter specification that is registered with the broker for a broadcast subscriber."""
+    assert get_broadcast_filter_spec(subscriber) == expected
+
+
+def test_get_broadcast_filter_spec_loop_communicator():
+    """Test that the filter of a subscriber wrapped by ``plumpy.LoopCommunicator`` is found."""
+    from plumpy.communications import convert_to_comm
+
+    subscriber = convert_to_comm(kiwipy.BroadcastFilter(print, sender=10))
+    assert get_broadcast_filter_spec(subscriber) == {'sender': [{'value': 10}]}
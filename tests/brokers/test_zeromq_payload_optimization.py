@@ -23,6 +23,7 @@ import pytest
 from aiida.brokers.zeromq.protocol import (
     MessageType,
     _UUIDEncoder,
+    decode_frames,
     decode_message,
     encode_message,
 )
@@ -129,9 +130,7 @@ class TestCommunicatorPayloadEncoding:
 
         call_args = comm._dealer.send_multipart.call_args
         frames = call_args[0][0]
-        encoded_msg = frames[1]
-
-        decoded_msg = json.loads(encoded_msg.decode('utf-8'))
+        decoded_msg, _ = decode_frames(frames[1:])
 
         # Body should remain a dict (JSON-native), not a pre-encoded string
         assert isinstance(decoded_msg['body'], dict)
@@ -157,9 +156,7 @@ class TestCommunicatorPayloadEncoding:
 
         call_args = comm._dealer.send_multipart.call_args
         frames = call_args[0][0]
-        encoded_msg = frames[1]
-
-        decoded_msg = json.loads(encoded_msg.decode('utf-8'))
+        decoded_msg, _ = decode_frames(frames[1:])
 
         # Result should remain a dict, not a pre-encoded string
         assert isinstance(decoded_msg['result'], dict)
@@ -184,9 +181,7 @@ class TestCommunicatorPayloadEncoding:
 
         call_args = comm._dealer.send_multipart.call_args
         frames = call_args[0][0]
-        encoded_msg = frames[1]
-
-        decoded_msg = json.loads(encoded_msg.decode('utf-8'))
+        decoded_msg, _ = decode_frames(frames[1:])
         assert decoded_msg['body'] is None
 
     def test_dispatch_passes_body_directly(self):
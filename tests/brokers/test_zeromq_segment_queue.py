@@ -0,0 +1,159 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for ``aiida.brokers.zeromq.segment_queue.SegmentLogQueue``."""
+
+from __future__ import annotations
+
+import pytest
+
+from aiida.brokers.zeromq.queue import PersistentQueue, open_task_queue
+from aiida.brokers.zeromq.segment_queue import SegmentLogQueue
+
+
+class TestSegmentLogQueue:
+    """Tests for the SegmentLogQueue."""
+
+    def test_push_pop_ack(self, tmp_path):
+        """Test the basic task lifecycle."""
+        queue = SegmentLogQueue(tmp_path)
+        queue.push('t1', {'data': 'hello'})
+        queue.push('t2', {'data': 'world'})
+
+        assert queue.size() == 2
+        assert queue.pop() == ('t1', {'data': 'hello'})
+        assert queue.processing_count() == 1
+        assert queue.ack('t1') is True
+        assert queue.ack('t1') is False
+        assert queue.pop() == ('t2', {'data': 'world'})
+        assert queue.pop() is None
+
+    def test_nack(self, tmp_path):
+        """Test requeueing puts the task at the front, discarding drops it."""
+        queue = SegmentLogQueue(tmp_path)
+        queue.push('t1', {'a': 1})
+        queue.push('t2', {'b': 2})
+
+        queue.pop()
+        assert queue.nack('t1', requeue=True) is True
+        assert queue.peek() == ('t1', {'a': 1})
+
+        queue.pop()
+        assert queue.nack('t1', requeue=False) is True
+        assert queue.nack('nonexistent') is False
+        assert [task_id for task_id, _ in queue.get_all_pending()] == ['t2']
+
+    def test_crash_recovery(self, tmp_path):
+        """Test that unacknowledged tasks are pending again in their original order after a restart."""
+        queue = SegmentLogQueue(tmp_path)
+        for index in range(5):
+            queue.push(f't{index}', {'index': index})
+        queue.pop()
+        queue.pop()
+        queue.ack('t0')
+        queue.remove_pending('t3')
+
+        # No ``close`` call, so recovery replays the log without an index snapshot
+        recovered = SegmentLogQueue(tmp_path)
+        assert [task_id for task_id, _ in recovered.get_all_pending()] == ['t1', 't2', 't4']
+
+    def test_recovery_from_index(self, tmp_path):
+        """Test that records appended after the index snapshot are replayed on top of it."""
+        queue = SegmentLogQueue(tmp_path)
+        queue.push('t1', {'a': 1})
+        queue.close()
+        queue.push('t2', {'b': 2})
+        queue.pop()
+        queue.ack('t1')
+
+        recovered = SegmentLogQueue(tmp_path)
+        assert recovered.get_all_pending() == [('t2', {'b': 2})]
+
+    def test_torn_write_is_truncated(self, tmp_path):
+        """Test that a partially written record at the end of the log is discarded."""
+        queue = SegmentLogQueue(tmp_path)
+        queue.push('t1', {'a': 1})
+        queue.push('t2', {'b': 2})
+        queue.sync()
+
+        segment = next((tmp_path / 'segments').glob('*.log'))
+        size = segment.stat().st_size
+        with segment.open('r+b') as handle:
+            handle.truncate(size - 3)
+
+        recovered = SegmentLogQueue(tmp_path)
+        assert recovered.get_all_pending() == [('t1', {'a': 1})]
+
+        recovered.push('t3', {'c': 3})
+        assert [task_id for task_id, _ in SegmentLogQueue(tmp_path).get_all_pending()] == ['t1', 't3']
+
+    def test_segments_are_rolled_and_deleted(self, tmp_path):
+        """Test that drained segments are removed from the front of the log."""
+        queue = SegmentLogQueue(tmp_path, max_segment_bytes=256)
+        for index in range(20):
+            queue.push(f't{index}', {'index': index})
+        assert len(list((tmp_path / 'segments').glob('*.log'))) > 2
+
+        for _ in range(20):
+            task_id, _ = queue.pop()
+            queue.ack(task_id)
+
+        assert len(list((tmp_path / 'segments').glob('*.log'))) == 1
+        assert queue.is_empty()
+
+    def test_compaction_copies_live_tasks_forward(self, tmp_path):
+        """Test that a long-running unacknowledged task does not pin the oldest segment."""
+        queue = SegmentLogQueue(tmp_path, max_segment_bytes=256)
+        for index in range(20):
+            queue.push(f't{index}', {'index': index})
+
+        queue.pop()  # ``t0`` stays unacknowledged
+        for _ in range(19):
+            task_id, _ = queue.pop()
+            queue.ack(task_id)
+
+        assert len(list((tmp_path / 'segments').glob('*.log'))) <= 2
+        assert queue.get_all_processing() == [('t0', {'index': 0})]
+
+        queue.close()
+        assert SegmentLogQueue(tmp_path).get_all_pending() == [('t0', {'index': 0})]
+
+    def test_clear(self, tmp_path):
+        """Test clear removes all pending tasks but not processing ones."""
+        queue = SegmentLogQueue(tmp_path)
+        queue.push('t1', {'a': 1})
+        queue.push('t2', {'b': 2})
+        queue.pop()
+
+        assert queue.clear() == 1
+        assert queue.is_empty()
+        assert [task_id for task_id, _ in SegmentLogQueue(tmp_path).get_all_pending()] == ['t1']
+
+    def test_imports_folder_layout(self, tmp_path):
+        """Test that tasks left behind by the folder-based engine are imported."""
+        legacy = PersistentQueue(tmp_path)
+        legacy.push('t1', {'a': 1})
+        legacy.push('t2', {'b': 2})
+        legacy.pop()
+
+        queue = SegmentLogQueue(tmp_path)
+        assert [task_id for task_id, _ in queue.get_all_pending()] == ['t1', 't2']
+        assert list((tmp_path / 'pending').glob('*.json')) == []
+        assert list((tmp_path / 'processing').glob('*.json')) == []
+
+
+@pytest.mark.parametrize(('engine', 'cls'), (('folder', PersistentQueue), ('segment_log', SegmentLogQueue)))
+def test_open_task_queue(tmp_path, engine, cls):
+    """Test the queue engine factory."""
+    assert isinstance(open_task_queue(tmp_path, engine), cls)
+
+
+def test_open_task_queue_invalid(tmp_path):
+    """Test the queue engine factory raises for unknown engines."""
+    with pytest.raises(ValueError, match='unknown queue engine'):
+        open_task_queue(tmp_path, 'invalid')
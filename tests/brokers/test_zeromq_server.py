@@ -235,9 +235,10 @@ class TestZeromqBrokerServerMessageHandling:
     # --- Broadcast handling ---
 
     def test_handle_broadcast(self, server):
-        """Test _handle_broadcast fans out to all subscribers."""
+        """Test _handle_broadcast fans out to all broadcast subscribers."""
         server._task_subscribers['w1'] = b'worker-1'
-        server._rpc_subscribers['w2'] = b'worker-2'
+        server._handle_subscribe_broadcast(b'worker-2', {'identifier': 'b2'})
+        server._handle_subscribe_broadcast(b'worker-3', {'identifier': 'b3'})
         server._send_to_client = MagicMock()
 
         msg = {'type': MessageType.BROADCAST.value, 'body': 'hello', 'subject': 'test'}
@@ -245,6 +246,38 @@ class TestZeromqBrokerServerMessageHandling:
 
         assert server._send_to_client.call_count == 2
 
+    def test_handle_broadcast_filtered(self, server):
+        """Test _handle_broadcast only forwards to clients with a matching subscriber."""
+        subject_filter = {'subject': [{'regex': 'state_changed[.].*'}]}
+        sender_filter = {'sender': [{'value': 10}]}
+        server._handle_subscribe_broadcast(b'worker-1', {'identifier': 'b1', 'filter': subject_filter})
+        server._handle_subscribe_broadcast(b'worker-2', {'identifier': 'b2', 'filter': sender_filter})
+        server._send_to_client = MagicMock()
+
+        def get_recipients(sender, subject):
+            server._send_to_client.reset_mock()
+            server._handle_broadcast(
+                b'sender', {'type': MessageType.BROADCAST.value, 'sender': sender, 'subject': subject}
+            )
+            return {call[0][0] for call in server._send_to_client.call_args_list}
+
+        assert get_recipients(10, 'state_changed.running.finished') == {b'worker-1', b'worker-2'}
+        assert get_recipients(11, 'state_changed.running.finished') == {b'worker-1'}
+        assert get_recipients(10, 'pause') == {b'worker-2'}
+        assert get_recipients(11, 'pause') == set()
+        assert get_recipients(None, None) == {b'worker-1', b'worker-2'}
+
+    def test_handle_unsubscribe_broadcast(self, server):
+        """Test that a client no longer receives broadcasts after removing its last subscriber."""
+        server._handle_subscribe_broadcast(b'worker-1', {'identifier': 'b1'})
+        server._handle_unsubscribe_broadcast(b'worker-1', {'identifier': 'b1'})
+        server._send_to_client = MagicMock()
+
+        server._handle_broadcast(b'sender', {'type': MessageType.BROADCAST.value, 'subject': 'test'})
+
+        assert server._broadcast_subscribers == {}
+        server._send_to_client.assert_not_called()
+
     # --- Subscription handling ---
 
     def test_handle_subscribe_task(self, server):
@@ -323,6 +356,63 @@ class TestZeromqBrokerServerMessageHandling:
         server._dispatch_pending_tasks()
         server._send_to_client.assert_not_called()
 
+    def test_dispatch_least_loaded(self, server):
+        """Test dispatch spreads tasks evenly and prefers the worker with the fewest unacknowledged tasks."""
+        for identity in (b'worker-1', b'worker-2'):
+            msg = {'type': MessageType.SUBSCRIBE_TASK.value, 'identifier': identity.decode(), 'prefetch': 10}
+            server._handle_subscribe_task(identity, msg)
+        server._send_to_client = MagicMock()
+
+        for index in range(6):
+            server._task_queue.push(f'task-{index}', {'body': 'data'})
+        server._dispatch_pending_tasks()
+        assert server._worker_load == {b'worker-1': 3, b'worker-2': 3}
+
+        # Acknowledging two tasks of the first worker makes it the least loaded one
+        for task_id in [tid for tid, wid in server._task_worker_assignments.items() if wid == b'worker-1'][:2]:
+            server._handle_task_ack(b'worker-1', {'task_id': task_id})
+        server._task_queue.push('task-6', {'body': 'data'})
+        server._dispatch_pending_tasks()
+        assert server._task_worker_assignments['task-6'] == b'worker-1'
+
+    def test_dispatch_respects_prefetch(self, server):
+        """Test a worker receives no more unacknowledged tasks than its prefetch limit."""
+        msg = {'type': MessageType.SUBSCRIBE_TASK.value, 'identifier': 'w1', 'prefetch': 2}
+        server._handle_subscribe_task(b'worker-1', msg)
+        server._send_to_client = MagicMock()
+
+        for index in range(5):
+            server._task_queue.push(f'task-{index}', {'body': 'data'})
+        server._dispatch_pending_tasks()
+
+        assert server._send_to_client.call_count == 2
+        assert server._task_queue.size() == 3
+        assert b'worker-1' not in server._available_workers
+
+        server._handle_task_ack(b'worker-1', {'task_id': 'task-0'})
+        server._dispatch_pending_tasks()
+        assert server._send_to_client.call_count == 3
+        assert server._worker_load[b'worker-1'] == 2
+
+    def test_nack_returns_credit(self, server):
+        """Test a negative acknowledgement releases the task assignment of the worker."""
+        msg = {'type': MessageType.SUBSCRIBE_TASK.value, 'identifier': 'w1', 'prefetch': 1}
+        server._handle_subscribe_task(b'worker-1', msg)
+        server._send_to_client = MagicMock()
+        server._task_queue.push('task-1', {'body': 'data'})
+        server._dispatch_pending_tasks()
+        assert b'worker-1' not in server._available_workers
+
+        server._handle_task_nack(b'worker-1', {'task_id': 'task-1'})
+        assert 'task-1' not in server._task_worker_assignments
+        assert b'worker-1' not in server._worker_load
+        assert b'worker-1' in server._available_workers
+
+        # The requeued task is dispatched to the worker again
+        server._dispatch_pending_tasks()
+        assert server._task_worker_assignments == {'task-1': b'worker-1'}
+        assert server._send_to_client.call_count == 2
+
     # --- Worker management ---
 
     def test_remove_dead_worker(self, server):
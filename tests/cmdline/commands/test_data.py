@@ -320,6 +320,26 @@ class TestVerdiDataBands(DummyVerdiDataListable):
         self.data_listing_test(BandsData, 'FeO', self.pks)
         self.data_listing_test(BandsData, '<<NOT FOUND>>', self.pks)
 
+    def test_bandslist_compact_structure(self):
+        """Test that the formula of a parent structure whose sites are stored as arrays in the repository is listed."""
+        structure = StructureData(cell=[[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 4.0]])
+        structure.append_atom(position=(0.0, 0.0, 0.0), symbols='Ni')
+        structure.append_atom(position=(2.0, 2.0, 2.0), symbols='O')
+        structure.compact_sites()
+        structure.store()
+
+        @calcfunction
+        def create_bands(structure):
+            bands = BandsData()
+            bands.set_kpoints([[0.0, 0.0, 0.0], [0.1, 0.1, 0.1]])
+            bands.set_bands([[1.0, 2.0], [3.0, 4.0]])
+            return bands
+
+        bands = create_bands(structure)
+
+        res = self.cli_runner(cmd_bands.bands_list, ['-e', 'Ni'])
+        assert [str(bands.pk), 'NiO'] == res.stdout.splitlines()[2].split()[:2]
+
     def test_bandslist_with_elements(self):
         options = ['-e', 'Fe']
         res = self.cli_runner(cmd_bands.bands_list, options)
@@ -816,6 +836,19 @@ PRIMVEC
     def test_list(self):
         self.data_listing_test(StructureData, 'BaO3Ti', self.pks)
 
+    def test_list_compact(self):
+        """Test that structures whose sites are stored as arrays in the repository are listed."""
+        structure = StructureData(cell=[[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 4.0]])
+        structure.append_atom(position=(0.0, 0.0, 0.0), symbols='Fe')
+        structure.append_atom(position=(2.0, 2.0, 2.0), symbols='Fe')
+        structure.append_atom(position=(2.0, 0.0, 0.0), symbols='O')
+        structure.compact_sites()
+        structure.store()
+
+        res = self.cli_runner(cmd_structure.structure_list, ['-e', 'Fe'])
+        assert res.stdout.splitlines()[2].split() == [str(structure.pk), 'Fe2O']
+        assert b'Total results: 1' in res.stdout_bytes
+
     @pytest.mark.parametrize('output_flag', ['-o', '--output'])
     def test_export(self, output_flag, tmp_path):
         self.data_export_test(StructureData, self.pks, cmd_structure.EXPORT_FORMATS, output_flag, tmp_path)
@@ -122,6 +122,7 @@ def test_hierarchy_utility(file_hierarchy, tmp_path, create_file_hierarchy, seri
         (['file_a.txt', 'file_u.txt', 'path/file_u.txt', ('path/sub/file_u.txt', '.', 3)], {'file_a.txt': 'file_a'}),
     ),
 )
+@pytest.mark.parametrize('archive_threshold', (0, 1))
 @pytest.mark.asyncio
 async def test_retrieve_files_from_list(
     tmp_path_factory,
@@ -129,10 +130,16 @@ async def test_retrieve_files_from_list(
     file_hierarchy,
     retrieve_list,
     expected_hierarchy,
+    archive_threshold,
+    monkeypatch,
     create_file_hierarchy,
     serialize_file_hierarchy,
 ):
-    """Test the `retrieve_files_from_list` function."""
+    """Test the `retrieve_files_from_list` function, both item by item and through a single archive."""
+    options = {'transport.retrieve_archive_threshold': archive_threshold}
+    get_config_option = execmanager.get_config_option
+    monkeypatch.setattr(execmanager, 'get_config_option', lambda name: options.get(name, get_config_option(name)))
+
     source = tmp_path_factory.mktemp('source')
     target = tmp_path_factory.mktemp('target')
 
@@ -143,6 +150,67 @@ async def test_retrieve_files_from_list(
         await execmanager.retrieve_files_from_list(node, transport, target, retrieve_list)
 
     assert serialize_file_hierarchy(target, read_bytes=False) == expected_hierarchy
+    assert serialize_file_hierarchy(source, read_bytes=False) == file_hierarchy
+
+
+@pytest.mark.asyncio
+async def test_retrieve_files_from_list_archive(
+    tmp_path_factory, generate_calcjob_node, file_hierarchy, monkeypatch, create_file_hierarchy
+):
+    """Test that the archive retrieval falls back to retrieving item by item if the archive cannot be created."""
+    from unittest.mock import patch
+
+    monkeypatch.setattr(execmanager, 'get_config_option', lambda name: 1)
+
+    source = tmp_path_factory.mktemp('source')
+    target = tmp_path_factory.mktemp('target')
+    create_file_hierarchy(file_hierarchy, source)
+    node = generate_calcjob_node(workdir=source)
+
+    with LocalTransport() as transport:
+        with patch.object(transport, 'get_async', wraps=transport.get_async) as get_async:
+            await execmanager.retrieve_files_from_list(node, transport, target, ['file_a.txt', 'path'])
+        assert get_async.call_count == 1
+
+        with patch.object(transport, 'exec_command_wait_async', side_effect=NotImplementedError):
+            await execmanager.retrieve_files_from_list(node, transport, target, [('file_a.txt', 'other', 0)])
+
+        with patch.object(transport, 'exec_command_wait_async', return_value=(2, '', 'tar: not found')):
+            await execmanager.retrieve_files_from_list(node, transport, target, [('file_a.txt', 'another', 0)])
+
+    assert (target / 'other').read_text() == 'file_a'
+    assert (target / 'another').read_text() == 'file_a'
+
+
+@pytest.mark.parametrize(
+    'localpaths, concurrent',
+    (
+        (['a', 'b', 'c/d'], True),
+        (['a', 'b', 'a'], False),
+        (['a', 'a-b', 'a/c'], False),
+        (['.', 'a'], False),
+    ),
+)
+@pytest.mark.asyncio
+async def test_get_concurrently(localpaths, concurrent):
+    """Test that transfers are only performed concurrently if the local paths are independent of each other."""
+    import asyncio
+    from unittest.mock import MagicMock
+
+    active = []
+    maximum = []
+
+    async def get_async(remotepath, localpath, ignore_nonexisting):
+        assert ignore_nonexisting
+        active.append(localpath)
+        maximum.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(localpath)
+
+    transport = MagicMock(max_io_allowed=3, get_async=get_async)
+    await execmanager._get_concurrently(transport, [(localpath, localpath) for localpath in localpaths])
+
+    assert max(maximum) == (3 if concurrent else 1)
 
 
 @pytest.mark.asyncio
@@ -233,6 +301,42 @@ async def test_upload_local_copy_list_files_folders(
     assert expected_hierarchy == written_hierarchy
 
 
+@pytest.mark.asyncio
+async def test_upload_local_copy_list_object_cache(aiida_localhost, fixture_sandbox, monkeypatch):
+    """Test that files of the ``local_copy_list`` are uploaded only once if the remote object cache is enabled."""
+    import uuid
+    from unittest.mock import patch
+
+    from aiida.engine.daemon.object_cache import RemoteObjectCache
+
+    if not RemoteObjectCache.is_supported():
+        pytest.skip('the remote object cache requires `fcntl`')
+
+    options = {'transport.local_copy_cache_size': 1}
+    get_config_option = execmanager.get_config_option
+    monkeypatch.setattr(execmanager, 'get_config_option', lambda name: options.get(name, get_config_option(name)))
+
+    content = uuid.uuid4().hex
+    single_file = SinglefileData(io.StringIO(content), filename='pseudo.upf').store()
+    nodes = []
+
+    async with aiida_localhost.get_transport() as transport:
+        with patch.object(transport, 'put_async', wraps=transport.put_async) as put_async:
+            for _ in range(2):
+                node = CalcJobNode(computer=aiida_localhost).store()
+                calc_info = CalcInfo()
+                calc_info.uuid = node.uuid
+                calc_info.codes_info = []
+                calc_info.local_copy_list = [(single_file.uuid, single_file.filename, 'pseudo/pseudo.upf')]
+                await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+                nodes.append(node)
+
+    assert put_async.call_count == 1
+
+    for node in nodes:
+        assert (pathlib.Path(node.get_remote_workdir()) / 'pseudo' / 'pseudo.upf').read_text() == content
+
+
 @pytest.mark.asyncio
 async def test_upload_remote_symlink_list(
     fixture_sandbox, node_and_calc_info, file_hierarchy, tmp_path, create_file_hierarchy
@@ -659,6 +763,59 @@ async def test_upload_calculation_portable_code(fixture_sandbox, node_and_calc_i
         )
 
 
+@pytest.mark.parametrize('pack_threshold', (0, 1, 100))
+@pytest.mark.asyncio
+async def test_upload_sandbox_packed(
+    aiida_localhost,
+    fixture_sandbox,
+    file_hierarchy,
+    pack_threshold,
+    monkeypatch,
+    create_file_hierarchy,
+    serialize_file_hierarchy,
+):
+    """Test that the sandbox folder is uploaded as a tar archive if it contains at least ``pack_threshold`` files."""
+    from unittest.mock import patch
+
+    options = {'transport.upload_pack_threshold': pack_threshold}
+    get_config_option = execmanager.get_config_option
+    monkeypatch.setattr(execmanager, 'get_config_option', lambda name: options.get(name, get_config_option(name)))
+
+    create_file_hierarchy(file_hierarchy, fixture_sandbox)
+    node = CalcJobNode(computer=aiida_localhost).store()
+    calc_info = CalcInfo()
+    calc_info.uuid = node.uuid
+    calc_info.codes_info = []
+
+    async with node.computer.get_transport() as transport:
+        with patch.object(transport, 'extract_async', wraps=transport.extract_async) as extract_async:
+            await execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+
+    assert extract_async.call_count == (1 if pack_threshold == 1 else 0)
+    assert serialize_file_hierarchy(pathlib.Path(node.get_remote_workdir()), read_bytes=False) == file_hierarchy
+
+
+@pytest.mark.asyncio
+async def test_put_concurrently():
+    """Test that transfers are performed concurrently, bounded by the ``max_io_allowed`` of the transport."""
+    import asyncio
+    from unittest.mock import MagicMock
+
+    active = []
+    maximum = []
+
+    async def put_async(localpath, remotepath):
+        active.append(localpath)
+        maximum.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(localpath)
+
+    transport = MagicMock(max_io_allowed=3, put_async=put_async)
+    await execmanager._put_concurrently(transport, [(index, index) for index in range(10)])
+
+    assert max(maximum) == 3
+
+
 @pytest.mark.parametrize(
     'file_hierarchy',
     [{'aiida.out': 'out', 'aiida.in': 'in', '_aiidasubmit.sh': 'script', 'folder': {'1': '1', '2': '2', '3': '3'}}],
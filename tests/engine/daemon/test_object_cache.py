@@ -0,0 +1,94 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.engine.daemon.object_cache` module."""
+
+import pathlib
+
+import pytest
+
+from aiida.engine.daemon.object_cache import RemoteObjectCache
+from aiida.transports.plugins.local import LocalTransport
+
+pytestmark = pytest.mark.skipif(not RemoteObjectCache.is_supported(), reason='requires `fcntl`')
+
+
+@pytest.fixture
+def object_cache(tmp_path):
+    """Return a cache with a maximum size of 10 bytes, with its remote directory and index in ``tmp_path``."""
+    return RemoteObjectCache(tmp_path / 'remote' / 'cache', tmp_path / 'index' / 'index.json', max_size=10)
+
+
+@pytest.fixture
+def write_file(tmp_path):
+    """Return a function that writes the given content to a local file and returns its path."""
+
+    def factory(name, content):
+        filepath = tmp_path / 'local' / name
+        filepath.parent.mkdir(exist_ok=True)
+        filepath.write_text(content)
+        return filepath
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_put_and_copy(object_cache, write_file, tmp_path):
+    """Test that an uploaded file is added to the cache and can then be copied from it on the remote."""
+    workdir = tmp_path / 'remote' / 'workdir'
+    workdir.mkdir(parents=True)
+
+    with LocalTransport() as transport:
+        assert not await object_cache.copy(transport, 'key', workdir / 'a')
+
+        await object_cache.put(transport, 'key', write_file('a', 'abc'), workdir / 'a')
+        assert object_cache.get_keys() == {'key'}
+        assert pathlib.Path(object_cache.get_remote_path('key')).read_text() == 'abc'
+
+        assert await object_cache.copy(transport, 'key', workdir / 'b')
+
+    assert (workdir / 'a').read_text() == 'abc'
+    assert (workdir / 'b').read_text() == 'abc'
+    assert sorted(path.name for path in pathlib.Path(object_cache.get_remote_path('key')).parent.iterdir()) == ['key']
+
+
+@pytest.mark.asyncio
+async def test_eviction(object_cache, write_file, tmp_path):
+    """Test that the least recently used objects are evicted when the cache exceeds its maximum size."""
+    workdir = tmp_path / 'remote' / 'workdir'
+    workdir.mkdir(parents=True)
+
+    with LocalTransport() as transport:
+        await object_cache.put(transport, 'a', write_file('a', 'aaaa'), workdir / 'a')
+        await object_cache.put(transport, 'b', write_file('b', 'bbbb'), workdir / 'b')
+        assert await object_cache.copy(transport, 'a', workdir / 'a2')
+        await object_cache.put(transport, 'c', write_file('c', 'cccc'), workdir / 'c')
+
+        # Objects larger than the maximum size are uploaded but not cached
+        await object_cache.put(transport, 'd', write_file('d', 'd' * 11), workdir / 'd')
+
+    assert object_cache.get_keys() == {'a', 'c'}
+    assert not pathlib.Path(object_cache.get_remote_path('b')).exists()
+    assert not pathlib.Path(object_cache.get_remote_path('d')).exists()
+    assert (workdir / 'b').read_text() == 'bbbb'
+    assert (workdir / 'd').read_text() == 'd' * 11
+
+
+@pytest.mark.asyncio
+async def test_copy_missing_remote(object_cache, write_file, tmp_path):
+    """Test that an object in the index that no longer exists on the remote is discarded."""
+    workdir = tmp_path / 'remote' / 'workdir'
+    workdir.mkdir(parents=True)
+
+    with LocalTransport() as transport:
+        await object_cache.put(transport, 'key', write_file('a', 'abc'), workdir / 'a')
+        pathlib.Path(object_cache.get_remote_path('key')).unlink()
+
+        assert not await object_cache.copy(transport, 'key', workdir / 'b')
+
+    assert object_cache.get_keys() == set()
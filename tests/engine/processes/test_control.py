@@ -97,6 +97,90 @@ def test_kill_processes_all_entries(submit_and_await):
     assert node.is_killed
 
 
+@pytest.fixture
+def batched_actions(monkeypatch):
+    """Record the pks of the processes that are reached by the batched actions on the daemon workers."""
+    reached = []
+    perform_batched_actions = control._perform_batched_actions
+
+    def _perform_batched_actions(*args, **kwargs):
+        result = perform_batched_actions(*args, **kwargs)
+        reached.append(result[0])
+        return result
+
+    monkeypatch.setattr(control, '_perform_batched_actions', _perform_batched_actions)
+    return reached
+
+
+@pytest.mark.usefixtures('aiida_profile_clean', 'started_daemon_client')
+def test_control_processes_batched(submit_and_await, batched_actions):
+    """Test that the actions on multiple processes are sent in a single batch to the daemon workers."""
+    nodes = [submit_and_await(WaitProcess, ProcessState.WAITING) for _ in range(3)]
+    pks = {node.pk for node in nodes}
+
+    control.pause_processes(nodes, timeout=float('inf'))
+    assert all(node.paused for node in nodes)
+    assert all(
+        node.process_status == 'Paused through `aiida.engine.processes.control.pause_processes`' for node in nodes
+    )
+
+    control.play_processes(nodes, timeout=float('inf'))
+    assert not any(node.paused for node in nodes)
+
+    control.kill_processes(nodes, timeout=float('inf'))
+    assert all(node.is_killed for node in nodes)
+    assert batched_actions == [pks, pks, pks]
+
+
+@pytest.mark.usefixtures('aiida_profile_clean', 'started_daemon_client')
+def test_control_processes_batched_nowait(submit_and_await, batched_actions):
+    """Test that the daemon workers acknowledge a batch of actions that is not waited for."""
+    nodes = [submit_and_await(WaitProcess, ProcessState.WAITING) for _ in range(2)]
+
+    control.kill_processes(nodes, timeout=0)
+    assert batched_actions == [{node.pk for node in nodes}]
+
+    for node in nodes:
+        submit_and_await(node, ProcessState.KILLED)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean', 'started_daemon_client')
+def test_control_processes_batched_fallback(submit_and_await, batched_actions, monkeypatch):
+    """Test that processes that are not reached through a daemon worker are sent the action separately."""
+    nodes = [submit_and_await(WaitProcess, ProcessState.WAITING) for _ in range(2)]
+    monkeypatch.setattr(control, 'get_worker_rpc_identifier', lambda pid: f'non-existent.{pid}')
+
+    control.kill_processes(nodes, timeout=float('inf'))
+    assert all(node.is_killed for node in nodes)
+    assert batched_actions == [set()]
+
+
+@pytest.mark.usefixtures('aiida_profile_clean', 'started_daemon_client')
+def test_control_processes_batched_unanswered(submit_and_await, batched_actions, monkeypatch, caplog):
+    """Test that processes are not sent the action separately if a daemon worker did not reply to the batch.
+
+    The worker may still perform the action on its processes, so they would receive it twice, and the time to wait for
+    the batch and the separate actions together is bounded by the timeout.
+    """
+    import concurrent.futures
+    import time
+
+    from aiida.manage import get_manager
+
+    nodes = [submit_and_await(WaitProcess, ProcessState.WAITING) for _ in range(2)]
+    communicator = get_manager().get_communicator()
+    monkeypatch.setattr(communicator, 'rpc_send', lambda *args, **kwargs: concurrent.futures.Future())
+    controller = get_manager().get_process_controller()
+    monkeypatch.setattr(controller, 'kill_process', lambda *args, **kwargs: pytest.fail('action sent separately'))
+
+    start = time.monotonic()
+    control.kill_processes(nodes, timeout=1)
+    assert time.monotonic() - start < 2
+    assert batched_actions == [set()]
+    assert not any(node.is_killed for node in nodes)
+    assert all(f'Process<{node.pk}> is unreachable' in caplog.text for node in nodes)
+
+
 @pytest.mark.usefixtures('aiida_profile_clean', 'started_daemon_client')
 def test_revive(monkeypatch, aiida_code_installed, submit_and_await):
     """Test :func:`aiida.engine.processes.control.revive_processes`."""
@@ -14,7 +14,8 @@ import time
 import pytest
 from plumpy import get_or_create_event_loop
 
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import JobManager, JobsList, JobsSubmitter
+from aiida.engine.processes.calcjobs.poll_cache import JobsPollCache, JobsSnapshot
 from aiida.engine.transports import TransportQueue
 from aiida.orm import User
 
@@ -49,6 +50,61 @@ class TestJobManager:
             self.manager._job_lists[self.auth_info.pk]._job_update_requests[str(1)] == request
 
 
+class TestJobsSubmitter:
+    """Test the `aiida.engine.processes.calcjobs.manager.JobsSubmitter` class."""
+
+    @pytest.fixture(autouse=True)
+    def init_profile(self, aiida_localhost, monkeypatch):
+        """Initialize the profile."""
+        monkeypatch.setattr(JobsSubmitter, '_SUBMISSION_WINDOW', 0.01)
+        self.loop = get_or_create_event_loop()
+        self.transport_queue = TransportQueue(self.loop)
+        self.auth_info = aiida_localhost.get_authinfo(User.collection.get_default())
+        self.submitter = JobsSubmitter(self.auth_info, self.transport_queue)
+
+    def test_submissions_are_coalesced(self, monkeypatch):
+        """Test that concurrent submissions are submitted in batches and each receive their own result."""
+        from aiida.engine.daemon import execmanager
+
+        monkeypatch.setattr(JobsSubmitter, '_MAX_BATCH_SIZE', 2)
+        batches = []
+
+        async def submit_calculations(calculations, transport):
+            batches.append(list(calculations))
+            return [ValueError('failed') if node == 'c' else f'job-{node}' for node in calculations]
+
+        monkeypatch.setattr(execmanager, 'submit_calculations', submit_calculations)
+
+        async def submit():
+            return await asyncio.gather(
+                *(self.submitter.submit_calculation(node) for node in 'abc'), return_exceptions=True
+            )
+
+        results = self.loop.run_until_complete(submit())
+
+        assert batches == [['a', 'b'], ['c']]
+        assert results[:2] == ['job-a', 'job-b']
+        assert isinstance(results[2], ValueError)
+
+    def test_transport_failure(self, monkeypatch):
+        """Test that all pending submissions fail if the transport cannot be opened."""
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def request_transport(authinfo):
+            raise OSError('cannot open transport')
+            yield
+
+        monkeypatch.setattr(self.transport_queue, 'request_transport', request_transport)
+
+        async def submit():
+            return await asyncio.gather(
+                *(self.submitter.submit_calculation(node) for node in 'ab'), return_exceptions=True
+            )
+
+        assert all(isinstance(result, OSError) for result in self.loop.run_until_complete(submit()))
+
+
 class TestJobsList:
     """Test the `aiida.engine.processes.calcjobs.manager.JobsList` class."""
 
@@ -113,7 +169,7 @@ class TestJobsList:
 
         # Patch the scheduler's get_jobs
         scheduler = self.auth_info.computer.get_scheduler()
-        with patch.object(scheduler.__class__, 'get_jobs', side_effect=mock_get_jobs):
+        with patch.object(scheduler.__class__, 'get_jobs_async', side_effect=mock_get_jobs):
             self.loop.run_until_complete(jobs_list._update_job_info())
 
         # Verify job_id_a was resolved correctly
@@ -132,7 +188,91 @@ class TestJobsList:
             # but not being in the scheduler anymore.
             return {}
 
-        with patch.object(scheduler.__class__, 'get_jobs', side_effect=mock_get_jobs):
+        with patch.object(scheduler.__class__, 'get_jobs_async', side_effect=mock_get_jobs):
             self.loop.run_until_complete(jobs_list._update_job_info())
 
         assert future2.done(), 'job_id_b future should be resolved'
+
+
+class TestJobsPollCache:
+    """Test the `JobsList` with a `JobsPollCache` shared between instances."""
+
+    @pytest.fixture(autouse=True)
+    def init_profile(self, aiida_localhost, tmp_path, monkeypatch):
+        """Initialize the profile."""
+        monkeypatch.setattr(JobsList, '_POLL_CACHE_WAIT_INTERVAL', 0.01)
+        self.loop = get_or_create_event_loop()
+        self.transport_queue = TransportQueue(self.loop)
+        self.auth_info = aiida_localhost.get_authinfo(User.collection.get_default())
+        self.dirpath = tmp_path
+        self.scheduler_class = aiida_localhost.get_scheduler().__class__
+
+    def get_jobs_list(self):
+        return JobsList(self.auth_info, self.transport_queue, poll_cache=JobsPollCache(self.dirpath))
+
+    @pytest.mark.parametrize('can_query_by_user', (True, False))
+    def test_single_scheduler_query(self, monkeypatch, can_query_by_user):
+        """Test that concurrent updates of instances sharing a cache query the scheduler only once."""
+        from unittest.mock import patch
+
+        from aiida.schedulers.datastructures import JobInfo, JobState
+
+        monkeypatch.setitem(self.scheduler_class._features, 'can_query_by_user', can_query_by_user)
+        jobs = {job_id: JobInfo({'job_id': job_id, 'job_state': JobState.RUNNING}) for job_id in ('A', 'B')}
+        jobs_lists = {job_id: self.get_jobs_list() for job_id in jobs}
+        requests = {
+            job_id: jobs_list._job_update_requests.setdefault(job_id, asyncio.Future(loop=self.loop))
+            for job_id, jobs_list in jobs_lists.items()
+        }
+
+        async def update():
+            await asyncio.gather(*(jobs_list._update_job_info() for jobs_list in jobs_lists.values()))
+
+        with patch.object(self.scheduler_class, 'get_jobs_async', return_value=jobs) as get_jobs:
+            self.loop.run_until_complete(update())
+
+        get_jobs.assert_called_once()
+        if not can_query_by_user:
+            assert sorted(get_jobs.call_args.kwargs['jobs']) == ['A', 'B']
+        for job_id, request in requests.items():
+            assert request.result().get_dict() == jobs[job_id].get_dict()
+
+    def test_snapshot_not_used_for_later_requests(self):
+        """Test that a snapshot taken before a job was requested is not used, since the job might not have existed."""
+        from unittest.mock import patch
+
+        JobsPollCache(self.dirpath).set_snapshot(JobsSnapshot(time.time() - 1, {}, None))
+        jobs_list = self.get_jobs_list()
+        request = jobs_list._job_update_requests.setdefault('A', asyncio.Future(loop=self.loop))
+
+        with patch.object(self.scheduler_class, 'get_jobs_async', return_value={}) as get_jobs:
+            self.loop.run_until_complete(jobs_list._update_job_info())
+
+        get_jobs.assert_called_once()
+        assert request.result() is None
+
+    def test_requested_job_ids(self):
+        """Test that registrations of instances are combined and registrations of dead processes are removed."""
+        cache_a = JobsPollCache(self.dirpath)
+        cache_b = JobsPollCache(self.dirpath)
+        cache_a.register(['1', '2'])
+        cache_b.register(['3'])
+        (self.dirpath / 'requests' / '999999999-dead.json').write_text('["4"]')
+
+        assert cache_a.get_requested_job_ids() == {'1', '2', '3'}
+        assert not (self.dirpath / 'requests' / '999999999-dead.json').exists()
+
+        cache_b.unregister()
+        assert cache_a.get_requested_job_ids() == {'1', '2'}
+
+    def test_lock(self):
+        """Test that only one instance can hold the lock at a time."""
+        cache_a = JobsPollCache(self.dirpath)
+        cache_b = JobsPollCache(self.dirpath)
+
+        with cache_a.lock() as acquired_a:
+            with cache_b.lock() as acquired_b:
+                assert acquired_a and not acquired_b
+
+        with cache_b.lock() as acquired_b:
+            assert acquired_b
@@ -76,6 +76,41 @@ def test_call_on_process_finish(runner):
     assert future.result()
 
 
+def test_termination_watcher(runner):
+    """Test that the ``ProcessTerminationWatcher`` checks all watched processes at once."""
+    import asyncio
+
+    from aiida.engine.runners import ProcessTerminationWatcher
+
+    watcher = ProcessTerminationWatcher(runner.loop, poll_interval=0.1)
+    nodes = [WorkflowNode() for _ in range(3)]
+    for node in nodes:
+        node.set_process_state(plumpy.ProcessState.RUNNING)
+        node.store()
+    nodes[0].set_process_state(plumpy.ProcessState.FINISHED)
+
+    called = []
+    for node in nodes:
+        watcher.watch(node.pk, lambda pk=node.pk: called.append(pk))
+
+    runner.loop.run_until_complete(asyncio.sleep(0.05))
+    assert called == [nodes[0].pk]
+    assert watcher.watched == {nodes[1].pk, nodes[2].pk}
+    assert watcher.num_polls == 1
+    assert watcher.num_terminated_by_polling == 1
+
+    # A process that is unwatched, e.g. because its termination was broadcast, should not be polled for anymore
+    watcher.unwatch(nodes[2].pk, watcher._callbacks[nodes[2].pk][0])
+    nodes[1].set_process_state(plumpy.ProcessState.KILLED)
+    nodes[2].set_process_state(plumpy.ProcessState.EXCEPTED)
+
+    runner.loop.run_until_complete(asyncio.sleep(0.15))
+    assert called == [nodes[0].pk, nodes[1].pk]
+    assert watcher.watched == set()
+    assert watcher.num_polls == 2
+    assert watcher.num_terminated_by_polling == 2
+
+
 def test_submit(runner):
     """Test that inputs can be specified either as a positional dictionary or through keyword arguments."""
     inputs = {'a': Str('input')}
@@ -8,8 +8,10 @@
 ###########################################################################
 """Unit tests for the backend non-specific utility methods."""
 
+import json
 import math
 
+import numpy as np
 import pytest
 
 from aiida.common import exceptions
@@ -40,3 +42,33 @@ class TestOrmImplementationUtils:
 
         with pytest.raises(exceptions.ValidationError):
             clean_value(inf_value)
+
+    @pytest.mark.parametrize(
+        'value',
+        (
+            [1.0, 0.1 + 0.2, -0.0, 1.0e-20, 1.0e14, 99999999999999.5, 1.0e16 + 2, -3.0e20],
+            [1, 2.5, 3],
+            [1, 2, 3],
+            [1.0, True],
+            np.array([1.0, 0.1 + 0.2, 1.0e-20, 99999999999999.5, 1.0e16 + 2, -3.0e20]),
+            np.linspace(0, 1, 12).reshape(3, 4),
+            np.linspace(0, 1, 12, dtype=np.float32),
+            np.arange(12, dtype=np.uint8).reshape(2, 2, 3),
+        ),
+    )
+    def test_clean_value_numeric_sequence(self, monkeypatch, value):
+        """Test that numeric arrays and lists are cleaned in bulk exactly like they are element by element."""
+        from aiida.orm.implementation import utils
+
+        cleaned = clean_value(value)
+
+        monkeypatch.setattr(utils, '_clean_numeric_sequence', lambda _: None)
+        expected = clean_value(value)
+
+        assert json.dumps(cleaned) == json.dumps(expected)
+
+    @pytest.mark.parametrize('value', ([1.0, math.nan], [1, math.inf], np.array([[1.0], [-np.inf]])))
+    def test_clean_value_numeric_sequence_invalid(self, value):
+        """Test that numeric arrays and lists with nan and inf values are rejected."""
+        with pytest.raises(exceptions.ValidationError):
+            clean_value(value)
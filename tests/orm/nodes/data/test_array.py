@@ -8,11 +8,27 @@
 ###########################################################################
 """Tests for the :mod:`aiida.orm.nodes.data.array.array` module."""
 
+import io
+
 import numpy
 import pytest
 
 from aiida.common.warnings import AiidaDeprecationWarning
 from aiida.orm import ArrayData, load_node
+from aiida.orm.nodes.data.array.array import ArrayCache, read_array_index
+
+INDICES = (
+    0,
+    -1,
+    slice(1, 3),
+    slice(None, None, 2),
+    slice(3, 0, -2),
+    slice(5, 1),
+    (1, slice(None), 0),
+    (slice(None), 1),
+    [0, 2],
+    True,
+)
 
 
 def test_read_stored():
@@ -81,3 +97,145 @@ def test_save_and_load_arrays():
     assert set(deserialized) == {'a', 'b'}
     assert numpy.array_equal(deserialized['a'], arrays['a'])
     assert numpy.array_equal(deserialized['b'], arrays['b'])
+
+
+@pytest.mark.parametrize('index', INDICES)
+def test_get_array_index(index):
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData:get_array` with an ``index``."""
+    array = numpy.arange(4 * 3 * 2, dtype=numpy.float64).reshape(4, 3, 2)
+    node = ArrayData({'array': array})
+    assert numpy.array_equal(node.get_array('array', index), array[index])
+
+    node.store()
+    node.clear_internal_cache()
+    assert numpy.array_equal(node.get_array('array', index), array[index])
+
+    node.get_array('array')
+    assert numpy.array_equal(node.get_array('array', index), array[index])
+
+
+@pytest.mark.parametrize('index', INDICES)
+@pytest.mark.parametrize('fortran_order', (False, True))
+def test_read_array_index(index, fortran_order):
+    """Test :func:`aiida.orm.nodes.data.array.array.read_array_index` for a handle that is not a regular file."""
+    array = numpy.arange(4 * 3 * 2, dtype=numpy.int32).reshape(4, 3, 2)
+    array = numpy.asfortranarray(array) if fortran_order else array
+    handle = io.BytesIO()
+    numpy.save(handle, array)
+    handle.seek(0)
+
+    assert numpy.array_equal(read_array_index(handle, index), array[index])
+
+    with pytest.raises(IndexError):
+        handle.seek(0)
+        read_array_index(handle, 4)
+
+
+@pytest.mark.parametrize('index', INDICES)
+def test_chunked_array(index):
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData.set_array` with a ``chunk_size``."""
+    array = numpy.arange(7 * 3 * 2, dtype=numpy.float64).reshape(7, 3, 2)
+    node = ArrayData()
+    node.set_array('array', array, chunk_size=3)
+    assert node.get_arraynames() == ['array']
+    assert node.get_shape('array') == (7, 3, 2)
+    assert sorted(node.base.repository.list_object_names()) == [f'array.{i}.npy.gz' for i in range(3)]
+    assert numpy.array_equal(node.get_array('array'), array)
+    assert numpy.array_equal(node.get_array('array', index), array[index])
+
+    node.store()
+    node.clear_internal_cache()
+    assert numpy.array_equal(node.get_array('array', index), array[index])
+    assert numpy.array_equal(load_node(node.pk).get_array('array'), array)
+
+
+def test_chunked_array_append():
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData.append_to_array`."""
+    array = numpy.arange(8 * 2, dtype=numpy.int64).reshape(8, 2)
+    node = ArrayData()
+    node.set_array('array', array[:2], chunk_size=3)
+    node.append_to_array('array', array[2:4])
+    node.append_to_array('array', array[4:8].astype(numpy.int32))
+    assert node.get_shape('array') == (8, 2)
+    assert numpy.array_equal(node.get_array('array'), array)
+    assert node.get_array('array').dtype == numpy.int64
+
+    with pytest.raises(ValueError, match='does not match'):
+        node.append_to_array('array', numpy.zeros((1, 3), dtype=numpy.int64))
+
+    with pytest.raises(ValueError, match='cannot be cast'):
+        node.append_to_array('array', numpy.zeros((1, 2)))
+
+    node.set_array('array', array)
+    assert node.base.repository.list_object_names() == ['array.npy']
+
+    with pytest.raises(ValueError, match='not stored in chunks'):
+        node.append_to_array('array', array)
+
+    node.store()
+
+
+def test_chunked_array_delete():
+    """Test that deleting or overwriting an array that is stored in chunks removes all its chunks."""
+    node = ArrayData()
+    node.set_array('array', numpy.arange(5), chunk_size=2)
+    node.set_array('array', numpy.arange(3), chunk_size=2)
+    assert sorted(node.base.repository.list_object_names()) == ['array.0.npy.gz', 'array.1.npy.gz']
+
+    node.delete_array('array')
+    assert node.base.repository.list_object_names() == []
+    assert node.get_arraynames() == []
+
+    with pytest.raises(ValueError):
+        node.set_array('array', numpy.arange(5), chunk_size=0)
+
+
+def test_array_cache():
+    """Test that the :class:`aiida.orm.nodes.data.array.array.ArrayCache` evicts the least recently used arrays."""
+    cache = ArrayCache(max_size=24)
+    cache.put('a', 'x', numpy.zeros(1))
+    cache.put('b', 'x', numpy.zeros(1))
+    cache.put('b', 'y', numpy.zeros(1))
+    assert cache.size == 24
+
+    cache.get('a', 'x')
+    cache.put('c', 'x', numpy.zeros(1))
+    assert cache.get('b', 'x') is None
+    assert cache.get('a', 'x') is not None
+    assert cache.size == 24
+
+    cache.put('d', 'x', numpy.zeros(4))
+    assert cache.get('d', 'x') is None
+
+    cache.discard('a')
+    assert cache.get('a', 'x') is None
+    assert cache.size == 16
+
+
+def test_array_cache_read_only():
+    """Test that the cached arrays of a stored ``ArrayData`` cannot be modified in place."""
+    node = ArrayData(numpy.arange(5)).store()
+    node.clear_internal_cache()
+
+    array = node.get_array()
+    with pytest.raises(ValueError):
+        array[0] = 10
+
+    assert load_node(node.pk).get_array()[0] == 0
+    assert node.get_array().copy().flags.writeable
+
+
+def test_array_cache_config_option(monkeypatch):
+    """Test that the maximum size of the :class:`aiida.orm.nodes.data.array.array.ArrayCache` is a config option."""
+    from aiida.orm.nodes.data.array import array
+
+    cache = ArrayCache()
+    monkeypatch.setattr(array, 'get_config_option', lambda option: 0)
+    assert cache.max_size == 0
+    cache.put('a', 'x', numpy.zeros(1))
+    assert cache.get('a', 'x') is None
+
+    monkeypatch.setattr(array, 'get_config_option', lambda option: 1)
+    assert cache.max_size == 1024**2
+    cache.put('a', 'x', numpy.zeros(1))
+    assert cache.get('a', 'x') is not None
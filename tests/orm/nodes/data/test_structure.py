@@ -11,7 +11,9 @@
 import numpy as np
 import pytest
 
-from aiida.orm.nodes.data.structure import StructureData, get_formula
+from aiida.common.exceptions import ModificationNotAllowed, ValidationError
+from aiida.orm import load_node
+from aiida.orm.nodes.data.structure import Kind, StructureData, get_formula
 
 
 def test_get_formula_hill():
@@ -50,6 +52,90 @@ def test_get_composition(mode, expected):
     assert structure.get_composition(mode=mode) == expected
 
 
+@pytest.fixture
+def structure():
+    """Return an unstored structure with multiple kinds and sites."""
+    structure = StructureData(cell=((4.0, 0.0, 0.0), (0.0, 4.0, 0.0), (0.0, 0.0, 4.0)))
+    structure.append_atom(name='Fe1', symbols='Fe', position=(0.0, 0.0, 0.0))
+    structure.append_atom(name='Fe2', symbols='Fe', position=(2.0, 0.0, 0.0))
+    structure.append_atom(symbols='O', position=(1.0, 1.0, 1.0))
+    structure.append_atom(name='Fe1', symbols='Fe', position=(2.0, 2.0, 2.0))
+    return structure
+
+
+class TestSiteArrays:
+    """Tests for the sites of ``StructureData`` stored as arrays in the repository."""
+
+    def test_get_positions_and_kind_indices(self, structure):
+        """Test ``get_positions`` and ``get_kind_indices`` for sites stored in the attributes."""
+        assert not structure.has_site_arrays
+        np.testing.assert_array_equal(structure.get_positions(), [site.position for site in structure.sites])
+        np.testing.assert_array_equal(structure.get_kind_indices(), [0, 1, 2, 0])
+        assert StructureData().get_positions().shape == (0, 3)
+
+    def test_compact_sites(self, structure):
+        """Test that the structure is unchanged when its sites are stored as arrays, also after storing."""
+        expected = {
+            'sites': [site.get_raw() for site in structure.sites],
+            'formula': structure.get_formula(),
+            'kindnames': structure.get_site_kindnames(),
+            'ase': structure.get_ase(),
+        }
+
+        structure.compact_sites()
+        assert structure.has_site_arrays
+        assert 'sites' not in structure.base.attributes
+
+        structure.store()
+        loaded = load_node(structure.pk)
+
+        for node in (structure, loaded):
+            assert [site.get_raw() for site in node.sites] == expected['sites']
+            assert node.get_formula() == expected['formula']
+            assert node.get_site_kindnames() == expected['kindnames']
+            assert node.get_ase() == expected['ase']
+            np.testing.assert_array_equal(node.get_kind_indices(), [0, 1, 2, 0])
+
+        assert not loaded.get_positions().flags.writeable
+
+    def test_modify_sites(self, structure):
+        """Test appending, moving and clearing sites that are stored as arrays."""
+        structure.compact_sites()
+        structure.append_atom(symbols='O', position=(3.0, 3.0, 3.0))
+        np.testing.assert_array_equal(structure.get_kind_indices(), [0, 1, 2, 0, 2])
+
+        structure.reset_sites_positions(np.ones((5, 3)))
+        np.testing.assert_array_equal(structure.get_positions(), np.ones((5, 3)))
+
+        structure.clear_sites()
+        assert not structure.has_site_arrays
+        assert structure.base.repository.list_object_names() == []
+        assert structure.sites == []
+
+    def test_set_site_arrays_invalid(self, structure):
+        """Test that invalid site arrays are rejected."""
+        with pytest.raises(ValueError, match='should have shape'):
+            structure.set_site_arrays(np.zeros((2, 2)), [0, 0])
+
+        with pytest.raises(ValueError, match='should have shape'):
+            structure.set_site_arrays(np.zeros((2, 3)), [0])
+
+        with pytest.raises(ValueError, match='should be between'):
+            structure.set_site_arrays(np.zeros((2, 3)), [0, 3])
+
+        structure.set_site_arrays(np.zeros((2, 3)), [0, 1])
+
+        with pytest.raises(ValidationError, match='no sites with that kind'):
+            structure.store()
+
+        structure.append_kind(Kind(symbols='O', name='O2'))
+        structure.set_site_arrays(np.zeros((4, 3)), [0, 1, 2, 3])
+        structure.store()
+
+        with pytest.raises(ModificationNotAllowed):
+            structure.set_site_arrays(np.zeros((4, 3)), [0, 1, 2, 3])
+
+
 class TestCellAngles:
     """Tests for ``StructureData.cell_angles`` with zero-length vectors."""
 
@@ -294,6 +294,31 @@ class TestTrajectory:
         structure = trajectory.get_step_structure(0)
         assert structure.pbc == (True, True, True)
 
+    def test_trajectory_append_steps(self, trajectory_data):
+        """Test that steps can be appended to a trajectory that is stored in chunks."""
+        trajectory = TrajectoryData()
+        trajectory.set_trajectory(
+            **{key: value[:50] if key not in ('symbols', 'pbc') else value for key, value in trajectory_data.items()},
+            chunk_size=16,
+        )
+        trajectory.append_steps(
+            trajectory_data['positions'][50:],
+            cells=trajectory_data['cells'][50:],
+            times=trajectory_data['times'][50:],
+            velocities=trajectory_data['velocities'][50:],
+        )
+        trajectory.store()
+
+        assert trajectory.numsteps == 200
+        assert np.array_equal(
+            trajectory.get_stepids(), np.concatenate([trajectory_data['stepids'][:50], range(1491, 1641)])
+        )
+        assert np.array_equal(trajectory.get_positions(), trajectory_data['positions'])
+        assert np.array_equal(trajectory.get_step_data(120)[4], trajectory_data['positions'][120])
+
+        with pytest.raises(ValueError, match='`cells` should be specified'):
+            trajectory.append_steps(trajectory_data['positions'][:1])
+
 
 def test_plot_positions_xyz(monkeypatch):
     """Test that `plot_positions_XYZ` runs."""
@@ -309,3 +334,28 @@ def test_plot_positions_xyz(monkeypatch):
 
     plot_positions_XYZ(times, positions, indices_to_show=[0, 1, 2], color_list=colors, label='test')
     plot_positions_XYZ(times, positions, indices_to_show=[0], color_list=colors, label='test', mintime=0.2, maxtime=0.8)
+
+
+def test_show_mpl_heatmap_bohr(monkeypatch):
+    """Test that `show_mpl_heatmap` converts the read-only positions of a stored trajectory in bohr."""
+    import sys
+    from unittest.mock import MagicMock
+
+    monkeypatch.setitem(sys.modules, 'mayavi', MagicMock())
+
+    positions = np.random.default_rng(0).random((20, 2, 3))
+    trajectory = TrajectoryData()
+    trajectory.set_trajectory(
+        symbols=['H', 'H'],
+        positions=positions,
+        cells=np.array([np.eye(3)] * 20),
+        times=np.arange(20, dtype=float),
+        pbc=[True, True, True],
+    )
+    trajectory.base.attributes.set('units|positions', 'bohr')
+    trajectory.store()
+
+    loaded = load_node(trajectory.pk)
+    assert not loaded.get_positions().flags.writeable
+    loaded.show_mpl_heatmap()
+    np.testing.assert_array_equal(loaded.get_positions(), positions)
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from aiida import orm
+from aiida.common import exceptions
 from aiida.engine import ExitCode, ProcessState, launch
 from aiida.orm import Int
 from aiida.orm.nodes.caching import NodeCaching
@@ -184,3 +185,33 @@ class TestProcessNodeDump:
 
             assert result_path.exists()
             assert (result_path / 'aiida_node_metadata.yaml').exists()
+
+
+def test_checkpoint_compressed():
+    """Test that a compressed checkpoint is stored in the repository and referenced by the attribute."""
+    node = WorkflowNode().store()
+    checkpoint = 'state: running\n' * 1000
+
+    node.set_checkpoint(checkpoint, compress=True)
+    assert node.checkpoint == checkpoint
+    assert node.base.attributes.get(ProcessNode.CHECKPOINT_KEY)['path'] == ProcessNode.CHECKPOINT_FILEPATH
+    assert node.base.repository.get_object_size(ProcessNode.CHECKPOINT_FILEPATH) < len(checkpoint)
+    assert orm.load_node(node.pk).checkpoint == checkpoint
+
+    node.set_checkpoint('updated', compress=True)
+    assert orm.load_node(node.pk).checkpoint == 'updated'
+
+    node.delete_checkpoint()
+    assert node.checkpoint is None
+    assert node.base.repository.list_object_names() == []
+    assert orm.load_node(node.pk).base.repository.list_object_names() == []
+
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        WorkflowNode().set_checkpoint(checkpoint, compress=True)
+
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        node.base.repository.put_object_from_bytes(b'content', 'file.txt')
+
+    node.seal()
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        node.set_checkpoint(checkpoint, compress=True)
@@ -272,6 +272,45 @@ class TestNodeAttributesExtras:
         with pytest.raises(exceptions.ModificationNotAllowed):
             self.node.base.attributes.clear()
 
+    def test_attributes_batch_update(self):
+        """Test the `Node.base.attributes.batch_update` context manager."""
+        from sqlalchemy import event
+
+        node = WorkflowNode().store()
+        engine = get_manager().get_profile_storage().get_session().bind
+        statements = []
+
+        def count_updates(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('UPDATE'):
+                statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', count_updates)
+
+        try:
+            with node.base.attributes.batch_update():
+                node.base.attributes.set('process_state', 'running')
+                node.base.attributes.set_many({'process_status': 'busy', 'exit_status': 0})
+                node.base.attributes.delete('exit_status')
+                assert node.base.attributes.all == {'process_state': 'running', 'process_status': 'busy'}
+                assert statements == []
+            assert len(statements) == 1
+
+            # The changes should also be written if an exception is raised within the context
+            with pytest.raises(RuntimeError):
+                with node.base.attributes.batch_update():
+                    node.base.attributes.set('exit_message', 'failed')
+                    raise RuntimeError
+            assert len(statements) == 2
+        finally:
+            event.remove(engine, 'before_cursor_execute', count_updates)
+
+        get_manager().get_profile_storage().get_session().expire_all()
+        assert load_node(node.pk).base.attributes.all == {
+            'process_state': 'running',
+            'process_status': 'busy',
+            'exit_message': 'failed',
+        }
+
     def test_attributes_items(self):
         """Test the `Node.base.attributes.items` generator."""
         attributes = {'attribute_one': 'value', 'attribute_two': 'value'}
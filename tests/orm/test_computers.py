@@ -61,6 +61,27 @@ class TestComputer:
         with pytest.raises(exceptions.NotExistent):
             Computer.collection.get(id=comp_pk)
 
+    def test_get_authinfo_cached(self, aiida_computer_local):
+        """Test that :meth:`aiida.orm.Computer.get_authinfo` is cached until an authinfo or computer is written."""
+        computer = aiida_computer_local(label=str(uuid.uuid4()))
+        user = User.collection.get_default()
+        authinfo = computer.get_authinfo(user)
+        assert computer.get_authinfo(user) is authinfo
+        assert Computer.collection.get(pk=computer.pk).get_authinfo(user) is authinfo
+
+        authinfo.enabled = False
+        assert computer.get_authinfo(user) is not authinfo
+        assert not computer.is_user_enabled(user)
+
+        authinfo = computer.get_authinfo(user)
+        computer.set_minimum_job_poll_interval(1)
+        assert computer.get_authinfo(user) is not authinfo
+        assert computer.get_minimum_job_poll_interval() == 1
+
+        AuthInfo.collection.delete(authinfo.pk)
+        with pytest.raises(exceptions.NotExistent):
+            computer.get_authinfo(user)
+
     def test_get_minimum_job_poll_interval(self):
         """Test the :meth:`aiida.orm.Computer.get_minimum_job_poll_interval` method."""
         computer = Computer()
@@ -0,0 +1,96 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.orm.entity_cache` module."""
+
+import pytest
+
+from aiida.orm.entities import EntityTypes
+from aiida.orm.entity_cache import EntityCache
+
+
+def test_get():
+    """Test that values are computed once and then returned from the cache."""
+    cache = EntityCache()
+    calls = []
+
+    def factory():
+        calls.append(None)
+        return len(calls)
+
+    assert cache.get('key', factory, (EntityTypes.COMPUTER,)) == 1
+    assert cache.get('key', factory, (EntityTypes.COMPUTER,)) == 1
+    assert cache.get('other', factory, (EntityTypes.COMPUTER,)) == 2
+    assert len(cache) == 2
+
+
+def test_get_exception():
+    """Test that nothing is cached if the factory raises."""
+    cache = EntityCache()
+
+    def factory():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        cache.get('key', factory, (EntityTypes.COMPUTER,))
+
+    assert len(cache) == 0
+
+
+def test_max_size():
+    """Test that the least recently used entries are discarded beyond the maximum size."""
+    cache = EntityCache(max_size=2)
+    cache.get('a', lambda: 'a', ())
+    cache.get('b', lambda: 'b', ())
+    cache.get('a', lambda: 'other', ())
+    cache.get('c', lambda: 'c', ())
+
+    assert len(cache) == 2
+    assert cache.get('a', lambda: 'other', ()) == 'a'
+    assert cache.get('b', lambda: 'other', ()) == 'other'
+
+
+def test_invalidate():
+    """Test that invalidating an entity type only discards the entries that depend on it."""
+    cache = EntityCache()
+    cache.get('computer', lambda: 'computer', (EntityTypes.COMPUTER,))
+    cache.get('authinfo', lambda: 'authinfo', (EntityTypes.AUTHINFO, EntityTypes.COMPUTER))
+    cache.get('user', lambda: 'user', (EntityTypes.USER,))
+
+    cache.invalidate(EntityTypes.COMPUTER)
+    assert len(cache) == 1
+    assert cache.get('user', lambda: 'other', ()) == 'user'
+    assert cache.get('computer', lambda: 'other', ()) == 'other'
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_invalidate_during_get():
+    """Test that a value is not cached if the cache is invalidated while it is computed, as it may be outdated."""
+    cache = EntityCache()
+
+    def factory():
+        cache.invalidate(EntityTypes.USER)
+        return 'value'
+
+    assert cache.get('key', factory, (EntityTypes.COMPUTER,)) == 'value'
+    assert len(cache) == 0
+
+
+def test_scope():
+    """Test that entries are only returned in the scope in which they were cached."""
+    scope = 'a'
+    cache = EntityCache(scope=lambda: scope)
+    cache.get('key', lambda: 'a', ())
+
+    scope = 'b'
+    assert cache.get('key', lambda: 'b', ()) == 'b'
+
+    scope = 'a'
+    assert cache.get('key', lambda: 'other', ()) == 'a'
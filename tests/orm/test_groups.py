@@ -201,6 +201,54 @@ class TestGroups:
         group.remove_nodes([])
         assert set(_.pk for _ in nodes) == set(_.pk for _ in group.nodes)
 
+    def test_add_remove_nodes_by_pk(self):
+        """Test adding and removing nodes by their pks."""
+        pks = [orm.Data().store().pk for _ in range(5)]
+        group = orm.Group(label=uuid.uuid4().hex).store()
+
+        group.add_nodes_by_pk(pks[0])
+        group.add_nodes_by_pk(pks[:3])
+        group.add_nodes_by_pk(pk for pk in pks[2:])
+        group.add_nodes_by_pk([])
+        assert set(pks) == set(_.pk for _ in group.nodes)
+        assert group.count() == len(pks)
+
+        group.remove_nodes_by_pk(pks[0])
+        group.remove_nodes_by_pk(pks[3:])
+        assert set(pks[1:3]) == set(_.pk for _ in group.nodes)
+
+        with pytest.raises(exceptions.NotExistent):
+            group.add_nodes_by_pk([pks[0], max(pks) + 1000])
+
+        assert set(pks[1:3]) == set(_.pk for _ in group.nodes)
+
+        with pytest.raises(TypeError):
+            group.add_nodes_by_pk(['a'])
+
+        with pytest.raises(exceptions.ModificationNotAllowed):
+            orm.Group(label=uuid.uuid4().hex).add_nodes_by_pk(pks)
+
+    def test_add_remove_nodes_by_query(self):
+        """Test adding and removing nodes by a ``QueryBuilder`` that projects their pks."""
+        description = uuid.uuid4().hex
+        pks = [orm.Data().store().pk for _ in range(5)]
+        for pk in pks[:3]:
+            orm.load_node(pk).description = description
+
+        group = orm.Group(label=uuid.uuid4().hex).store()
+        group.add_nodes_by_pk(pks[4])
+
+        query = orm.QueryBuilder().append(orm.Data, filters={'description': description}, project='id')
+        group.add_nodes_by_pk(query)
+        group.add_nodes_by_pk(query)
+        assert set(pks[:3] + pks[4:]) == set(_.pk for _ in group.nodes)
+
+        group.remove_nodes_by_pk(query)
+        assert {pks[4]} == set(_.pk for _ in group.nodes)
+
+        with pytest.raises(ValueError):
+            group.add_nodes_by_pk(orm.QueryBuilder().append(orm.Data, project=['id', 'uuid']))
+
     def test_clear(self):
         """Test the `clear` method to remove all nodes."""
         node_01 = orm.Data().store()
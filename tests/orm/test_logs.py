@@ -240,6 +240,48 @@ class TestBackendLog:
         assert logs[0].message == message
         assert logs[1].message == message2
 
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_buffered_db_log_handler(self):
+        """Test that the buffered db log handler writes the records in batches, and when flushed or closed."""
+        import time
+
+        from aiida.orm.utils.log import BufferedDBLogHandler, flush_database_log_handlers, get_dblogger_extra
+
+        node = orm.CalculationNode().store()
+        handler = BufferedDBLogHandler(capacity=3, flush_interval=60)
+        logger = logging.getLogger('test_buffered_db_log_handler')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        adapter = logging.LoggerAdapter(logger=logger, extra=get_dblogger_extra(node))
+
+        try:
+            adapter.info('message %d', 0)
+            adapter.info('message %d', 1)
+            assert len(Log.collection.get_logs_for(node)) == 0
+
+            flush_database_log_handlers()
+            assert len(Log.collection.get_logs_for(node)) == 2
+
+            # Reaching the capacity triggers the background thread to write the records
+            for index in range(2, 5):
+                adapter.info('message %d', index)
+
+            for _ in range(100):
+                if len(Log.collection.get_logs_for(node)) == 5:
+                    break
+                time.sleep(0.1)
+
+            assert len(Log.collection.get_logs_for(node)) == 5
+            adapter.info('message %d', 5)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        logs = Log.collection.get_logs_for(node, order_by=[{'id': 'asc'}])
+        assert [log.message for log in logs] == [f'message {index}' for index in range(6)]
+        assert logs[0].metadata['args'] == '(0,)'
+
     def test_log_querybuilder(self):
         """Test querying for logs by joining on nodes in the QueryBuilder"""
         from aiida.orm import QueryBuilder
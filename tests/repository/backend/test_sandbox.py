@@ -162,6 +162,23 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_hashes(repository, generate_directory):
+    """Test the ``Repository.get_object_hashes`` returns the expected values."""
+    repository.initialise()
+    directory = generate_directory({'file_a': b'content', 'file_b': b'content b'})
+    keys = []
+
+    for filename in ('file_a', 'file_b'):
+        with open(directory / filename, 'rb') as handle:
+            keys.append(repository.put_object_from_filelike(handle))
+
+    assert repository.get_object_hashes(keys[::-1]) == [repository.get_object_hash(key) for key in keys[::-1]]
+    assert repository.get_object_hashes([]) == []
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_hashes([*keys, 'non_existent'])
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
@@ -6,6 +6,7 @@ import pathlib
 
 import pytest
 
+from aiida.common.hashing import make_hash
 from aiida.repository import File, FileType, Repository
 from aiida.repository.backend import DiskObjectStoreRepositoryBackend, SandboxRepositoryBackend
 
@@ -648,9 +649,20 @@ def test_serialize_roundtrip(repository):
 
 def test_hash(repository, generate_directory):
     """Test the ``Repository.hash`` method."""
-    generate_directory({'empty': {}, 'file_a': b'content', 'relative': {'file_b': None, 'sub': {'file_c': None}}})
+    directory = generate_directory(
+        {'empty': {}, 'file_a': b'content', 'relative': {'file_b': None, 'sub': {'file_c': None}}}
+    )
     assert isinstance(repository.hash(), str)
 
+    repository.put_object_from_tree(str(directory))
+    objects = {}
+    for root, dirnames, filenames in repository.walk():
+        objects['__dirnames__'] = dirnames
+        for filename in filenames:
+            objects[str(root / filename)] = repository.backend.get_object_hash(repository.get_file(root / filename).key)
+
+    assert repository.hash() == make_hash(objects)
+
 
 def test_flatten(repository, generate_directory):
     """Test the ``Repository.flatten`` classmethod."""
@@ -55,6 +55,61 @@ def test_parse_joblist_output_incorrect(scheduler):
         scheduler._parse_joblist_output(retval=0, stdout='aaa', stderr='')
 
 
+@pytest.mark.asyncio
+async def test_get_jobs_async(scheduler):
+    """Test that ``get_jobs_async`` queries the transport asynchronously and lists missing jobs as ``DONE``."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from aiida.schedulers import JobState
+
+    transport = MagicMock()
+    transport.exec_command_wait_async = AsyncMock(return_value=(0, '87619 R+   aiida    00:00:00', ''))
+    scheduler.set_transport(transport)
+
+    jobs = await scheduler.get_jobs_async(jobs=['87619', '87620'], as_dict=True)
+
+    transport.exec_command_wait_async.assert_awaited_once()
+    transport.exec_command_wait.assert_not_called()
+    assert jobs['87619'].job_state == JobState.RUNNING
+    assert jobs['87620'].job_state == JobState.DONE
+
+
+@pytest.mark.asyncio
+async def test_submit_jobs_async(scheduler, tmp_path):
+    """Test that ``submit_jobs_async`` submits multiple jobs with a single command and parses the output per job."""
+    from unittest.mock import patch
+
+    from aiida.transports.plugins.local import LocalTransport
+
+    for dirname in ('a', 'b'):
+        (tmp_path / dirname).mkdir()
+        (tmp_path / dirname / 'submit.sh').write_text('true')
+
+    jobs = [
+        (str(tmp_path / 'a'), 'submit.sh'),
+        (str(tmp_path / 'missing'), 'submit.sh'),
+        (str(tmp_path / 'b'), 'submit.sh'),
+    ]
+
+    with LocalTransport() as transport:
+        scheduler.set_transport(transport)
+        with patch.object(transport, 'exec_command_wait_async', wraps=transport.exec_command_wait_async) as wrapped:
+            results = await scheduler.submit_jobs_async(jobs)
+
+    wrapped.assert_called_once()
+    assert results[0].isdigit()
+    assert isinstance(results[1], SchedulerError)
+    assert results[2].isdigit()
+
+
+def test_split_batch_submit_output(scheduler):
+    """Test that incomplete output of a batched submission is reported per job."""
+    stdout = '__AIIDA_SUBMIT__ 0 begin\n123__AIIDA_SUBMIT__ 0 end 0\n__AIIDA_SUBMIT__ 1 begin\n'
+    stderr = '__AIIDA_SUBMIT__ 0 begin\nwarning\n__AIIDA_SUBMIT__ 1 begin\n'
+
+    assert scheduler._split_batch_submit_output(2, stdout, stderr) == [(0, '123', 'warning\n'), None]
+
+
 def test_submit_script_rerunnable(scheduler, template, caplog):
     """Test that setting the ``rerunnable`` option gives a warning."""
     template.rerunnable = True
@@ -523,3 +523,22 @@ def test_parse_submit_output_invalid_account():
     stderr = 'Batch job submission failed: Invalid account or account/partition combination specified'
     result = scheduler._parse_submit_output(1, '', stderr)
     assert result == CalcJob.exit_codes.ERROR_SCHEDULER_INVALID_ACCOUNT
+
+
+@pytest.mark.asyncio
+async def test_submit_and_kill_job_async():
+    """Test that ``submit_job_async`` and ``kill_job_async`` parse the output of the asynchronous transport call."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    scheduler = SlurmScheduler()
+    transport = MagicMock()
+    transport.exec_command_wait_async = AsyncMock(return_value=(0, 'Submitted batch job 1234\n', ''))
+    scheduler.set_transport(transport)
+
+    assert await scheduler.submit_job_async('/workdir', 'submit.sh') == '1234'
+    assert transport.exec_command_wait_async.call_args.kwargs['workdir'] == '/workdir'
+
+    transport.exec_command_wait_async.return_value = (0, '', '')
+    assert await scheduler.kill_job_async('1234') is True
+    assert transport.exec_command_wait_async.call_args.args[0] == 'scancel 1234'
+    transport.exec_command_wait.assert_not_called()
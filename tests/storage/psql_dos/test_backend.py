@@ -175,6 +175,27 @@ def test_unload_profile():
         manager.load_profile(profile_name)
 
 
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_node_hash_index():
+    """Test that looking up nodes by their hash, e.g. to find a node to cache from, uses the index on the hash."""
+    from sqlalchemy import text
+
+    from aiida.orm import Int, QueryBuilder
+
+    node = Int(1).store()
+    Int(2).store()
+    builder = QueryBuilder().append(Int, filters={'extras._aiida_hash': node.base.caching.get_hash()})
+    assert builder.one()[0].pk == node.pk
+
+    # The planner prefers a sequential scan for a table this small, so disable it to check that the index can be used
+    session = get_manager().get_profile_storage().get_session()
+    with session.begin_nested():
+        session.execute(text('SET LOCAL enable_seqscan = off'))
+        query_plan = session.execute(text(f'EXPLAIN {builder.as_sql(inline=True)}')).fetchall()
+
+    assert any('ix_db_dbnode_extras_aiida_hash' in row[0] for row in query_plan)
+
+
 def test_backup(tmp_path):
     """Test that the backup function creates all the necessary files and folders"""
     storage_backend = get_manager().get_profile_storage()
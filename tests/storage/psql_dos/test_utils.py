@@ -0,0 +1,75 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for :mod:`aiida.storage.psql_dos.utils`."""
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from aiida.storage.psql_dos.utils import create_sqlalchemy_engine, get_engine_kwargs
+
+CONFIG = {
+    'database_hostname': 'localhost',
+    'database_port': 5432,
+    'database_username': 'username',
+    'database_password': 'password',
+    'database_name': 'database',
+}
+
+
+def test_get_engine_kwargs_defaults():
+    """Test that the defaults of SQLAlchemy and ``psycopg`` are used if the configuration does not define options."""
+    assert get_engine_kwargs(CONFIG) == {'pool_size': 5, 'max_overflow': 10, 'pool_pre_ping': False, 'connect_args': {}}
+
+
+def test_get_engine_kwargs():
+    """Test that the options of the configuration are converted, with the ``engine_kwargs`` taking precedence."""
+    config = {
+        **CONFIG,
+        'database_pool_size': 2,
+        'database_max_overflow': 0,
+        'database_pool_pre_ping': True,
+        'database_keepalives_idle': 60,
+        'database_statement_timeout': 1000,
+        'database_prepared_statements': False,
+        'engine_kwargs': {'max_overflow': 1, 'connect_args': {'keepalives_idle': 30}},
+    }
+    assert get_engine_kwargs(config) == {
+        'pool_size': 2,
+        'max_overflow': 1,
+        'pool_pre_ping': True,
+        'connect_args': {
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'options': '-c statement_timeout=1000',
+            'prepare_threshold': None,
+        },
+    }
+
+
+def test_get_engine_kwargs_poolclass():
+    """Test that the pool size and overflow are only passed to pools that accept them."""
+    config = {**CONFIG, 'database_pool_size': 2, 'engine_kwargs': {'poolclass': NullPool}}
+    assert get_engine_kwargs(config) == {'pool_pre_ping': False, 'poolclass': NullPool, 'connect_args': {}}
+
+    config = {**CONFIG, 'database_pool_size': 2, 'engine_kwargs': {'poolclass': AsyncAdaptedQueuePool}}
+    assert get_engine_kwargs(config)['pool_size'] == 2
+
+
+def test_create_sqlalchemy_engine():
+    """Test that the pool of the engine is configured by the configuration, without connecting to the database."""
+    engine = create_sqlalchemy_engine({**CONFIG, 'database_pool_size': 2, 'database_pool_pre_ping': True})
+    assert engine.pool.size() == 2
+    assert engine.pool._pre_ping
+    engine.dispose()
+
+
+def test_create_sqlalchemy_engine_null_pool():
+    """Test that an engine without a connection pool can be created, which does not accept the pool size."""
+    engine = create_sqlalchemy_engine({**CONFIG, 'engine_kwargs': {'poolclass': NullPool}})
+    assert isinstance(engine.pool, NullPool)
+    engine.dispose()
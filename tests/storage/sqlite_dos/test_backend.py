@@ -62,3 +62,31 @@ def test_version_profile(aiida_config, aiida_profile_factory):
     with aiida_profile_factory(aiida_config, storage_backend='core.sqlite_dos') as profile:
         version = SqliteDosStorage.version_profile(profile)
         assert version == SqliteDosStorage.version_head()
+
+
+def test_node_hash_index(aiida_config, aiida_profile_factory, manager):
+    """Test that looking up nodes by their hash, e.g. to find a node to cache from, uses the index on the hash."""
+    from sqlalchemy import text
+
+    from aiida.orm import Int, QueryBuilder
+
+    with aiida_profile_factory(aiida_config, storage_backend='core.sqlite_dos'):
+        node = Int(1).store()
+        Int(2).store()
+        builder = QueryBuilder().append(Int, filters={'extras._aiida_hash': node.base.caching.get_hash()})
+        assert builder.one()[0].pk == node.pk
+
+        session = manager.get_profile_storage().get_session()
+        query_plan = session.execute(text(f'EXPLAIN QUERY PLAN {builder.as_sql(inline=True)}')).fetchall()
+        assert any('ix_db_dbnode_extras_aiida_hash' in row[-1] for row in query_plan)
+
+
+def test_pragmas(aiida_config, aiida_profile_factory, manager):
+    """Test that the database is used in WAL mode with the pragmas defined by ``SQLITE_PRAGMAS``."""
+    from sqlalchemy import text
+
+    with aiida_profile_factory(aiida_config, storage_backend='core.sqlite_dos'):
+        session = manager.get_profile_storage().get_session()
+        assert session.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert session.execute(text('PRAGMA synchronous')).scalar() == 1
+        assert session.execute(text('PRAGMA busy_timeout')).scalar() == 30_000
@@ -0,0 +1,77 @@
+"""Tests for :mod:`aiida.storage.sqlite_dos.utils`."""
+
+import pytest
+from sqlalchemy import text
+
+from aiida.storage.sqlite_dos.utils import WriteLock, backup_database, create_sqla_engine, fcntl
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason='Requires `fcntl` for file locking.')
+
+
+def test_write_lock(tmp_path):
+    """Test that the :class:`aiida.storage.sqlite_dos.utils.WriteLock` is exclusive between instances."""
+    lock = WriteLock(tmp_path / 'lock', timeout=0.01)
+    other = WriteLock(tmp_path / 'lock', timeout=0.01)
+
+    assert lock.acquire()
+    assert lock.is_locked
+    assert lock.acquire()
+    assert not other.acquire()
+
+    lock.release()
+    assert not lock.is_locked
+    assert other.acquire()
+
+    other.close()
+    lock.close()
+
+
+@pytest.mark.parametrize('end', ('commit', 'rollback'))
+def test_serialize_writes(tmp_path, end):
+    """Test that a connection holds the write lock from its first write until the end of the transaction."""
+    filepath = tmp_path / 'database.sqlite'
+    engine = create_sqla_engine(filepath, serialize_writes=True)
+    other = WriteLock(f'{filepath}.lock', timeout=0.01)
+
+    with engine.connect() as connection:
+        connection.execute(text('CREATE TABLE entry (value INTEGER)'))
+        connection.commit()
+
+        connection.execute(text('SELECT * FROM entry')).fetchall()
+        assert other.acquire()
+        other.release()
+
+        connection.execute(text('INSERT INTO entry VALUES (1)'))
+        assert not other.acquire()
+
+        getattr(connection, end)()
+        assert other.acquire()
+        other.release()
+
+    other.close()
+    engine.dispose()
+
+
+def test_backup_database(tmp_path):
+    """Test that :func:`aiida.storage.sqlite_dos.utils.backup_database` copies the committed state of the database."""
+    import contextlib
+    import sqlite3
+
+    filepath = tmp_path / 'database.sqlite'
+    engine = create_sqla_engine(filepath)
+
+    with engine.connect() as connection, engine.connect() as writer:
+        connection.execute(text('CREATE TABLE entry (value INTEGER)'))
+        connection.execute(text('INSERT INTO entry VALUES (1)'))
+        connection.commit()
+
+        # The committed transactions are in the WAL and another connection is in the middle of writing
+        writer.execute(text('INSERT INTO entry VALUES (2)'))
+        backup_database(filepath, tmp_path / 'backup.sqlite')
+        writer.rollback()
+
+    engine.dispose()
+
+    with contextlib.closing(sqlite3.connect(tmp_path / 'backup.sqlite')) as backup:
+        assert backup.execute('PRAGMA integrity_check').fetchone() == ('ok',)
+        assert backup.execute('SELECT value FROM entry').fetchall() == [(1,)]